@@ -1,13 +1,73 @@
 """
 Generic base classes and functions for file operations.
 """
+import os
 from abc import ABCMeta, abstractmethod
+from collections.abc import Collection
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from musify.file.exception import InvalidFileType, FileDoesNotExistError
 
+#: Folder names which are never walked when searching for files e.g. the recycle bin in Windows-based folders
+IGNORE_FOLDERS = frozenset({"$RECYCLE.BIN"})
+
+
+def get_filepaths_by_extension(folder: str | Path, extensions: Collection[str]) -> dict[str, set[Path]]:
+    """
+    Get all files in a given folder recursively that match any of the given ``extensions``
+    in a single pass of the folder tree.
+
+    Extensions are matched case-insensitively.
+    Hidden files and any files within the folders given in ``IGNORE_FOLDERS`` are skipped.
+    Symlinks to folders are not followed.
+
+    :param folder: The folder to search.
+    :param extensions: The file extensions to search for.
+    :return: Map of each of the given ``extensions`` to the set of paths found with that extension.
+    """
+    paths: dict[str, set[Path]] = {ext: set() for ext in extensions}
+    extensions_map = {ext.lower(): ext for ext in extensions}
+    folder = Path(folder)
+    if IGNORE_FOLDERS.intersection(folder.parts):
+        return paths
+
+    folders = [folder]
+    while folders:
+        current = folders.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in IGNORE_FOLDERS:
+                            folders.append(current.joinpath(entry.name))
+                        continue
+                    if entry.name.startswith("."):
+                        continue
+
+                    ext = extensions_map.get(os.path.splitext(entry.name)[1].lower())
+                    if ext is not None and entry.is_file():
+                        paths[ext].add(current.joinpath(entry.name))
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+
+    return paths
+
+
+def get_file_stat(path: str | Path) -> tuple[int, int] | None:
+    """
+    Get the size in bytes and the modified time in nanoseconds of the file at the given ``path``.
+    Used to cheaply check whether a file has changed since it was last read.
+
+    :return: The size and modified time of the file, or None if the file cannot be found.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return
+    return stat.st_size, stat.st_mtime_ns
+
 
 class File(metaclass=ABCMeta):
     """Generic class for representing a file on a system."""
@@ -56,7 +116,7 @@ class File(metaclass=ABCMeta):
     @classmethod
     def _validate_type(cls, path: Path) -> None:
         """Raises an exception if the ``path`` extension is not accepted"""
-        if path.suffix not in cls.valid_extensions:
+        if path.suffix.lower() not in cls.valid_extensions:
             raise InvalidFileType(
                 path.suffix,
                 f"Not an accepted {cls.__name__} file extension. "
@@ -72,15 +132,8 @@ class File(metaclass=ABCMeta):
     @classmethod
     def get_filepaths(cls, folder: str | Path) -> set[Path]:
         """Get all files in a given folder that match this File object's valid filetypes recursively."""
-        paths: set[Path] = set()
-        folder = Path(folder)
-
-        for ext in cls.valid_extensions:
-            paths |= set(folder.rglob(str(Path("**", f"[!.]*{ext}"))))
-            # paths |= set(folder.rglob(str(Path("**", f".*{ext}"))))
-
-        # do not return paths in the recycle bin in Windows-based folders
-        return {path for path in paths if "$RECYCLE.BIN" not in path.parts}
+        paths = get_filepaths_by_extension(folder, extensions=cls.valid_extensions)
+        return {path for ext_paths in paths.values() for path in ext_paths}
 
     @abstractmethod
     async def load(self, *args, **kwargs) -> Any:
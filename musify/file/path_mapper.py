@@ -9,6 +9,7 @@ from typing import Any
 
 from musify.file.base import File
 from musify.printer import PrettyPrinter
+from musify.utils import casefold
 
 type PathInputType = str | Path | File | None
 
@@ -142,8 +143,9 @@ class PathStemMapper(PathMapper):
         path = str(value.path if isinstance(value, File) else value)
 
         seps = ()
+        path_folded = casefold(path)
         for stem, replacement in self.stem_map.items():
-            if path.casefold().startswith(stem.casefold()):
+            if path_folded.startswith(casefold(stem)):
                 if "/" in replacement and "/" not in path:
                     seps = ("\\", "/")
                 elif "\\" in replacement and "\\" not in path:
@@ -156,7 +158,7 @@ class PathStemMapper(PathMapper):
         if seps:
             path = path.replace(*seps)
 
-        path = self.available_paths.get(path.casefold(), path)
+        path = self.available_paths.get(casefold(path), path)
         if not check_existence or os.path.exists(path):
             return path
 
@@ -177,8 +179,9 @@ class PathStemMapper(PathMapper):
         path = str(value.path if isinstance(value, File) else value)
 
         seps = ()
+        path_folded = casefold(path)
         for stem, replacement in self.stem_unmap.items():
-            if path.casefold().startswith(stem.casefold()):
+            if path_folded.startswith(casefold(stem)):
                 if "/" in replacement and "/" not in path:
                     seps = ("\\", "/")
                 elif "\\" in replacement and "\\" not in path:
@@ -191,7 +194,7 @@ class PathStemMapper(PathMapper):
         if seps:
             path = path.replace(*seps)
 
-        path = self.available_paths.get(path.casefold(), path)
+        path = self.available_paths.get(casefold(path), path)
         if not check_existence or os.path.exists(path):
             return path
 
@@ -3,8 +3,9 @@ The fundamental core collection classes for the entire package.
 """
 from __future__ import annotations
 
+import weakref
 from abc import ABCMeta, abstractmethod
-from collections.abc import MutableSequence, Iterable, Mapping, Collection
+from collections.abc import MutableSequence, Iterable, Mapping, Collection, Hashable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, SupportsIndex, Self
@@ -41,8 +42,13 @@ class ItemGetterStrategy[KT](metaclass=ABCMeta):
 
     def get_item[IT](self, collection: MusifyCollection[IT]) -> IT:
         """Run this strategy and return the matched item from the given ``collection``"""
+        # noinspection PyProtectedMember
+        return collection._get_item_index().get_item(self)
+
+    def scan[IT](self, items: Iterable[IT]) -> IT:
+        """Run this strategy by checking each of the given ``items`` in turn and return the first matched item"""
         try:
-            return next(item for item in collection.items if self.get_value_from_item(item) == self.key)
+            return next(item for item in items if self.get_value_from_item(item) == self.key)
         except AttributeError:
             raise MusifyAttributeError(f"Items in collection do not have the attribute {self.name!r}")
         except StopIteration:
@@ -109,10 +115,233 @@ class RemoteURLEXTGetter(ItemGetterStrategy):
         return item.url_ext
 
 
+class ItemMembership[T: MusifyItem]:
+    """
+    Hash-backed membership checks for a group of items which respect the equality of each item type.
+
+    Items are indexed on each of the values which may make them equal to another item
+    i.e. their identity, path, URI, and, for tracks, their title and album.
+    Membership is then checked by comparing only against those items which share one of these values.
+    Objects which are not items, including collections, are compared against every item.
+
+    :param items: The items to add.
+    """
+
+    __slots__ = ("_items", "_positions", "_candidates", "_unindexed")
+
+    def __init__(self, items: Iterable[T] = ()):
+        self._items: list[T] = []
+        # map of the ID of each item to the position at which it was first added
+        self._positions: dict[int, int] = {}
+        # map of each indexed value to the items which have this value
+        self._candidates: dict[Hashable, list[T]] = {}
+        # items which could not be indexed and so must always be compared against
+        self._unindexed: list[T] = []
+
+        for item in items:
+            self.add(item)
+
+    @staticmethod
+    def _get_keys(item: Any) -> list[Hashable] | None:
+        """
+        Get the values on which the given ``item`` is indexed.
+
+        :return: The values to index on, or None if the item cannot be indexed.
+        """
+        if not isinstance(item, MusifyItem) or isinstance(item, MusifyCollection):
+            return
+
+        keys: list[Hashable] = [("id", id(item))]
+        if (path := getattr(item, "path", None)) is not None:
+            keys.append(("path", path))
+        if (uri := getattr(item, "uri", None)) is not None:
+            keys.append(("uri", uri))
+        if hasattr(item, "title") and hasattr(item, "album"):
+            keys.append(("track", item.title, item.album))
+
+        try:
+            for key in keys:
+                hash(key)
+        except TypeError:
+            return
+
+        return keys
+
+    def add(self, item: T) -> None:
+        """Add the given ``item``"""
+        self._positions.setdefault(id(item), len(self._items))
+        self._items.append(item)
+
+        keys = self._get_keys(item)
+        if keys is None:
+            self._unindexed.append(item)
+            return
+
+        for key in keys:
+            self._candidates.setdefault(key, []).append(item)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, __item: Any) -> bool:
+        keys = self._get_keys(__item)
+        if keys is None:
+            return any(__item == item for item in self._items)
+
+        candidates = (item for key in keys for item in self._candidates.get(key, ()))
+        return any(__item == item for item in candidates) or any(__item == item for item in self._unindexed)
+
+    def get[U](self, __item: Any, default: U = None) -> T | U:
+        """Return the first added item which is equal to the given ``__item``, or ``default`` if none are equal"""
+        keys = self._get_keys(__item)
+        if keys is None:
+            candidates = self._items
+        else:
+            candidates = {id(item): item for key in keys for item in self._candidates.get(key, ())}
+            candidates = sorted(
+                [*candidates.values(), *self._unindexed], key=lambda item: self._positions[id(item)]
+            )
+
+        return next((item for item in candidates if item == __item), default)
+
+
+class ItemIndex[T: MusifyItem]:
+    """
+    Hash indexes of the values returned by each :py:class:`ItemGetterStrategy` for a list of items,
+    mapping each value to the position of the first item in the list to return it.
+
+    Each index is built lazily in a single pass over the items the first time a strategy of its type is run.
+    Matched items are checked against the key before being returned, and the index for that strategy is rebuilt
+    when the item at the stored position no longer matches or when no item matches,
+    so that changes to the values of items since indexing are picked up.
+
+    :param items: The list of items to index.
+    """
+
+    __slots__ = ("items", "size", "_getters", "_positions", "_incomplete")
+
+    def __init__(self, items: list[T]):
+        #: The list of items indexed.
+        self.items = items
+        #: The number of items in the list when it was last indexed.
+        self.size = len(items)
+
+        # map of getter name to the getter used to build its index
+        self._getters: dict[str, ItemGetterStrategy] = {}
+        # map of getter name to the map of values to the position of the first matching item
+        self._positions: dict[str, dict[Any, int]] = {}
+        # names of getters for which some items do not have the required attribute
+        self._incomplete: set[str] = set()
+
+    def is_valid(self, items: list[T]) -> bool:
+        """Check whether this index may still be used for the given ``items``"""
+        return self.items is items and self.size == len(items)
+
+    def _build(self, getter: ItemGetterStrategy, start: int = 0) -> dict[Any, int] | None:
+        """
+        Add the positions of the items in this index from the ``start`` position onwards to the index for ``getter``.
+
+        :return: The index for ``getter`` or None if the values of the items could not be hashed.
+        """
+        self._getters.setdefault(getter.name, getter)
+        positions = self._positions.setdefault(getter.name, {})
+        if getter.name in self._incomplete:
+            return positions
+
+        try:
+            for i in range(start, len(self.items)):
+                positions.setdefault(getter.get_value_from_item(self.items[i]), i)
+        except AttributeError:
+            self._incomplete.add(getter.name)
+        except TypeError:  # unhashable values, this getter cannot be indexed
+            self._positions.pop(getter.name)
+            return
+
+        return positions
+
+    def update(self) -> None:
+        """Update this index with items added to the end of the list since it was last indexed."""
+        if len(self.items) < self.size:
+            self.clear()
+            return
+
+        start = self.size
+        self.size = len(self.items)
+        for getter_name in list(self._positions):
+            self._build(self._getters[getter_name], start=start)
+
+    def clear(self) -> None:
+        """Clear all indexes, causing them to be rebuilt for the current items in the list on next use."""
+        self.size = len(self.items)
+        self._getters.clear()
+        self._positions.clear()
+        self._incomplete.clear()
+
+    def _get_indexed_item(self, getter: ItemGetterStrategy, positions: dict[Any, int]) -> T | None:
+        """
+        Get the item at the position stored in the given ``positions`` for the key of the given ``getter``.
+
+        :return: The item if it still matches the key, or None if no position is stored or the item does not match.
+        :raise TypeError: If the key cannot be hashed.
+        """
+        position = positions.get(getter.key)
+        if position is None:
+            return
+
+        item = self.items[position]
+        try:
+            if getter.get_value_from_item(item) == getter.key:
+                return item
+        except AttributeError:
+            pass
+
+    def get_item(self, getter: ItemGetterStrategy) -> T:
+        """Run the given ``getter`` against this index and return the matched item"""
+        positions = self._positions.get(getter.name)
+        rebuilt = positions is None
+        if rebuilt:
+            positions = self._build(getter)
+        if positions is None:
+            return getter.scan(self.items)
+
+        try:
+            item = self._get_indexed_item(getter, positions)
+        except TypeError:  # unhashable key
+            return getter.scan(self.items)
+        if item is not None:
+            return item
+
+        if not rebuilt:
+            # item values may have changed since indexing, rebuild once and try again
+            self._positions.pop(getter.name)
+            self._incomplete.discard(getter.name)
+            return self.get_item(getter)
+
+        if getter.name in self._incomplete:
+            raise MusifyAttributeError(f"Items in collection do not have the attribute {getter.name!r}")
+        raise MusifyKeyError(f"No matching item found for {getter.name}: {getter.key}")
+
+
+#: Map of the ID of each :py:class:`MusifyCollection` to its :py:class:`ItemIndex`.
+#: Stored separately from the collection as :py:class:`MusifyCollection` is used in multiple inheritance
+#: with other slotted classes and so cannot define its own slots.
+_ITEM_INDEXES: dict[int, ItemIndex] = {}
+
+
 class MusifyCollection[T: MusifyItem](MusifyObject, MutableSequence[T], HasLength):
-    """Generic class for storing a collection of musify items."""
+    """
+    Generic class for storing a collection of musify items.
+
+    Items may be retrieved by index, or by their path, URI, remote ID, URL, or name.
+    Retrieving items by key uses hash indexes which are built lazily on the first lookup and kept up to date
+    on any changes made through the methods of this collection.
+    The index is rebuilt when a lookup finds no match, so changes to the values of items are picked up.
+    """
 
-    __slots__ = ()
+    __slots__ = ("__weakref__",)
 
     @property
     @abstractmethod
@@ -139,6 +368,43 @@ class MusifyCollection[T: MusifyItem](MusifyObject, MutableSequence[T], HasLengt
         """
         raise NotImplementedError
 
+    def _get_item_index(self) -> ItemIndex[T]:
+        """Get the index of this collection's items, creating a new index if the items have changed"""
+        index = _ITEM_INDEXES.get(id(self))
+        if index is not None and index.is_valid(self.items):
+            return index
+
+        if index is None:
+            weakref.finalize(self, _ITEM_INDEXES.pop, id(self), None)
+        index = _ITEM_INDEXES[id(self)] = ItemIndex(self.items)
+        return index
+
+    def _update_item_index(self) -> None:
+        """Update the index of this collection's items with any items appended since it was last updated"""
+        index = _ITEM_INDEXES.get(id(self))
+        if index is not None and index.items is self.items:
+            index.update()
+
+    @staticmethod
+    def _get_item_membership(items: Iterable[T]) -> ItemMembership[T]:
+        """
+        Get an :py:class:`ItemMembership` for the given ``items``.
+
+        Items are indexed on their values at the time of calling and so the membership
+        should only be used for a single operation during which these values do not change.
+        """
+        if isinstance(items, ItemMembership):
+            return items
+        if isinstance(items, MusifyCollection):
+            items = items.items
+        return ItemMembership(items)
+
+    def clear_index(self) -> None:
+        """Clear the index used to retrieve items from this collection by key, rebuilding it on the next lookup"""
+        index = _ITEM_INDEXES.get(id(self))
+        if index is not None:
+            index.clear()
+
     def count(self, __item: T) -> int:
         """Return the number of occurrences of the given :py:class:`MusifyItem` in this collection"""
         if not self._validate_item_type(__item):
@@ -164,8 +430,9 @@ class MusifyCollection[T: MusifyItem](MusifyObject, MutableSequence[T], HasLengt
         """Append one item to the items in this collection"""
         if not self._validate_item_type(__item):
             raise MusifyTypeError(type(__item).__name__)
-        if allow_duplicates or __item not in self.items:
+        if allow_duplicates or __item not in self:
             self.items.append(__item)
+            self._update_item_index()
 
     def extend(self, __items: Collection[T], allow_duplicates: bool = True) -> None:
         """Append many items to the items in this collection"""
@@ -176,33 +443,46 @@ class MusifyCollection[T: MusifyItem](MusifyObject, MutableSequence[T], HasLengt
 
         if allow_duplicates:
             self.items.extend(__items)
-        else:
-            self.items.extend(item for item in __items if item not in self.items)
+            self._update_item_index()
+            return
+
+        members = self._get_item_membership(self.items)
+        for item in __items:
+            if item not in members:
+                self.items.append(item)
+                members.add(item)
+        self._update_item_index()
 
     def insert(self, __index: int, __item: T, allow_duplicates: bool = True) -> None:
         """Insert given :py:class:`MusifyItem` before the given index"""
         if not self._validate_item_type(__item):
             raise MusifyTypeError(type(__item))
-        if allow_duplicates or __item not in self.items:
+        if allow_duplicates or __item not in self:
             self.items.insert(__index, __item)
+            self.clear_index()
 
     def remove(self, __item: T) -> None:
         """Remove one item from the items in this collection"""
         if not self._validate_item_type(__item):
             raise MusifyTypeError(type(__item))
         self.items.remove(__item)
+        self.clear_index()
 
     def pop(self, __item: SupportsIndex = None) -> T:
         """Remove one item from the items in this collection and return it"""
-        return self.items.pop(__item) if __item else self.items.pop()
+        item = self.items.pop(__item) if __item else self.items.pop()
+        self.clear_index()
+        return item
 
     def reverse(self) -> None:
         """Reverse the order of items in this collection in-place"""
         self.items.reverse()
+        self.clear_index()
 
     def clear(self) -> None:
         """Remove all items from this collection"""
         self.items.clear()
+        self.clear_index()
 
     def sort(
             self,
@@ -235,6 +515,7 @@ class MusifyCollection[T: MusifyItem](MusifyObject, MutableSequence[T], HasLengt
 
         if reverse:
             self.items.reverse()
+        self.clear_index()
 
     def intersection(self, other: Iterable[T]) -> list[T]:
         """
@@ -242,6 +523,7 @@ class MusifyCollection[T: MusifyItem](MusifyObject, MutableSequence[T], HasLengt
 
         (i.e. all items that are in both this collection and the ``other`` collection).
         """
+        other = self._get_item_membership(other)
         return [item for item in self if item in other]
 
     def difference(self, other: Iterable[T]) -> list[T]:
@@ -250,6 +532,7 @@ class MusifyCollection[T: MusifyItem](MusifyObject, MutableSequence[T], HasLengt
 
         (i.e. all items that are in this collection but not the ``other`` collection).
         """
+        other = self._get_item_membership(other)
         return [item for item in self if item not in other]
 
     def outer_difference(self, other: Iterable[T]) -> list[T]:
@@ -258,7 +541,8 @@ class MusifyCollection[T: MusifyItem](MusifyObject, MutableSequence[T], HasLengt
 
         (i.e. all items that are in the ``other`` collection but not in this collection).
         """
-        return [item for item in other if item not in self]
+        members = self._get_item_membership(self.items)
+        return [item for item in other if item not in members]
 
     @staticmethod
     def _condense_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
@@ -407,6 +691,7 @@ class MusifyCollection[T: MusifyItem](MusifyObject, MutableSequence[T], HasLengt
             raise MusifyTypeError("Trying to set on mismatched item types")
 
         self.items[self.index(item)] = __value
+        self.clear_index()
 
     def __delitem__(self, __key: str | int | T):
         self.remove(__key)
@@ -281,8 +281,9 @@ class Playlist[T: Track](MusifyCollection[T], metaclass=ABCMeta):
             self.extend(self.outer_difference(other), allow_duplicates=False)
             return
 
+        other_members = self._get_item_membership(other)
         for item in reference:
-            if item not in other and item in self:
+            if item not in other_members and item in self:
                 self.remove(item)
 
         self.extend(reference.outer_difference(other), allow_duplicates=False)
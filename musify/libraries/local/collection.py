@@ -8,15 +8,20 @@ import logging
 import sys
 from abc import ABCMeta, abstractmethod
 from collections.abc import Mapping, Collection, Iterable, Container
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any, Self
 
 from aiorequestful.types import UnitCollection, UnitIterable
 
+from musify.base import Result
+from musify.exception import MusifyTypeError
 from musify.field import Fields, TagField, TagFields
 from musify.file.exception import UnexpectedPathError
-from musify.libraries.core.collection import MusifyCollection
+from musify.libraries.core.collection import MusifyCollection, ItemMembership
 from musify.libraries.core.object import Track, Library, Folder, Album, Artist, Genre
 from musify.libraries.local.base import LocalItem
 from musify.libraries.local.exception import LocalCollectionError
@@ -29,6 +34,15 @@ from musify.utils import get_most_common_values, to_collection, align_string, ge
 _max_str = "z" * 50
 
 
+@dataclass(frozen=True)
+class MergeTracksResult(Result):
+    """Stores the results of merging tracks into a local collection"""
+    #: The number of given tracks which were merged onto a matching track in the collection.
+    merged: int
+    #: The number of given tracks for which no matching track was found in the collection.
+    not_found: int
+
+
 class LocalCollection[T: LocalTrack](MusifyCollection[T], metaclass=ABCMeta):
     """
     Generic class for storing a collection of local tracks.
@@ -99,7 +113,10 @@ class LocalCollection[T: LocalTrack](MusifyCollection[T], metaclass=ABCMeta):
             self,
             tags: UnitIterable[LocalTrackField] = LocalTrackField.ALL,
             replace: bool = False,
-            dry_run: bool = True
+            dry_run: bool = True,
+            verify: bool = False,
+            executor: Executor | None = None,
+            max_in_flight: int | None = None,
     ) -> dict[T, SyncResultTrack]:
         """
         Saves the tags of all tracks in this collection. Use arguments from :py:func:`LocalTrack.save`
@@ -107,17 +124,57 @@ class LocalCollection[T: LocalTrack](MusifyCollection[T], metaclass=ABCMeta):
         :param tags: Tags to be updated.
         :param replace: Destructively replace tags in each file.
         :param dry_run: Run function, but do not modify the file on the disk.
+        :param verify: Reload each file to compare against the tags currently saved to the file
+            instead of the snapshot of the tags last read from or written to the file.
+        :param executor: Optionally, provide an :py:class:`Executor` to save tracks concurrently.
+            Saving is mostly bound by IO, so a :py:class:`ThreadPoolExecutor` is recommended.
+            Tracks are updated in place when saved and so must be saved in the calling process
+            i.e. a :py:class:`ProcessPoolExecutor` cannot be used.
+        :param max_in_flight: The maximum number of tracks to save concurrently.
+            When given without an ``executor``, a :py:class:`ThreadPoolExecutor` with this many workers is used.
+            When neither are given, tracks are saved one after another.
         :return: A map of the :py:class:`LocalTrack` saved to its result as a :py:class:`SyncResultTrack` object
             only for tracks that were saved or would have been saved in the case of a dry run.
+        :raise MusifyTypeError: If a :py:class:`ProcessPoolExecutor` is given as the ``executor``.
         """
-        async def _save_track(track: T) -> tuple[T, SyncResultTrack]:
-            return track, await track.save(tags=tags, replace=replace, dry_run=dry_run)
+        if isinstance(executor, ProcessPoolExecutor):
+            raise MusifyTypeError(type(executor).__name__, message="Tracks cannot be saved in a separate process")
+        if executor is None and max_in_flight is not None:
+            with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="save-tracks") as executor:
+                return await self.save_tracks(
+                    tags=tags,
+                    replace=replace,
+                    dry_run=dry_run,
+                    verify=verify,
+                    executor=executor,
+                    max_in_flight=max_in_flight,
+                )
+
+        if executor is not None:
+            loop = asyncio.get_running_loop()
+
+            async def _save_track_in_executor(track: T) -> tuple[T, SyncResultTrack]:
+                # noinspection PyProtectedMember
+                save = partial(track._save, tags=tags, replace=replace, dry_run=dry_run, verify=verify)
+                return track, await loop.run_in_executor(executor, save)
+
+            results = await self.logger.gather_with_progress(
+                map(_save_track_in_executor, self.tracks),
+                max_in_flight=max_in_flight,
+                desc="Updating tracks",
+                unit="tracks",
+            )
+            results = dict(results)
+        else:
+            async def _save_track(track: T) -> tuple[T, SyncResultTrack]:
+                return track, await track.save(tags=tags, replace=replace, dry_run=dry_run, verify=verify)
+
+            # WARNING: making this run asynchronously will break tqdm; bar will get stuck after 1-2 ticks
+            bar = self.logger.get_synchronous_iterator(
+                self.tracks, desc="Updating tracks", unit="tracks"
+            )
+            results = dict([await _save_track(track) for track in bar])
 
-        # WARNING: making this run asynchronously will break tqdm; bar will get stuck after 1-2 ticks
-        bar = self.logger.get_synchronous_iterator(
-            self.tracks, desc="Updating tracks", unit="tracks"
-        )
-        results = dict([await _save_track(track) for track in bar])
         return {track: result for track, result in results.items() if result.saved or result.updated}
 
     def log_save_tracks_result(self, results: Mapping[T, SyncResultTrack], log_values: bool = False) -> None:
@@ -135,6 +192,8 @@ class LocalCollection[T: LocalTrack](MusifyCollection[T], metaclass=ABCMeta):
         self.logger.stat("\33[1;96mSaved tags to the following tracks: \33[0m")
         for track, result in results.items():
             saved = "\33[92mSAVED" if result.saved else "\33[91mNOT SAVED"
+            if result.rewritten:
+                saved += " \33[93m(REWRITTEN)"
             if log_values:
                 tags = ' | '.join(
                     "\33[94m" + (
@@ -153,13 +212,19 @@ class LocalCollection[T: LocalTrack](MusifyCollection[T], metaclass=ABCMeta):
                 f"{saved} \33[0m| \33[94m{tags} \33[0m"
             )
 
-    def merge_tracks(self, tracks: Collection[Track], tags: UnitIterable[TagField] = Fields.ALL) -> None:
+    def merge_tracks(
+            self, tracks: Collection[Track], tags: UnitIterable[TagField] = Fields.ALL
+    ) -> MergeTracksResult:
         """
         Merge this collection with another collection or list of items
-        by performing an inner join on a given set of tags
+        by performing an inner join on a given set of tags.
+
+        Matching tracks in this collection are found for all given ``tracks`` using an index of this collection
+        built once before merging. The tags are then merged onto each matched track.
 
         :param tracks: List of items or :py:class:`MusifyCollection` to merge with
         :param tags: List of tags to merge on.
+        :return: The number of tracks merged and the number of tracks for which no match was found.
         """
         # noinspection PyTypeChecker
         tag_names = set(TagField.__tags__) if tags == Fields.ALL else set(TagField.to_tags(tags))
@@ -178,17 +243,33 @@ class LocalCollection[T: LocalTrack](MusifyCollection[T], metaclass=ABCMeta):
         if Fields.IMAGES in tags or Fields.ALL in tags:
             tag_names.append("image_links")
 
-        for track in tracks:  # perform the merge
-            track_in_collection: T = next((t for t in self.tracks if t == track), None)
-            if not track_in_collection:  # skip if the item does not exist in this collection
+        members = ItemMembership(self.tracks)
+        matches: list[tuple[T, Track]] = []
+        not_found = 0
+        for track in tracks:
+            track_in_collection: T = members.get(track)
+            if track_in_collection is None:  # skip if the item does not exist in this collection
+                not_found += 1
                 continue
+            matches.append((track_in_collection, track))
 
+        for track_in_collection, track in matches:  # perform the merge
             for tag in tag_names:  # merge on each tag
                 if hasattr(track, tag):
                     track_in_collection[tag] = track[tag]
 
+        # values used to retrieve items from this collection may have changed
+        self.clear_index()
+
+        result = MergeTracksResult(merged=len(matches), not_found=not_found)
         if isinstance(self, Library | LocalCollection):
             self.logger.print_line()
+            self.logger.info(
+                f"\33[1;95m  >\33[1;97m Merged {result.merged} tracks | "
+                f"\33[0;90m{result.not_found} tracks not found\33[0m"
+            )
+
+        return result
 
 
 class BasicLocalCollection[T: LocalTrack](LocalCollection[T]):
@@ -345,7 +426,7 @@ class LocalFolder(LocalCollectionFiltered[LocalTrack], Folder[LocalTrack]):
             raise UnexpectedPathError(path, "Path must be a directory")
 
         # load tracks in the folder
-        tasks = asyncio.gather(*[load_track(p) for p in path.glob("*") if p.suffix in TRACK_FILETYPES])
+        tasks = asyncio.gather(*[load_track(p) for p in path.glob("*") if p.suffix.lower() in TRACK_FILETYPES])
         return cls(tracks=await tasks, name=path.name, remote_wrangler=remote_wrangler)
 
 
@@ -6,7 +6,8 @@ or a defined settings folder for any of the supported library managers.
 
 Specific library types should implement :py:class:`LocalLibrary`.
 """
-from .library import LocalLibrary
+from .library import LocalLibrary, RefreshResult
 from .musicbee import MusicBee
+from .watcher import LibraryWatcher
 
 LIBRARY_CLASSES = frozenset({LocalLibrary, MusicBee})
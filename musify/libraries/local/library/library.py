@@ -1,23 +1,27 @@
 """
 The core, basic library implementation which is just a simple set of folders.
 """
-import functools
+import asyncio
 import itertools
 import os
-from collections.abc import Collection, Mapping, Iterable
-from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Collection, Mapping, Iterable, Callable
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Executor
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from aiorequestful.types import UnitCollection, UnitIterable
 
 from musify.base import Result
-from musify.exception import MusifyError
+from musify.exception import MusifyError, MusifyTypeError
+from musify.file.base import IGNORE_FOLDERS, get_filepaths_by_extension, get_file_stat
 from musify.file.path_mapper import PathMapper, PathStemMapper
 from musify.libraries.core.object import Library, LibraryMergeType
 from musify.libraries.local.collection import LocalCollection, LocalFolder, LocalAlbum, LocalArtist, LocalGenres
-from musify.libraries.local.playlist import PLAYLIST_CLASSES, LocalPlaylist, load_playlist
-from musify.libraries.local.track import TRACK_CLASSES, LocalTrack, load_track
+from musify.libraries.local.playlist import PLAYLIST_FILETYPES, LocalPlaylist, load_playlist
+from musify.libraries.local.track import TRACK_FILETYPES, LocalTrack, TrackCache, load_track
+from musify.libraries.local.track import extract_track_values, build_track_from_values
 from musify.libraries.local.track.field import LocalTrackField
 from musify.libraries.remote.core.wrangle import RemoteDataWrangler
 from musify.logger import STAT
@@ -29,6 +33,21 @@ from musify.utils import align_string, get_max_width, to_collection, classproper
 type RestoreTracksType = Iterable[Mapping[str, Any]] | Mapping[str | Path, Mapping[str, Any]]
 
 
+@dataclass(frozen=True)
+class RefreshResult(Result):
+    """Stores the results of a refresh of a local library"""
+    #: The paths of the tracks added to the library.
+    added: frozenset[Path]
+    #: The paths of the tracks removed from the library.
+    removed: frozenset[Path]
+    #: The paths of the tracks reloaded as their files were modified.
+    modified: frozenset[Path]
+    #: The names of the playlists loaded or reloaded.
+    playlists_loaded: frozenset[str]
+    #: The names of the playlists removed from the library.
+    playlists_removed: frozenset[str]
+
+
 class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
     """
     Represents a local library, providing various methods for manipulating
@@ -51,18 +70,30 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
         The wrangler is also used when loading tracks to allow them to process URI tags.
         For more info on this, see :py:class:`LocalTrack`.
     :param name: A name to assign to this library.
+    :param track_cache_path: Optionally, provide the path of a database file in which to cache the values
+        extracted from the track files. When given, files that are unchanged since they were last loaded
+        are rebuilt from the cached values without reading the file. See :py:class:`TrackCache` for more info.
+    :param detach_tracks: When True, release the mutagen object for each track after loading to reduce memory usage,
+        loading it again only as and when it is needed. See :py:class:`LocalTrack` for more info.
     """
 
     __slots__ = (
         "_name",
         "_library_folders",
         "_playlist_folder",
+        "_library_playlist_paths",
         "playlist_filter",
         "path_mapper",
         "_playlist_paths",
         "_playlists",
         "_track_paths",
         "_tracks",
+        "_mutations",
+        "_views",
+        "_track_stats",
+        "_playlist_stats",
+        "track_cache",
+        "detach_tracks",
         "errors",
     )
     __attributes_classes__ = (Library, LocalCollection)
@@ -108,9 +139,17 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
 
         self._library_folders: list[Path] = [folder for folder in map(Path, to_collection(folders)) if folder.exists()]
 
-        self._track_paths = {
-            path for folder in self._library_folders for cls in TRACK_CLASSES for path in cls.get_filepaths(folder)
-        }
+        # walk each library folder once, storing any playlists found for use when setting the playlist folder
+        self._track_paths = set()
+        self._library_playlist_paths = set()
+        for folder in self._library_folders:
+            paths = get_filepaths_by_extension(folder, extensions=TRACK_FILETYPES | PLAYLIST_FILETYPES)
+            for ext, ext_paths in paths.items():
+                if ext in TRACK_FILETYPES:
+                    self._track_paths.update(ext_paths)
+                else:
+                    self._library_playlist_paths.update(ext_paths)
+
         if isinstance(self.path_mapper, PathStemMapper):
             self.path_mapper.available_paths = self._track_paths
 
@@ -146,10 +185,14 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
         self._playlist_folder = folder
         self._playlist_paths = None
 
-        playlists = {
-            Path(str(path).removeprefix(str(self._playlist_folder))).stem: path
-            for cls in PLAYLIST_CLASSES for path in cls.get_filepaths(self._playlist_folder)
-        }
+        if any(folder.is_relative_to(fldr) for fldr in self.library_folders):
+            # playlist folder has already been walked when setting the library folders
+            paths = {path for path in self._library_playlist_paths if path.is_relative_to(folder)}
+        else:
+            paths = get_filepaths_by_extension(folder, extensions=PLAYLIST_FILETYPES)
+            paths = {path for ext_paths in paths.values() for path in ext_paths}
+
+        playlists = {Path(str(path).removeprefix(str(self._playlist_folder))).stem: path for path in paths}
 
         pl_total = len(playlists)
         pl_filtered = self.playlist_filter(playlists)
@@ -164,19 +207,71 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
             if (pl_total - len(pl_filtered)) > 0 else f"{len(self._playlist_paths)} playlists found"
         ))
 
-    @property
-    def folders(self) -> list[LocalFolder]:
+    def _get_cached[T: Any](self, name: str, build: Callable[[], T]) -> T:
         """
-        Dynamically generate a set of folder collections from the tracks in this library.
-        Folder collections are generated relevant to the library folder it is found in.
+        Get the cached value with the given ``name``, generating it with ``build``
+        only when the tracks in this library have changed since it was last generated.
+        """
+        state = (self._mutations, id(self._tracks), len(self._tracks))
+        cached = self._views.get(name)
+        if cached is None or cached[0] != state:
+            cached = self._views[name] = (state, build())
+        return cached[1]
+
+    def _get_groups(self, field: LocalTrackField) -> dict[Any, list[LocalTrack]]:
         """
+        Get the tracks in this library grouped by the given ``field``.
+        Tracks are grouped by album, artist, and genre together in a single pass and cached.
+        See :py:meth:`_get_cached` for more info.
+        """
+        fields = (LocalTrackField.ALBUM, LocalTrackField.ARTISTS, LocalTrackField.GENRES)
+        return self._get_cached("groups", lambda: ItemSorter.group_by_fields(self.tracks, fields=fields))[field]
+
+    def _get_folder_groups(self) -> dict[Path, list[LocalTrack]]:
+        """
+        Get the tracks in this library grouped by their folder relative to the library folder it is found in.
+        Cached as for :py:meth:`_get_groups`.
+        """
+        return self._get_cached("folders", self._group_by_folder)
+
+    def _group_by_folder(self) -> dict[Path, list[LocalTrack]]:
+        """Group the tracks in this library by their folder relative to the library folder it is found in."""
+        prefixes = [str(folder) for folder in self.library_folders]
+
         def get_relative_path(track: LocalTrack) -> Path:
             """Return path of a track relative to the library folders of this library"""
-            path = functools.reduce(
-                lambda p, f: str(p).replace(str(f), ""), self.library_folders, str(track.path)
-            )
+            path = str(track.path)
+            for prefix in prefixes:
+                if path.startswith(prefix):
+                    path = path[len(prefix):]
+                    break
             return Path(path.lstrip(os.path.sep)).parent
 
+        grouped = itertools.groupby(sorted(self.tracks, key=lambda track: track.path), get_relative_path)
+        return {path: list(group) for path, group in grouped}
+
+    def clear_index(self) -> None:
+        """
+        Clear the index used to retrieve tracks from this library by key and the cached groupings of tracks
+        used to generate :py:attr:`folders`, :py:attr:`albums`, :py:attr:`artists`, and :py:attr:`genres`
+        """
+        super().clear_index()
+        self._mutations += 1
+
+    def _update_item_index(self) -> None:
+        super()._update_item_index()
+        self._mutations += 1
+
+    @property
+    def folders(self) -> list[LocalFolder]:
+        """
+        Generate a set of folder collections from the tracks in this library.
+        Folder collections are generated relevant to the library folder it is found in.
+
+        New collections are generated on each call from a grouping of the tracks which is cached
+        until the tracks in this library are changed through the methods of this library.
+        If the tags of any tracks are changed directly, call :py:meth:`clear_index` to regenerate them.
+        """
         def create_folder_collection(path: Path, tracks: Collection[LocalTrack]) -> LocalFolder:
             """
             Create a :py:class:`LocalFolder` collection from the given ``tracks``,
@@ -191,14 +286,17 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
             folder._name = str(path)
             return folder
 
-        grouped = itertools.groupby(sorted(self.tracks, key=lambda track: track.path), get_relative_path)
-        collections = [create_folder_collection(path=path, tracks=list(group)) for path, group in grouped]
+        grouped = self._get_folder_groups()
+        collections = [create_folder_collection(path=path, tracks=group) for path, group in grouped.items()]
         return sorted(collections, key=lambda x: x.name)
 
     @property
     def albums(self) -> list[LocalAlbum]:
-        """Dynamically generate a set of album collections from the tracks in this library"""
-        grouped = ItemSorter.group_by_field(items=self.tracks, field=LocalTrackField.ALBUM)
+        """
+        Generate a set of album collections from the tracks in this library.
+        The grouping of tracks is cached in the same way as for :py:attr:`folders`.
+        """
+        grouped = self._get_groups(LocalTrackField.ALBUM)
         collections = [
             LocalAlbum(tracks=group, name=name, remote_wrangler=self.remote_wrangler)
             for name, group in grouped.items() if name
@@ -207,8 +305,11 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
 
     @property
     def artists(self) -> list[LocalArtist]:
-        """Dynamically generate a set of artist collections from the tracks in this library"""
-        grouped = ItemSorter.group_by_field(items=self.tracks, field=LocalTrackField.ARTISTS)
+        """
+        Generate a set of artist collections from the tracks in this library.
+        The grouping of tracks is cached in the same way as for :py:attr:`folders`.
+        """
+        grouped = self._get_groups(LocalTrackField.ARTISTS)
         collections = [
             LocalArtist(tracks=group, name=name, remote_wrangler=self.remote_wrangler)
             for name, group in grouped.items() if name
@@ -217,8 +318,11 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
 
     @property
     def genres(self) -> list[LocalGenres]:
-        """Dynamically generate a set of genre collections from the tracks in this library"""
-        grouped = ItemSorter.group_by_field(items=self.tracks, field=LocalTrackField.GENRES)
+        """
+        Generate a set of genre collections from the tracks in this library.
+        The grouping of tracks is cached in the same way as for :py:attr:`folders`.
+        """
+        grouped = self._get_groups(LocalTrackField.GENRES)
         collections = [
             LocalGenres(tracks=group, name=name, remote_wrangler=self.remote_wrangler)
             for name, group in grouped.items() if name
@@ -233,6 +337,8 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
             path_mapper: PathMapper = PathMapper(),
             remote_wrangler: RemoteDataWrangler | None = None,
             name: str = None,
+            track_cache_path: str | Path | None = None,
+            detach_tracks: bool = False,
     ):
         super().__init__(remote_wrangler=remote_wrangler)
 
@@ -247,6 +353,8 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
 
         self._library_folders: list[Path] = []
         self._track_paths: set[Path] = set()
+        # paths of all playlists found when walking the library folders
+        self._library_playlist_paths: set[Path] = set()
         self.library_folders = library_folders
 
         if not isinstance(playlist_filter, Filter):
@@ -262,19 +370,40 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
         self._tracks: list[LocalTrack] = []
         self._playlists: dict[str, LocalPlaylist] = {}
 
+        # incremented on every change to the tracks in this library, used to invalidate the cached views
+        self._mutations: int = 0
+        # map of name to the state of the library when generated and the cached grouping of tracks for this name
+        self._views: dict[str, tuple[tuple[int, int, int], Any]] = {}
+
+        # the size and modified time of each loaded file at the time it was read, used to find modified files
+        self._track_stats: dict[Path, tuple[int, int] | None] = {}
+        self._playlist_stats: dict[Path, tuple[int, int] | None] = {}
+
+        #: Optionally, a cache of the values extracted from track files used to speed up reloading unchanged files.
+        self.track_cache: TrackCache | None = None
+        if track_cache_path is not None:
+            self.track_cache = TrackCache(track_cache_path, remote_wrangler=remote_wrangler)
+        #: When True, release the mutagen object for each track after loading to reduce memory usage.
+        self.detach_tracks = detach_tracks
+
         #: Stores the paths that caused errors when loading/enriching
         self.errors: list[str] = []
         self.logger.debug(f"Setup {self.name} library: DONE\n")
 
-    async def load(self) -> None:
-        """Loads all tracks and playlists in this library from scratch and log results."""
+    async def load(self, executor: Executor | None = None) -> None:
+        """
+        Loads all tracks and playlists in this library from scratch and log results.
+
+        :param executor: Optionally, provide an :py:class:`Executor` e.g. a :py:class:`ProcessPoolExecutor`
+            to extract metadata from the track files in parallel. See :py:meth:`load_tracks` for more info.
+        """
         self.logger.debug(f"Load {self.name} library: START")
         self.logger.info(
             f"\33[1;95m ->\33[1;97m Loading {self.name} library of "
             f"{len(self._track_paths)} tracks and {len(self._playlist_paths)} playlists \33[0m"
         )
 
-        await self.load_tracks()
+        await self.load_tracks(executor=executor)
         await self.load_playlists()
 
         self.logger.print_line(STAT)
@@ -292,6 +421,200 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
             self.logger.print_line()
         self.errors.clear()
 
+    async def refresh(
+            self, executor: Executor | None = None, paths: Collection[str | Path] | None = None
+    ) -> RefreshResult:
+        """
+        Update the loaded tracks and playlists in this library to match the files currently on disk
+        without loading the whole library again.
+
+        The library and playlist folders are scanned again for new and removed files.
+        Only new files and files whose size or modified time has changed since they were last read are loaded,
+        and the tracks for files which no longer exist are removed.
+        Playlists are only reloaded when their file has changed or when the tracks they may match have changed.
+
+        :param executor: Optionally, provide an :py:class:`Executor` to extract metadata from the track files
+            in parallel. See :py:meth:`load_tracks` for more info.
+        :param paths: Optionally, provide the paths of the files and folders which have changed
+            e.g. as reported by a :py:class:`LibraryWatcher`. When given, only these paths are checked for changes
+            and the library and playlist folders are not scanned again.
+        :return: The results of the refresh as a :py:class:`RefreshResult` object.
+        """
+        self.logger.debug(f"Refresh {self.name} library: START")
+
+        paths_loaded = {track.path for track in self.tracks}
+        if paths is None:
+            # scan the library and playlist folders again to find any new or removed files
+            self.library_folders = self._library_folders
+            self.playlist_folder = self._playlist_folder
+            paths_check = paths_loaded | self._track_paths
+        else:
+            paths_check = self._update_paths(paths)
+
+        paths_added = (paths_check & self._track_paths) - paths_loaded
+        paths_removed = (paths_check & paths_loaded) - self._track_paths
+        paths_modified = {
+            path for path in paths_check & paths_loaded & self._track_paths
+            if get_file_stat(path) != self._track_stats.get(path)
+        }
+
+        self.logger.info(
+            f"\33[1;95m ->\33[1;97m Refreshing {self.name} library: {len(paths_added)} new, "
+            f"{len(paths_removed)} removed, and {len(paths_modified)} modified tracks \33[0m"
+        )
+
+        paths_removed_tracks = paths_removed | paths_modified
+        tracks_updated = await self._refresh_tracks(
+            paths_remove=paths_removed_tracks, paths_load=paths_added | paths_modified, executor=executor
+        )
+        self._log_errors("Could not load the following tracks")
+
+        playlists_removed = {
+            name for name, pl in self._playlists.items()
+            if name not in self._playlist_paths and pl.path in self._playlist_stats
+        }
+        for name in playlists_removed:
+            self._playlist_stats.pop(self._playlists.pop(name).path, None)
+
+        paths_playlists = [
+            path for name, path in self._playlist_paths.items()
+            if name not in self._playlists or self._playlist_requires_reload(
+                self._playlists[name], paths_removed=paths_removed_tracks, tracks_updated=tracks_updated
+            )
+        ]
+        playlists = await self._load_playlists_from_paths(paths_playlists) if paths_playlists else []
+        self._playlists = dict(sorted(
+            (self._playlists | {pl.name: pl for pl in playlists}).items(), key=lambda x: x[0].casefold()
+        ))
+        self._log_errors("Could not load the following playlists")
+
+        self.logger.debug(f"Refresh {self.name} library: DONE\n")
+        return RefreshResult(
+            added=frozenset(path for path in paths_added if path in self._track_stats),
+            removed=frozenset(paths_removed),
+            modified=frozenset(path for path in paths_modified if path in self._track_stats),
+            playlists_loaded=frozenset(pl.name for pl in playlists),
+            playlists_removed=frozenset(playlists_removed),
+        )
+
+    def _update_paths(self, paths: Collection[str | Path]) -> set[Path]:
+        """
+        Update the stored track and playlist paths of this library for the given ``paths``
+        of files and folders which have been created, modified, moved or deleted.
+
+        :return: The paths of the tracks which may have changed.
+        """
+        paths_tracks, paths_playlists = self._classify_paths(paths)
+        self._update_track_paths(paths_tracks)
+        self._update_playlist_paths(paths_playlists)
+        return paths_tracks
+
+    def _classify_paths(self, paths: Collection[str | Path]) -> tuple[set[Path], set[Path]]:
+        """
+        Expand the given ``paths`` of files and folders which have changed to the paths of the
+        track and playlist files they affect.
+
+        :return: The paths of the affected track files and the paths of the affected playlist files.
+        """
+        paths_tracks: set[Path] = set()
+        paths_playlists: set[Path] = set()
+        for path in map(Path, paths):
+            if path.suffix.lower() in TRACK_FILETYPES:
+                paths_tracks.add(path)
+            elif path.suffix.lower() in PLAYLIST_FILETYPES:
+                paths_playlists.add(path)
+            elif path.is_dir():  # a folder has been created or moved into the library
+                for ext, ext_paths in get_filepaths_by_extension(path, TRACK_FILETYPES | PLAYLIST_FILETYPES).items():
+                    (paths_tracks if ext in TRACK_FILETYPES else paths_playlists).update(ext_paths)
+            elif not path.exists():  # a folder may have been deleted or moved out of the library
+                paths_tracks.update(p for p in self._track_paths if p.is_relative_to(path))
+                paths_playlists.update(p for p in self._playlist_paths.values() if p.is_relative_to(path))
+
+        return paths_tracks, paths_playlists
+
+    @staticmethod
+    def _is_valid_path(path: Path, folders: Iterable[Path]) -> bool:
+        """Check whether the given path is an available file which would be found when walking the ``folders``"""
+        return (
+            any(path.is_relative_to(folder) for folder in folders)
+            and not path.name.startswith(".")
+            and not IGNORE_FOLDERS.intersection(path.parts)
+            and path.is_file()
+        )
+
+    def _update_track_paths(self, paths: Collection[Path]) -> None:
+        """Add or remove the given track ``paths`` from the stored track paths of this library"""
+        for path in paths:
+            if self._is_valid_path(path, self.library_folders):
+                self._track_paths.add(path)
+            else:
+                self._track_paths.discard(path)
+
+        if isinstance(self.path_mapper, PathStemMapper):
+            self.path_mapper.available_paths = set(paths) & self._track_paths
+
+    def _update_playlist_paths(self, paths: Collection[Path]) -> None:
+        """Add or remove the given playlist ``paths`` from the stored playlist paths of this library"""
+        for path in paths:
+            if self._is_valid_path(path, self.library_folders):
+                self._library_playlist_paths.add(path)
+            else:
+                self._library_playlist_paths.discard(path)
+
+            if self.playlist_folder is None or not path.is_relative_to(self.playlist_folder):
+                continue
+
+            name = Path(str(path).removeprefix(str(self._playlist_folder))).stem
+            if self._is_valid_path(path, [self.playlist_folder]) and self.playlist_filter([name]):
+                self._playlist_paths[name] = path
+            elif self._playlist_paths.get(name) == path:
+                self._playlist_paths.pop(name)
+
+        self._playlist_paths = dict(sorted(self._playlist_paths.items(), key=lambda x: x[0].casefold()))
+
+    async def _refresh_tracks(
+            self, paths_remove: Collection[Path], paths_load: Collection[Path], executor: Executor | None = None
+    ) -> list[LocalTrack]:
+        """
+        Remove the loaded tracks for the given ``paths_remove`` and load the tracks for the given ``paths_load``.
+
+        :return: The tracks which have been loaded or otherwise updated.
+        """
+        self._tracks = [track for track in self._tracks if track.path not in paths_remove]
+        self.clear_index()
+        for path in paths_remove:
+            self._track_stats.pop(path, None)
+            if self.track_cache is not None:
+                self.track_cache.remove(path)
+
+        if not paths_load:
+            if self.track_cache is not None and paths_remove:
+                self.track_cache.save(paths=self._track_paths)
+            return []
+
+        tracks = await self._load_tracks_from_paths(paths_load, executor=executor)
+        self._tracks.extend(tracks)
+        self.clear_index()
+        return tracks
+
+    def _playlist_requires_reload(
+            self, playlist: LocalPlaylist, paths_removed: Collection[Path], tracks_updated: Collection[LocalTrack]
+    ) -> bool:
+        """
+        Check whether the given ``playlist`` needs to be reloaded from its file
+        given the paths of the tracks removed and the tracks updated since it was last loaded.
+        """
+        if get_file_stat(playlist.path) != self._playlist_stats.get(playlist.path):
+            return True
+        if paths_removed and any(track.path in paths_removed for track in playlist):
+            return True
+        if not tracks_updated or playlist.matcher is None:
+            return False
+
+        if isinstance(playlist.matcher, FilterDefinedList):  # only matches on the paths given in the file
+            return len(playlist.matcher(values=tracks_updated)) > 0
+        return True  # the tracks matched may depend on the values of any track in the library
+
     ###########################################################################
     ## Tracks
     ###########################################################################
@@ -303,13 +626,114 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
         Handles exceptions by logging paths which produce errors to internal list of ``errors``.
         """
         try:
-            return await load_track(path=path, remote_wrangler=self.remote_wrangler)
+            return await load_track(path=path, remote_wrangler=self.remote_wrangler, detached=self.detach_tracks)
+        except MusifyError as ex:
+            self.logger.debug(f"Load error for track: {path} - {ex}")
+            self.errors.append(path)
+
+    async def _load_track_in_executor(self, path: Path, executor: Executor) -> LocalTrack | None:
+        """
+        Extract metadata for the track at the given ``path`` using the given ``executor``
+        and rebuild the track from the extracted values in this process.
+
+        Handles exceptions by logging paths which produce errors to internal list of ``errors``.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            values = await loop.run_in_executor(executor, extract_track_values, path, self.remote_wrangler)
+            return build_track_from_values(
+                path=path, values=values, remote_wrangler=self.remote_wrangler, detached=self.detach_tracks
+            )
         except MusifyError as ex:
             self.logger.debug(f"Load error for track: {path} - {ex}")
             self.errors.append(path)
 
-    async def load_tracks(self) -> None:
-        """Load all tracks from all the valid paths in this library, replacing currently loaded tracks."""
+    def _load_tracks_from_cache(
+            self, paths: Collection[Path], stats: Mapping[Path, tuple[int, int] | None]
+    ) -> list[LocalTrack]:
+        """
+        Rebuild the tracks for the given ``paths`` from values in the ``track_cache`` for unchanged files,
+        checking against the given ``stats`` of each file as given by :py:func:`get_file_stat`.
+        """
+        tracks = []
+        for path in paths:
+            values = self.track_cache.get(path, stat=stats.get(path))
+            if values is not None:
+                track = build_track_from_values(
+                    path=path, values=values, remote_wrangler=self.remote_wrangler, detached=self.detach_tracks
+                )
+                tracks.append(track)
+
+        self.logger.debug(f"Loaded {len(tracks)} {self.name} tracks from cache: {self.track_cache.path}")
+        return tracks
+
+    def _save_tracks_to_cache(
+            self, tracks: Iterable[LocalTrack], stats: Mapping[Path, tuple[int, int] | None]
+    ) -> None:
+        """
+        Store the values extracted from the given ``tracks`` in the ``track_cache`` and save it to disk
+        against the given ``stats`` of each file taken before the tracks were loaded.
+        """
+        for track in tracks:
+            if (stat := stats.get(track.path)) is None:
+                continue
+            # noinspection PyProtectedMember
+            self.track_cache.set(track.path, track._get_file_values(), stat=stat)
+        self.track_cache.save(paths=self._track_paths)
+
+    async def _load_tracks_from_paths(
+            self, paths: Collection[Path], executor: Executor | None = None
+    ) -> list[LocalTrack]:
+        """
+        Load the tracks for the given ``paths``, using the ``track_cache`` for unchanged files if available.
+        See :py:meth:`load_tracks` for more info.
+        """
+        stats = {path: get_file_stat(path) for path in paths}
+
+        tracks_cached = []
+        paths = set(paths)
+        if self.track_cache is not None:
+            tracks_cached = self._load_tracks_from_cache(paths, stats=stats)
+            paths -= {track.path for track in tracks_cached}
+
+        if executor is not None:
+            tracks = await self.logger.gather_with_progress(
+                [self._load_track_in_executor(path, executor=executor) for path in paths],
+                desc="Loading tracks",
+                unit="tracks",
+            )
+        else:
+            # WARNING: making this run asynchronously will break tqdm; bar will get stuck after 1-2 ticks
+            bar = self.logger.get_synchronous_iterator(
+                paths,
+                desc="Loading tracks",
+                unit="tracks",
+                total=len(paths)
+            )
+            tracks = [await self.load_track(path) for path in bar]
+
+        tracks = [track for track in tracks if track is not None]
+        if self.track_cache is not None:
+            self._save_tracks_to_cache(tracks, stats=stats)
+
+        tracks = tracks_cached + tracks
+        self._track_stats.update({track.path: stats.get(track.path) for track in tracks})
+        return tracks
+
+    async def load_tracks(self, executor: Executor | None = None) -> None:
+        """
+        Load all tracks from all the valid paths in this library, replacing currently loaded tracks.
+
+        If this library has a ``track_cache``, tracks for unchanged files are rebuilt from the cache
+        and only the remaining files are read, after which the cache is updated with the values from these files.
+
+        :param executor: Optionally, provide an :py:class:`Executor` to extract metadata from the track files
+            in parallel. A :py:class:`ProcessPoolExecutor` will spread the CPU-bound parsing of files across cores,
+            whereas a :py:class:`ThreadPoolExecutor` may be sufficient when loading is bound by slow IO.
+            The extracted metadata is returned to this process and the tracks are rebuilt from these values.
+            The underlying file objects of these tracks are then only loaded as and when they are needed.
+            When not given, tracks are loaded sequentially in this process.
+        """
         if not self._track_paths:
             return
 
@@ -318,15 +742,9 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
             f"\33[1;95m  >\33[1;97m Extracting metadata and properties for {len(self._track_paths)} tracks \33[0m"
         )
 
-        # WARNING: making this run asynchronously will break tqdm; bar will get stuck after 1-2 ticks
-        bar = self.logger.get_synchronous_iterator(
-            self._track_paths,
-            desc="Loading tracks",
-            unit="tracks",
-            total=len(self._track_paths)
-        )
-        tracks = [await self.load_track(path) for path in bar]
-        self._tracks = [track for track in tracks if track is not None]
+        self._track_stats.clear()
+        self._tracks = await self._load_tracks_from_paths(self._track_paths, executor=executor)
+        self.clear_index()
 
         self._log_errors("Could not load the following tracks")
         self.logger.debug(f"Load {self.name} tracks: DONE\n")
@@ -344,29 +762,94 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
     ###########################################################################
     ## Playlists
     ###########################################################################
-    async def load_playlist(self, path: str | Path) -> LocalPlaylist:
+    async def load_playlist(
+            self, path: str | Path, tracks_by_path: Mapping[Path, LocalTrack] | None = None
+    ) -> LocalPlaylist:
         """
         Wrapper for :py:func:`load_playlist` which automatically loads the playlist at the given ``path``
         and assigns optional arguments using this library's attributes.
 
         Handles exceptions by logging paths which produce errors to internal list of ``errors``.
+
+        :param path: The path of the playlist to load.
+        :param tracks_by_path: Optionally, provide the map of tracks in this library
+            as given by :py:meth:`_get_tracks_by_path` to match paths in the playlist against.
         """
         try:
             return await load_playlist(
-                path=path, tracks=self.tracks, path_mapper=self.path_mapper, remote_wrangler=self.remote_wrangler,
+                path=path,
+                tracks=self.tracks,
+                path_mapper=self.path_mapper,
+                remote_wrangler=self.remote_wrangler,
+                tracks_by_path=tracks_by_path,
             )
         except MusifyError as ex:
             self.logger.debug(f"Load error for playlist: {path} - {ex}")
             self.errors.append(path)
 
-    async def load_playlists(self) -> None:
+    def _get_tracks_by_path(self) -> dict[Path, LocalTrack]:
+        """Map the tracks in this library by their paths as mapped by this library's ``path_mapper``"""
+        return {Path(self.path_mapper.map(track, check_existence=False)): track for track in self.tracks}
+
+    async def _load_playlists_from_paths(
+            self, paths: Collection[Path], executor: Executor | None = None, max_in_flight: int | None = None
+    ) -> list[LocalPlaylist]:
+        """
+        Load the playlists for the given ``paths``, matching tracks from the currently loaded tracks.
+        Paths in each playlist are matched against one map of the tracks by path shared by all playlists.
+        See :py:meth:`load_playlists` for more info on the ``executor`` and ``max_in_flight`` arguments.
+        """
+        if executor is None and max_in_flight is not None:
+            with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="load-playlists") as executor:
+                return await self._load_playlists_from_paths(paths, executor=executor, max_in_flight=max_in_flight)
+
+        stats = {path: get_file_stat(path) for path in paths}
+        tracks_by_path = self._get_tracks_by_path()
+
+        if executor is not None:
+            loop = asyncio.get_running_loop()
+
+            async def _load_playlist_in_executor(path: Path) -> LocalPlaylist | None:
+                load = partial(asyncio.run, self.load_playlist(path, tracks_by_path=tracks_by_path))
+                return await loop.run_in_executor(executor, load)
+
+            playlists = await self.logger.gather_with_progress(
+                map(_load_playlist_in_executor, paths),
+                max_in_flight=max_in_flight,
+                desc="Loading playlists",
+                unit="playlists",
+            )
+        else:
+            # WARNING: making this run asynchronously will break tqdm; bar will get stuck after 1-2 ticks
+            bar = self.logger.get_synchronous_iterator(
+                paths,
+                desc="Loading playlists",
+                unit="playlists",
+                total=len(paths)
+            )
+            playlists = [await self.load_playlist(path, tracks_by_path=tracks_by_path) for path in bar]
+
+        playlists = [pl for pl in playlists if pl is not None]
+        self._playlist_stats.update({pl.path: stats.get(pl.path) for pl in playlists})
+        return playlists
+
+    async def load_playlists(self, executor: Executor | None = None, max_in_flight: int | None = None) -> None:
         """
         Load all playlists found in this library's ``playlist_folder``,
         filtered down using the ``playlist_filter`` if given, replacing currently loaded playlists.
 
+        :param executor: Optionally, provide a :py:class:`ThreadPoolExecutor` to load playlists concurrently.
+            Playlists are matched against the tracks of this library and so must be loaded in the calling process
+            i.e. a :py:class:`ProcessPoolExecutor` cannot be used.
+        :param max_in_flight: The maximum number of playlists to load concurrently.
+            When given without an ``executor``, a :py:class:`ThreadPoolExecutor` with this many workers is used.
+            When neither are given, playlists are loaded one after another.
         :return: The loaded playlists.
         :raise LocalCollectionError: If a given playlist name cannot be found.
+        :raise MusifyTypeError: If a :py:class:`ProcessPoolExecutor` is given as the ``executor``.
         """
+        if isinstance(executor, ProcessPoolExecutor):
+            raise MusifyTypeError(type(executor).__name__, message="Playlists cannot be loaded in a separate process")
         if not self._playlist_paths:
             return
 
@@ -375,16 +858,11 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
             f"\33[1;95m  >\33[1;97m Loading playlist data for {len(self._playlist_paths)} playlists \33[0m"
         )
 
-        # WARNING: making this run asynchronously will break tqdm; bar will get stuck after 1-2 ticks
-        bar = self.logger.get_synchronous_iterator(
-            self._playlist_paths.values(),
-            desc="Loading playlists",
-            unit="playlists",
-            total=len(self._playlist_paths)
+        self._playlist_stats.clear()
+        playlists = await self._load_playlists_from_paths(
+            list(self._playlist_paths.values()), executor=executor, max_in_flight=max_in_flight
         )
-        self._playlists = {
-            pl.name: pl for pl in sorted([await self.load_playlist(pl) for pl in bar], key=lambda x: x.name.casefold())
-        }
+        self._playlists = {pl.name: pl for pl in sorted(playlists, key=lambda x: x.name.casefold())}
 
         self._log_errors("Could not load the following playlists")
         self.logger.debug(f"Load {self.name} playlists: DONE\n")
@@ -402,13 +880,42 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
                 f"\33[1;94m{len(playlist):>6} total \33[0m"
             )
 
-    async def save_playlists(self, dry_run: bool = True) -> dict[LocalPlaylist, Result]:
+    async def save_playlists(
+            self, dry_run: bool = True, executor: Executor | None = None, max_in_flight: int | None = None
+    ) -> dict[LocalPlaylist, Result]:
         """
         For each Playlist in this Library, saves its associate tracks and its settings (if applicable) to file.
 
         :param dry_run: Run function, but do not modify the file on the disk.
+        :param executor: Optionally, provide a :py:class:`ThreadPoolExecutor` to save playlists concurrently.
+            Playlists are updated in place when saved and so must be saved in the calling process
+            i.e. a :py:class:`ProcessPoolExecutor` cannot be used.
+        :param max_in_flight: The maximum number of playlists to save concurrently.
+            When given without an ``executor``, a :py:class:`ThreadPoolExecutor` with this many workers is used.
+            When neither are given, playlists are saved one after another.
         :return: A map of the playlist name to the results of its sync as a :py:class:`Result` object.
+        :raise MusifyTypeError: If a :py:class:`ProcessPoolExecutor` is given as the ``executor``.
         """
+        if isinstance(executor, ProcessPoolExecutor):
+            raise MusifyTypeError(type(executor).__name__, message="Playlists cannot be saved in a separate process")
+        if executor is None and max_in_flight is not None:
+            with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="save-playlists") as executor:
+                return await self.save_playlists(dry_run=dry_run, executor=executor, max_in_flight=max_in_flight)
+
+        if executor is not None:
+            loop = asyncio.get_running_loop()
+
+            async def _save_playlist_in_executor(pl: LocalPlaylist) -> tuple[LocalPlaylist, Result]:
+                return pl, await loop.run_in_executor(executor, partial(asyncio.run, pl.save(dry_run=dry_run)))
+
+            results = await self.logger.gather_with_progress(
+                map(_save_playlist_in_executor, self.playlists.values()),
+                max_in_flight=max_in_flight,
+                desc="Updating playlists",
+                unit="playlists",
+            )
+            return dict(results)
+
         async def _save_playlist(pl: LocalPlaylist) -> tuple[LocalPlaylist, Result]:
             return pl, await pl.save(dry_run=dry_run)
 
@@ -463,6 +970,8 @@ class LocalLibrary(LocalCollection[LocalTrack], Library[LocalTrack]):
                     track[tag] = track_map[tag]
             count += 1
 
+        if count:
+            self.clear_index()
         return count
 
     @staticmethod
@@ -6,6 +6,7 @@ import hashlib
 import os
 import re
 from collections.abc import Iterable, Mapping, Sequence, Collection, Iterator
+from concurrent.futures import Executor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -13,7 +14,7 @@ from urllib.parse import quote, unquote
 
 from aiorequestful.types import Number
 
-from musify.file.base import File
+from musify.file.base import File, get_file_stat
 from musify.file.exception import FileDoesNotExistError, UnexpectedPathError
 from musify.file.path_mapper import PathMapper, PathStemMapper
 from musify.libraries.local.exception import MusicBeeIDError, XMLReaderError
@@ -55,6 +56,11 @@ class MusicBee(LocalLibrary, File):
         The wrangler is also used when loading tracks to allow them to process URI tags.
         For more info on this, see :py:class:`LocalTrack`.
     :param name: A name to assign to this library.
+    :param track_cache_path: Optionally, provide the path of a database file in which to cache the values
+        extracted from the track files. When given, files that are unchanged since they were last loaded
+        are rebuilt from the cached values without reading the file. See :py:class:`TrackCache` for more info.
+    :param detach_tracks: When True, release the mutagen object for each track after loading to reduce memory usage,
+        loading it again only as and when it is needed. See :py:class:`LocalTrack` for more info.
     """
 
     __slots__ = (
@@ -62,6 +68,8 @@ class MusicBee(LocalLibrary, File):
         "library_xml",
         "_library_xml_path",
         "_library_xml_parser",
+        "_library_xml_stat",
+        "_library_xml_tracks",
         "settings_xml",
         "_settings_xml_path",
         "_settings_xml_parser",
@@ -88,6 +96,8 @@ class MusicBee(LocalLibrary, File):
             path_mapper: PathMapper = PathMapper(),
             remote_wrangler: RemoteDataWrangler = None,
             name: str = None,
+            track_cache_path: str | Path | None = None,
+            detach_tracks: bool = False,
     ):
         required_modules_installed(REQUIRED_MODULES, self)
 
@@ -100,14 +110,14 @@ class MusicBee(LocalLibrary, File):
         if not self._library_xml_path.is_file():
             raise FileDoesNotExistError(self._library_xml_path, "Cannot find MusicBee library file at this path")
 
-        try:
-            self._library_xml_parser = XMLLibraryParser(self._library_xml_path, path_keys=self.xml_library_path_keys)
-            #: A map representation of the loaded XML library data
-            self.library_xml: dict[str, Any] = self._library_xml_parser.parse()
-        except (etree.XMLSyntaxError, XMLReaderError) as exc:
-            raise XMLReaderError(
-                f"Could not read from library file at {self._library_xml_path}. {exc}"
-            ) from exc
+        self._library_xml_parser = XMLLibraryParser(self._library_xml_path, path_keys=self.xml_library_path_keys)
+        #: A map representation of the loaded XML library data
+        self.library_xml: dict[str, Any] = {}
+        # the size and modified time of the library file when it was last parsed
+        self._library_xml_stat: tuple[int, int] | None = None
+        # map of the path of each file track in the library file, with each known prefix removed, to its data
+        self._library_xml_tracks: dict[str, dict[str, Any]] | None = None
+        self._parse_library_xml()
 
         self._settings_xml_path: Path = self.musicbee_folder.joinpath(self.xml_settings_path)
         if not self._settings_xml_path.is_file():
@@ -133,8 +143,21 @@ class MusicBee(LocalLibrary, File):
             path_mapper=path_mapper,
             remote_wrangler=remote_wrangler,
             name=name,
+            track_cache_path=track_cache_path,
+            detach_tracks=detach_tracks,
         )
 
+    def _parse_library_xml(self) -> None:
+        """Parse the MusicBee library file, storing the map representation of its data in ``library_xml``"""
+        try:
+            self._library_xml_stat = get_file_stat(self._library_xml_path)
+            self.library_xml = self._library_xml_parser.parse()
+            self._library_xml_tracks = None
+        except (etree.XMLSyntaxError, XMLReaderError) as exc:
+            raise XMLReaderError(
+                f"Could not read from library file at {self._library_xml_path}. {exc}"
+            ) from exc
+
     def _get_track_from_xml_path(
             self, track_xml: dict[str, Any], track_map: dict[str, LocalTrack]
     ) -> LocalTrack | None:
@@ -170,18 +193,90 @@ class MusicBee(LocalLibrary, File):
 
         return track_xml_map
 
-    async def load_tracks(self) -> None:
-        await super().load_tracks()
+    def _get_library_xml_tracks(self) -> dict[str, dict[str, Any]]:
+        """
+        Map the path of each file track in the library file, with each known prefix removed, to its data.
+        Cached until the library file is next parsed or saved.
+        """
+        if self._library_xml_tracks is not None:
+            return self._library_xml_tracks
+
+        prefixes = {*map(str, self.library_folders), self.library_xml["Music Folder"]}
+        if isinstance(self.path_mapper, PathStemMapper):
+            prefixes.update(self.path_mapper.stem_map.keys())
+
+        self._library_xml_tracks = {}
+        for track_xml in self.library_xml["Tracks"].values():
+            if track_xml["Track Type"] != "File":
+                continue
+            for prefix in prefixes:
+                self._library_xml_tracks.setdefault(track_xml["Location"].removeprefix(prefix).casefold(), track_xml)
+
+        return self._library_xml_tracks
+
+    def _map_tracks_to_xml(self, tracks: Iterable[LocalTrack]) -> dict[LocalTrack, dict[str, Any]]:
+        """Map only the given ``tracks`` to their data in the library file, skipping tracks which are not found"""
+        library_xml_tracks = self._get_library_xml_tracks()
+        folders = list(map(str, self.library_folders))
+
+        track_xml_map: dict[LocalTrack, dict[str, Any]] = {}
+        for track in tracks:
+            path = str(track.path)
+            keys = (path.removeprefix(folder).casefold() for folder in folders)
+            track_xml = next((library_xml_tracks[key] for key in keys if key in library_xml_tracks), None)
+            if track_xml is not None:
+                track_xml_map[track] = track_xml
+
+        return track_xml_map
+
+    def _enrich_tracks(self, tracks: Collection[LocalTrack] | None = None) -> list[LocalTrack]:
+        """
+        Enrich the loaded tracks with the data stored for them in the MusicBee library file.
+
+        :param tracks: Optionally, only enrich these tracks. When not given, enrich all tracks in this library
+            and log the paths in the library file for which no loaded track could be found.
+        :return: The tracks for which the enriched values have changed.
+        """
         self.logger.debug(f"Enrich {self.name} tracks: START")
 
-        for track, track_xml in self._map_track_to_xml().items():
+        track_xml_map = self._map_track_to_xml() if tracks is None else self._map_tracks_to_xml(tracks)
+
+        tracks_updated = []
+        for track, track_xml in track_xml_map.items():
+            values = (track.rating, track.date_added, track.last_played, track.play_count)
+
             track.rating = int(track_xml.get("Rating")) if track_xml.get("Rating") is not None else None
             track.date_added = track_xml.get("Date Added")
             track.last_played = track_xml.get("Play Date UTC")
             track.play_count = track_xml.get("Play Count", 0)
 
-        self._log_errors("Could not find a loaded track for these paths from the MusicBee library file")
+            if values != (track.rating, track.date_added, track.last_played, track.play_count):
+                tracks_updated.append(track)
+
+        if tracks is None:
+            self._log_errors("Could not find a loaded track for these paths from the MusicBee library file")
         self.logger.debug(f"Enrich {self.name} tracks: DONE\n")
+        return tracks_updated
+
+    async def load_tracks(self, executor: Executor | None = None) -> None:
+        await super().load_tracks(executor=executor)
+        self._enrich_tracks()
+
+    async def _refresh_tracks(
+            self, paths_remove: Collection[Path], paths_load: Collection[Path], executor: Executor | None = None
+    ) -> list[LocalTrack]:
+        tracks = await super()._refresh_tracks(paths_remove=paths_remove, paths_load=paths_load, executor=executor)
+
+        library_xml_stat = get_file_stat(self._library_xml_path)
+        if library_xml_stat == self._library_xml_stat:
+            self._enrich_tracks(tracks)
+            return tracks
+
+        # enrich all tracks as the library file has been updated independently of the track files
+        self._parse_library_xml()
+        tracks_updated = self._enrich_tracks()
+        paths_loaded = {track.path for track in tracks}
+        return tracks + [track for track in tracks_updated if track.path not in paths_loaded]
 
     async def save(self, dry_run: bool = True, *_, **__) -> dict[str, Any]:
         """
@@ -233,6 +328,9 @@ class MusicBee(LocalLibrary, File):
 
         self._library_xml_parser.unparse(data=xml, dry_run=dry_run)
         self.library_xml = xml
+        self._library_xml_tracks = None
+        if not dry_run:
+            self._library_xml_stat = get_file_stat(self._library_xml_path)
 
         self.logger.debug(f"Save {self.name} library file: DONE")
         return self.library_xml
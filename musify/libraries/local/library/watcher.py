@@ -0,0 +1,371 @@
+"""
+Watches the folders of a loaded :py:class:`LocalLibrary` for changes to its files, keeping the library up to date.
+"""
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import struct
+import sys
+from collections.abc import Collection
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Self
+
+from musify.file.base import IGNORE_FOLDERS
+from musify.libraries.local.library.library import LocalLibrary, RefreshResult
+from musify.logger import MusifyLogger
+
+# flags and event masks as defined in the Linux inotify API, see: https://man7.org/linux/man-pages/man7/inotify.7.html
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = os.O_CLOEXEC
+IN_NONBLOCK = os.O_NONBLOCK
+
+
+class _Inotify:
+    """
+    Minimal wrapper around the Linux inotify API for watching folders recursively.
+
+    :raise OSError: If inotify is not available on this system or cannot be initialised.
+    """
+
+    __slots__ = ("logger", "fd", "_libc", "_watches")
+
+    #: The struct format of the fixed size header of each event read from the inotify file descriptor.
+    event_format = struct.Struct("iIII")
+    #: The events to watch for on each folder.
+    mask = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_ONLYDIR
+
+    def __init__(self):
+        if not sys.platform.startswith("linux"):
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+
+        # noinspection PyTypeChecker
+        #: The :py:class:`MusifyLogger` for this  object
+        self.logger: MusifyLogger = logging.getLogger(__name__)
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "inotify is not available in the C library of this system")
+
+        #: The file descriptor of the inotify instance.
+        self.fd: int = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, os.strerror(code))
+
+        # map of watch descriptor to the folder it watches
+        self._watches: dict[int, Path] = {}
+
+    def add(self, folder: str | Path) -> None:
+        """
+        Watch the given ``folder`` and all its sub-folders for changes.
+
+        :raise OSError: If a folder cannot be watched e.g. when the limit of watches for the user has been reached.
+        """
+        for root, folders, _ in os.walk(folder):
+            folders[:] = [fldr for fldr in folders if fldr not in IGNORE_FOLDERS]
+
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(root), self.mask)
+            if wd < 0:
+                code = ctypes.get_errno()
+                if code in (errno.ENOENT, errno.ENOTDIR):  # folder removed while walking
+                    continue
+                raise OSError(code, os.strerror(code), root)
+
+            self._watches[wd] = Path(root)
+
+    def read(self) -> tuple[set[Path], bool]:
+        """
+        Read all pending events, watching any new folders found in these events.
+
+        :return: The paths of the files and folders which have changed,
+            and whether events were lost due to the event queue overflowing or a new folder not being watched.
+        """
+        paths: set[Path] = set()
+        overflow = False
+
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = self.event_format.unpack_from(data, offset)
+                offset += self.event_format.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                if mask & IN_IGNORED:  # folder was deleted or moved
+                    self._watches.pop(wd, None)
+                    continue
+
+                folder = self._watches.get(wd)
+                if folder is None:
+                    continue
+
+                path = folder.joinpath(os.fsdecode(name)) if name else folder
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and path.name not in IGNORE_FOLDERS:
+                    overflow |= not self._add_new_folder(path)
+                paths.add(path)
+
+        return paths, overflow
+
+    def _add_new_folder(self, folder: Path) -> bool:
+        """
+        Watch a new ``folder`` found in the events read, logging any error raised.
+
+        :return: True if the folder is now watched, False if it could not be watched and the folders must be rescanned.
+        """
+        try:
+            self.add(folder)
+        except OSError as ex:  # e.g. limit of watches reached, changes in this folder would be missed
+            self.logger.warning(f"Cannot watch new folder with inotify, rescanning folders: {ex}")
+            return False
+        return True
+
+    def close(self) -> None:
+        """Close the inotify instance, removing all watches"""
+        os.close(self.fd)
+        self._watches.clear()
+
+
+class LibraryWatcher:
+    """
+    Watches the library and playlist folders of a loaded :py:class:`LocalLibrary` for changes to its files,
+    applying these changes to the library's tracks and playlists in batches.
+
+    On Linux, changes are detected using inotify. Otherwise, or if inotify cannot be used
+    e.g. when the limit of watches for the user has been reached, the folders are polled for changes instead.
+    Changes are applied by calling :py:meth:`.LocalLibrary.refresh` once no further changes
+    have been detected for ``debounce`` seconds.
+
+    Iterate over this object asynchronously to get the :py:class:`RefreshResult` of each batch of changes
+    which changed the library. Results are queued until they are consumed.
+    Errors raised when applying a batch of changes are logged and the batch is retried with the next batch of changes.
+    The watcher only stops when :py:meth:`stop` is called.
+
+    :param library: The loaded library to keep up to date.
+    :param debounce: The time in seconds to wait for no further changes before applying a batch of changes.
+    :param poll_interval: The time in seconds between each scan of the folders when polling for changes.
+    :param use_polling: When True, always poll for changes instead of using inotify.
+    :param executor: Optionally, provide an :py:class:`Executor` to extract metadata from the track files
+        in parallel. See :py:meth:`.LocalLibrary.load_tracks` for more info.
+    """
+
+    __slots__ = (
+        "logger",
+        "library",
+        "debounce",
+        "poll_interval",
+        "use_polling",
+        "executor",
+        "_inotify",
+        "_task",
+        "_results",
+        "_changed",
+        "_pending",
+        "_overflow",
+    )
+
+    @property
+    def running(self) -> bool:
+        """Whether this watcher is currently watching for changes"""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def polling(self) -> bool:
+        """Whether this watcher is polling for changes instead of using inotify"""
+        return self._inotify is None
+
+    @property
+    def folders(self) -> list[Path]:
+        """The folders to watch for changes"""
+        folders = list(self.library.library_folders)
+        playlist_folder = self.library.playlist_folder
+        if playlist_folder is not None and not any(playlist_folder.is_relative_to(fldr) for fldr in folders):
+            folders.append(playlist_folder)
+        return folders
+
+    def __init__(
+            self,
+            library: LocalLibrary,
+            debounce: float = 1,
+            poll_interval: float = 60,
+            use_polling: bool = False,
+            executor: Executor | None = None,
+    ):
+        # noinspection PyTypeChecker
+        #: The :py:class:`MusifyLogger` for this  object
+        self.logger: MusifyLogger = logging.getLogger(__name__)
+
+        #: The loaded library to keep up to date.
+        self.library = library
+        #: The time in seconds to wait for no further changes before applying a batch of changes.
+        self.debounce = debounce
+        #: The time in seconds between each scan of the folders when polling for changes.
+        self.poll_interval = poll_interval
+        #: When True, always poll for changes instead of using inotify.
+        self.use_polling = use_polling
+        #: An optional :py:class:`Executor` to extract metadata from the track files in parallel.
+        self.executor = executor
+
+        self._inotify: _Inotify | None = None
+        self._task: asyncio.Task | None = None
+        self._results: asyncio.Queue[RefreshResult | None] = asyncio.Queue()
+
+        # set when new events are read from inotify, storing the changed paths until they are applied
+        self._changed = asyncio.Event()
+        self._pending: set[Path] = set()
+        self._overflow: bool = False
+
+    async def __aenter__(self) -> Self:
+        await self.start()
+        return self
+
+    async def __aexit__(self, __exc_type, __exc_value, __traceback) -> None:
+        await self.stop()
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> RefreshResult:
+        if not self.running and self._results.empty():
+            raise StopAsyncIteration
+
+        result = await self._results.get()
+        if result is not None:
+            return result
+
+        if self._task is not None and not self._task.cancelled() and self._task.exception() is not None:
+            raise self._task.exception()
+        raise StopAsyncIteration
+
+    async def start(self) -> None:
+        """Start watching the library folders for changes in the background"""
+        if self.running:
+            return
+
+        if not self.use_polling:
+            self._start_inotify()
+
+        if self._inotify is not None:
+            asyncio.get_running_loop().add_reader(self._inotify.fd, self._read_events)
+
+        self.logger.debug(
+            f"Watching {self.library.name} library for changes "
+            f"{"by polling" if self.polling else "with inotify"}: {", ".join(map(str, self.folders))}"
+        )
+        self._task = asyncio.create_task(self._run())
+
+    def _start_inotify(self) -> None:
+        """Watch all folders with inotify, falling back to polling if inotify is not available"""
+        try:
+            self._inotify = _Inotify()
+            for folder in self.folders:
+                self._inotify.add(folder)
+        except OSError as ex:
+            self.logger.warning(f"Cannot watch {self.library.name} library with inotify, polling instead: {ex}")
+            if self._inotify is not None:
+                self._inotify.close()
+            self._inotify = None
+
+    async def stop(self) -> None:
+        """Stop watching the library folders for changes"""
+        if self._inotify is not None:
+            asyncio.get_running_loop().remove_reader(self._inotify.fd)
+            self._inotify.close()
+            self._inotify = None
+
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self.logger.debug(f"Stopped watching {self.library.name} library for changes")
+
+    def _read_events(self) -> None:
+        """Read all pending inotify events, signalling the watcher when paths have changed"""
+        paths, overflow = self._inotify.read()
+        self._pending.update(paths)
+        self._overflow |= overflow
+
+        if paths or overflow:
+            self._changed.set()
+
+    async def _wait_for_events(self) -> Collection[Path] | None:
+        """
+        Wait for changes to be detected by inotify and for these changes to settle.
+
+        :return: The paths which have changed, or None if events were lost and the folders must be scanned again.
+        """
+        await self._changed.wait()
+        while True:  # wait for no further changes for the debounce period before applying the batch
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout=self.debounce)
+            except TimeoutError:
+                break
+
+        paths = None if self._overflow else self._pending.copy()
+        self._pending.clear()
+        self._overflow = False
+
+        return paths
+
+    async def _run(self) -> None:
+        """Apply changes to the library as they are detected until cancelled"""
+        try:
+            while True:
+                if self._inotify is not None:
+                    paths = await self._wait_for_events()
+                else:
+                    await asyncio.sleep(self.poll_interval)
+                    paths = None
+
+                try:
+                    result = await self.library.refresh(executor=self.executor, paths=paths)
+                except Exception as ex:
+                    self._retry(paths, ex)
+                    continue
+
+                if any((
+                        result.added, result.removed, result.modified, result.playlists_loaded, result.playlists_removed
+                )):
+                    self._results.put_nowait(result)
+        finally:
+            self._results.put_nowait(None)
+
+    def _retry(self, paths: Collection[Path] | None, error: Exception) -> None:
+        """Log the ``error`` raised when refreshing the given ``paths`` and retry them with the next batch of changes"""
+        self.logger.error(
+            f"Failed to apply changes to {self.library.name} library, retrying with the next changes: "
+            f"{error.__class__.__name__}: {error}"
+        )
+
+        if paths is None:
+            self._overflow = True
+        else:
+            self._pending.update(paths)
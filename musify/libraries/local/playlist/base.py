@@ -2,7 +2,7 @@
 Base implementation for the functionality of a local playlist.
 """
 from abc import ABCMeta, abstractmethod
-from collections.abc import Collection, Generator
+from collections.abc import Collection, Generator, Mapping
 from pathlib import Path
 from typing import Any, Self
 
@@ -100,14 +100,21 @@ class LocalPlaylist[T: Filter[LocalTrack]](File, LocalCollection[LocalTrack], Pl
     def __await__(self) -> Generator[Any, None, Self]:
         return self.load().__await__()
 
-    def _match(self, tracks: Collection[LocalTrack] = (), reference: LocalTrack | None = None) -> None:
+    def _match(
+            self,
+            tracks: Collection[LocalTrack] = (),
+            reference: LocalTrack | None = None,
+            tracks_by_path: Mapping[Path, LocalTrack] | None = None,
+    ) -> None:
         if self.matcher is None or not tracks:
             return
 
         if not self.matcher.ready:  # just return the tracks given if matcher has no settings applied
             self.tracks: list[LocalTrack] = list(tracks)
         else:  # run matcher
-            self.tracks: list[LocalTrack] = list(self.matcher(values=tracks, reference=reference))
+            self.tracks: list[LocalTrack] = list(
+                self.matcher(values=tracks, reference=reference, transformed=tracks_by_path)
+            )
 
     def _limit(self, ignore: Collection[str | LocalTrack]) -> None:
         if self.limiter is not None and self.tracks is not None:
@@ -120,11 +127,16 @@ class LocalPlaylist[T: Filter[LocalTrack]](File, LocalCollection[LocalTrack], Pl
             self.sorter(items=self.tracks)
 
     @abstractmethod
-    async def load(self, tracks: Collection[LocalTrack] = ()) -> Self:
+    async def load(
+            self, tracks: Collection[LocalTrack] = (), tracks_by_path: Mapping[Path, LocalTrack] | None = None
+    ) -> Self:
         """
         Read the playlist file and update the tracks in this playlist instance.
 
         :param tracks: Available Tracks to search through for matches.
+        :param tracks_by_path: Optionally, provide a map of ``{<path>: <track>}`` for all the given ``tracks``
+            where each path is the path of the track as mapped by this playlist's ``path_mapper``.
+            When given, paths in the playlist are matched to tracks by looking them up in this map.
         :return: Self
         """
         raise NotImplementedError
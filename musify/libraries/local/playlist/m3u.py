@@ -2,7 +2,7 @@
 The M3U implementation of a :py:class:`LocalPlaylist`.
 """
 import asyncio
-from collections.abc import Collection
+from collections.abc import Collection, Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Self
@@ -78,13 +78,18 @@ class M3U(LocalPlaylist[FilterDefinedList[str | Path | File]]):
         path = self.path_mapper.map(path, check_existence=True)
         return await load_track(path=path, remote_wrangler=self.remote_wrangler)
 
-    async def load(self, tracks: Collection[LocalTrack] = ()) -> Self:
+    async def load(
+            self, tracks: Collection[LocalTrack] = (), tracks_by_path: Mapping[Path, LocalTrack] | None = None
+    ) -> Self:
         """
         Read the playlist file and update the tracks in this playlist instance.
 
         :param tracks: Available Tracks to search through for matches.
             If no tracks are given, the playlist instance will load all the tracks
             from scratch according to its settings.
+        :param tracks_by_path: Optionally, provide a map of ``{<path>: <track>}`` for all the given ``tracks``
+            where each path is the path of the track as mapped by this playlist's ``path_mapper``.
+            When given, paths in the playlist are matched to tracks by looking them up in this map.
         :return: Self
         """
         path_list: list[Path] = []
@@ -102,7 +107,7 @@ class M3U(LocalPlaylist[FilterDefinedList[str | Path | File]]):
         self.matcher.transform = lambda x: Path(self.path_mapper.map(x, check_existence=False))
 
         if tracks:  # match paths from given tracks using the matcher
-            self._match(tracks)
+            self._match(tracks, tracks_by_path=tracks_by_path)
         else:  # use the paths in the matcher to load tracks from scratch
             self.tracks = await asyncio.gather(
                 *map(self._load_track, filter(lambda path: path is not None, self.matcher.values))
@@ -4,7 +4,7 @@ Utilities for operations on :py:class:`LocalPlaylist` types.
 Generally, this will contain global variables representing all supported playlist file types
 and a utility function for loading the appropriate :py:class:`LocalPlaylist` type for a path based on its extension.
 """
-from collections.abc import Collection
+from collections.abc import Collection, Mapping
 from pathlib import Path
 
 from musify.file.exception import InvalidFileType
@@ -29,6 +29,7 @@ async def load_playlist(
         tracks: Collection[LocalTrack] = (),
         path_mapper: PathMapper = PathMapper(),
         remote_wrangler: RemoteDataWrangler = None,
+        tracks_by_path: Mapping[Path, LocalTrack] | None = None,
 ) -> LocalPlaylist:
     """
     Attempt to load a file from a given path, returning the appropriate :py:class:`LocalPlaylist` object
@@ -45,13 +46,16 @@ async def load_playlist(
         If given, the wrangler can be used when calling __get_item__ to get an item from the collection from its URI.
         The wrangler is also used when loading tracks to allow them to process URI tags.
         For more info on this, see :py:class:`LocalTrack`.
+    :param tracks_by_path: Optionally, provide a map of ``{<path>: <track>}`` for all the given ``tracks``
+        where each path is the path of the track as mapped by the given ``path_mapper``.
+        When given, paths in the playlist are matched to tracks by looking them up in this map.
     :return: Loaded :py:class:`LocalPlaylist` object
     :raise InvalidFileType: If the file type is not supported.
     """
-    ext = Path(path).suffix
+    ext = Path(path).suffix.lower()
     if ext not in PLAYLIST_FILETYPES:
         raise InvalidFileType(ext, f"Not an accepted extension. Use only: {', '.join(PLAYLIST_FILETYPES)}")
 
     cls = next(cls for cls in PLAYLIST_CLASSES if ext in cls.valid_extensions)
     playlist = cls(path=path, path_mapper=path_mapper, remote_wrangler=remote_wrangler)
-    return await playlist.load(tracks=tracks)
+    return await playlist.load(tracks=tracks, tracks_by_path=tracks_by_path)
@@ -133,12 +133,17 @@ class XAutoPF(LocalPlaylist[AutoMatcher]):
         self._parser: XMLPlaylistParser | None = None
         self._limiter_deduplication: bool = False
 
-    async def load(self, tracks: Collection[LocalTrack] = ()) -> Self:
+    async def load(
+            self, tracks: Collection[LocalTrack] = (), tracks_by_path: Mapping[Path, LocalTrack] | None = None
+    ) -> Self:
         """
         Read the playlist file and update the tracks in this playlist instance.
 
         :param tracks: Available Tracks to search through for matches.
             If no tracks are given, the playlist will be loaded empty.
+        :param tracks_by_path: Optionally, provide a map of ``{<path>: <track>}`` for all the given ``tracks``
+            where each path is the path of the track as mapped by this playlist's ``path_mapper``.
+            When given, paths in the playlist are matched to tracks by looking them up in this map.
         :return: Self
         """
         self._parser = XMLPlaylistParser(path=self.path, path_mapper=self.path_mapper)
@@ -155,10 +160,12 @@ class XAutoPF(LocalPlaylist[AutoMatcher]):
         self.sorter = self._parser.get_sorter()
         self._limiter_deduplication = self._parser.limiter_deduplication
 
-        tracks_list = list(tracks)
-        self.sorter.sort_by_field(tracks_list, field=Fields.LAST_PLAYED, reverse=True)
+        # get the last played track as reference in case comparer is looking for the playing tracks as reference
+        reference = max(
+            tracks, key=lambda t: t.last_played.timestamp() if t.last_played is not None else 0.0, default=None
+        )
 
-        self._match(tracks=tracks, reference=tracks_list[0] if len(tracks) > 0 else None)
+        self._match(tracks=tracks, reference=reference, tracks_by_path=tracks_by_path)
         self._limit(ignore=self.matcher.exclude)
         self._sort()
 
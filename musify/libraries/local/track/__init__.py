@@ -3,10 +3,11 @@ Operations relating to reading and writing tags/metadata/properties to various t
 
 Specific audio file types should implement :py:class:`LocalTrack`.
 """
-from ._tags.writer import SyncResultTrack
+from ._tags.writer import SyncResultTrack, PaddingPolicy
+from .cache import TrackCache
 from .flac import FLAC
 from .m4a import M4A
 from .mp3 import MP3
 from .track import LocalTrack
-from .utils import TRACK_CLASSES, TRACK_FILETYPES, load_track
+from .utils import TRACK_CLASSES, TRACK_FILETYPES, load_track, extract_track_values, build_track_from_values
 from .wma import WMA
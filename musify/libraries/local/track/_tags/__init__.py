@@ -3,4 +3,4 @@ Base classes implementing the core functionality of a :py:class:`LocalTrack`.
 """
 from .base import TagProcessor
 from .reader import TagReader
-from .writer import TagWriter, SyncResultTrack
+from .writer import TagWriter, SyncResultTrack, PaddingPolicy
@@ -14,7 +14,9 @@ class TagProcessor[T: mutagen.FileType](metaclass=ABCMeta):
     """
     Base tag processor for reading/writing of tag metadata to a file.
 
-    :param file: The loaded Mutagen object of the file to extract tags from.
+    Processors hold no state relating to any one file and the loaded Mutagen object of the file
+    to process is instead given on each call, allowing a single processor to be shared by all tracks of the same type.
+
     :param tag_map: The map of tag names to tag IDs for the given file type.
     :param remote_wrangler: Optionally, provide a :py:class:`RemoteDataWrangler` object for processing URIs.
         This object will be used to check for and validate a URI tag on the file.
@@ -22,7 +24,7 @@ class TagProcessor[T: mutagen.FileType](metaclass=ABCMeta):
         If no ``remote_wrangler`` is given, no URI processing will occur.
     """
 
-    __slots__ = ("file", "tag_map", "remote_wrangler")
+    __slots__ = ("tag_map", "remote_wrangler")
 
     #: The tag field to use as the URI tag in the file's metadata
     uri_tag: LocalTrackField = LocalTrackField.COMMENTS
@@ -44,7 +46,6 @@ class TagProcessor[T: mutagen.FileType](metaclass=ABCMeta):
         """
         return self.remote_wrangler.unavailable_uri_dummy if self.remote_wrangler else None
 
-    def __init__(self, file: T, tag_map: TagMap, remote_wrangler: RemoteDataWrangler | None = None):
-        self.file = file
+    def __init__(self, tag_map: TagMap, remote_wrangler: RemoteDataWrangler | None = None):
         self.tag_map = tag_map
         self.remote_wrangler = remote_wrangler
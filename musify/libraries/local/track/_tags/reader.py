@@ -25,11 +25,11 @@ class TagReader[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
 
     __slots__ = ()
 
-    def read_tag(self, tag_ids: Iterable[str]) -> list[Any] | None:
+    def read_tag(self, file: T, tag_ids: Iterable[str]) -> list[Any] | None:
         """Extract all tag values from file for a given list of tag IDs"""
         values = []
         for tag_id in tag_ids:
-            value = self.file.get(tag_id)
+            value = file.get(tag_id)
             if value is None or (isinstance(value, str) and len(value.strip()) == 0):
                 # skip null or empty/blank strings
                 continue
@@ -45,59 +45,59 @@ class TagReader[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
 
         return values if len(values) > 0 else None
 
-    def read_title(self) -> str | None:
+    def read_title(self, file: T) -> str | None:
         """Extract track title tags from file"""
-        values = self.read_tag(self.tag_map.title)
+        values = self.read_tag(file, self.tag_map.title)
         return str(values[0]) if values is not None else None
 
-    def read_artist(self) -> str | None:
+    def read_artist(self, file: T) -> str | None:
         """Extract artist tags from file"""
-        values = self.read_tag(self.tag_map.artist)
+        values = self.read_tag(file, self.tag_map.artist)
         return str(values[0]) if values is not None else None
 
-    def read_album(self) -> str | None:
+    def read_album(self, file: T) -> str | None:
         """Extract album tags from file"""
-        values = self.read_tag(self.tag_map.album)
+        values = self.read_tag(file, self.tag_map.album)
         return str(values[0]) if values is not None else None
 
-    def read_album_artist(self) -> str | None:
+    def read_album_artist(self, file: T) -> str | None:
         """Extract album artist tags from file"""
-        values = self.read_tag(self.tag_map.album_artist)
+        values = self.read_tag(file, self.tag_map.album_artist)
         return str(values[0]) if values is not None else None
 
-    def read_track_number(self) -> int | None:
+    def read_track_number(self, file: T) -> int | None:
         """Extract track number tags from file"""
-        values = self.read_tag(self.tag_map.track_number)
+        values = self.read_tag(file, self.tag_map.track_number)
         if values is None:
             return
 
         value = str(values[0])
         return int(value.split(self.num_sep)[0]) if self.num_sep in value else int(value)
 
-    def read_track_total(self) -> int | None:
+    def read_track_total(self, file: T) -> int | None:
         """Extract total track count tags from file"""
-        values = self.read_tag(self.tag_map.track_total)
+        values = self.read_tag(file, self.tag_map.track_total)
         if values is None:
             return
 
         value = str(values[0])
         return int(value.split(self.num_sep)[1]) if self.num_sep in value else int(value)
 
-    def read_genres(self) -> list[str] | None:
+    def read_genres(self, file: T) -> list[str] | None:
         """Extract genre tags from file"""
-        values = self.read_tag(self.tag_map.genres)
+        values = self.read_tag(file, self.tag_map.genres)
         return list(map(str, values)) if values is not None else None
 
-    def read_date(self) -> tuple[int | None, int | None, int | None] | None:
+    def read_date(self, file: T) -> tuple[int | None, int | None, int | None] | None:
         """Extract year tags from file"""
-        values = self.read_tag(self.tag_map.date)
+        values = self.read_tag(file, self.tag_map.date)
 
         if values is None:  # attempt to read each part individually
-            year = self.read_tag(self.tag_map.year)
+            year = self.read_tag(file, self.tag_map.year)
             year = int(re.match(r"(\d{4})", str(year[0])).group(1)) if year else None
-            month = self.read_tag(self.tag_map.month)
+            month = self.read_tag(file, self.tag_map.month)
             month = int(re.match(r"(\d{1,2})", str(month[0])).group(1)) if month else None
-            day = self.read_tag(self.tag_map.day)
+            day = self.read_tag(file, self.tag_map.day)
             day = int(re.match(r"(\d{1,2})", str(day[0])).group(1)) if day else None
             return year, month, day
         elif 0 < len(values) <= 3 and all(str(value).isdigit() for value in values):
@@ -128,58 +128,58 @@ class TagReader[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
         if match:
             return int(match.group(1)), None, None
 
-    def read_bpm(self) -> float | None:
+    def read_bpm(self, file: T) -> float | None:
         """Extract BPM tags from file"""
-        values = self.read_tag(self.tag_map.bpm)
+        values = self.read_tag(file, self.tag_map.bpm)
         try:
             return float(values[0]) if values is not None else None
         except ValueError:
             return None
 
-    def read_key(self) -> str | None:
+    def read_key(self, file: T) -> str | None:
         """Extract key tags from file"""
-        values = self.read_tag(self.tag_map.key)
+        values = self.read_tag(file, self.tag_map.key)
         return str(values[0]) if values is not None else None
 
-    def read_disc_number(self) -> int | None:
+    def read_disc_number(self, file: T) -> int | None:
         """Extract disc number tags from file"""
-        values = self.read_tag(self.tag_map.disc_number)
+        values = self.read_tag(file, self.tag_map.disc_number)
         if values is None:
             return
 
         value = str(values[0])
         return int(value.split(self.num_sep)[0]) if self.num_sep in value else int(value)
 
-    def read_disc_total(self) -> int | None:
+    def read_disc_total(self, file: T) -> int | None:
         """Extract total disc count tags from file"""
-        values = self.read_tag(self.tag_map.disc_total)
+        values = self.read_tag(file, self.tag_map.disc_total)
         if values is None:
             return
 
         value = str(values[0])
         return int(value.split(self.num_sep)[1]) if self.num_sep in value else int(value)
 
-    def read_compilation(self) -> bool | None:
+    def read_compilation(self, file: T) -> bool | None:
         """Extract compilation tags from file"""
-        values = self.read_tag(self.tag_map.compilation)
+        values = self.read_tag(file, self.tag_map.compilation)
         try:
             return bool(int(values[0])) if values is not None else None
         except ValueError:
             return None
 
-    def read_comments(self) -> list[str] | None:
+    def read_comments(self, file: T) -> list[str] | None:
         """Extract comment tags from file"""
-        values = self.read_tag(self.tag_map.comments)
+        values = self.read_tag(file, self.tag_map.comments)
         return set(map(str, values)) if values is not None else None
 
-    def read_uri(self) -> str | None:
+    def read_uri(self, file: T) -> str | None:
         """Extract data relating to remote URI value from file"""
         wrangler = self.remote_wrangler
         if not wrangler:
             return
 
         read_method = getattr(self, f"read_{self.uri_tag.name.lower()}")
-        possible_values: tuple[str, ...] | None = to_collection(read_method())
+        possible_values: tuple[str, ...] | None = to_collection(read_method(file))
         if not possible_values:
             return None
 
@@ -192,10 +192,10 @@ class TagReader[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
         return None
 
     @abstractmethod
-    def read_images(self) -> ImageType:
+    def read_images(self, file: T) -> ImageType:
         """Extract image from file"""
         raise NotImplementedError
 
-    def check_for_images(self) -> bool:
+    def check_for_images(self, file: T) -> bool:
         """Check if file has embedded images"""
-        return self.read_tag(self.tag_map.images) is not None
+        return self.read_tag(file, self.tag_map.images) is not None
@@ -23,6 +23,34 @@ class SyncResultTrack(Result):
     saved: bool
     #: Map of the tag updated and the index of the condition it satisfied to be updated.
     updated: MutableMapping[Tags, int]
+    #: Was the whole file rewritten on the disk as the tags did not fit in the padding available in the file.
+    rewritten: bool = False
+
+
+@dataclass(frozen=True)
+class PaddingPolicy:
+    """
+    Policy for the amount of padding to reserve after the tags in a file when saving.
+
+    The existing padding is kept wherever the updated tags fit in it, allowing the tags to be updated in place.
+    When the updated tags no longer fit, the whole file must be rewritten
+    and padding is reserved generously so that later updates may be written in place.
+    """
+    #: The minimum amount of padding in bytes to reserve when the file needs to be rewritten.
+    reserve: int = 64 * 1024
+    #: The amount of padding to reserve when the file needs to be rewritten as a ratio
+    #: of the size of the data following the padding i.e. the audio data. Added to ``reserve``.
+    reserve_ratio: float = 0.01
+    #: The maximum amount of padding to keep in bytes.
+    #: Files with more padding than this are rewritten with the padding given by ``reserve`` and ``reserve_ratio``.
+    #: When None, the existing padding is always kept wherever the tags fit.
+    max_padding: int | None = None
+
+    def __call__(self, info: mutagen.PaddingInfo) -> int:
+        """Get the amount of padding to use in bytes for the file which the given padding ``info`` represents"""
+        if info.padding >= 0 and (self.max_padding is None or info.padding <= self.max_padding):
+            return info.padding
+        return self.reserve + int(info.size * self.reserve_ratio)
 
 
 class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
@@ -33,12 +61,21 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
     #: The date format to use when saving string representations of dates to tag values
     date_format = "%Y-%m-%d"
 
-    def delete_tags(self, tags: UnitIterable[Tags] = (), dry_run: bool = True) -> SyncResultTrack:
+    def delete_tags(
+            self,
+            file: T,
+            tags: UnitIterable[Tags] = (),
+            dry_run: bool = True,
+            padding: PaddingPolicy | None = None,
+    ) -> SyncResultTrack:
         """
         Remove tags from file.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param tags: Tags to remove.
         :param dry_run: Run function, but do not modify the file on the disk.
+        :param padding: The :py:class:`PaddingPolicy` to use when saving the file.
+            When None, use the default padding as determined by mutagen.
         :return: List of tags that have been removed.
         """
         if tags is None or (isinstance(tags, Collection) and len(tags) == 0):
@@ -47,20 +84,41 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
         tag_names = set(Tags.to_tags(tags))
         removed = set()
         for tag_name in tag_names:
-            if self._clear_tag(tag_name, dry_run):
+            if self._clear_tag(file, tag_name, dry_run):
                 removed.update(Tags.from_name(tag_name))
 
         save = not dry_run and len(removed) > 0
-        if save:
-            self.file.save()
+        rewritten = self._save_file(file, padding=padding) if save else False
 
         removed = sorted(removed, key=lambda x: Tags.all().index(x))
-        return SyncResultTrack(saved=save, updated={u: 0 for u in removed})
+        return SyncResultTrack(saved=save, updated={u: 0 for u in removed}, rewritten=rewritten)
+
+    @staticmethod
+    def _save_file(file: T, padding: PaddingPolicy | None = None) -> bool:
+        """
+        Save the tags of the given ``file`` to the disk.
 
-    def _clear_tag(self, tag_name: str, dry_run: bool = True) -> bool:
+        :param file: The loaded Mutagen object of the file to save.
+        :param padding: The :py:class:`PaddingPolicy` to use when saving the file.
+            When None, use the default padding as determined by mutagen.
+        :return: True if the whole file was rewritten as the tags did not fit in the padding available in the file.
+        """
+        rewritten = False
+
+        def _get_padding(info: mutagen.PaddingInfo) -> int:
+            nonlocal rewritten
+            value = padding(info) if padding is not None else info.get_default_padding()
+            rewritten = rewritten or value != info.padding
+            return value
+
+        file.save(padding=_get_padding)
+        return rewritten
+
+    def _clear_tag(self, file: T, tag_name: str, dry_run: bool = True) -> bool:
         """
         Remove a tag by its tag name from the loaded file object in memory.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param tag_name: Tag name as found in :py:class:`TagMap` to remove.
         :param dry_run: Run function, but do not modify the loaded file in memory.
         :return: True if tag has been remove, False otherwise.
@@ -72,14 +130,14 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
             return removed
 
         for tag_id in tag_ids:
-            if tag_id in self.file and self.file[tag_id]:
+            if tag_id in file and file[tag_id]:
                 if not dry_run:
-                    del self.file[tag_id]
+                    del file[tag_id]
                 removed = True
 
         return removed
 
-    def clear_loaded_images(self) -> bool:
+    def clear_loaded_images(self, file: T) -> bool:
         """
         Clear the loaded embedded images for this track.
         Does not alter the actual file in any way, only the loaded object in memory.
@@ -87,27 +145,32 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
         tag_names = Tags.IMAGES.to_tag()
         removed = False
         for tag_name in tag_names:
-            removed = removed or self._clear_tag(tag_name, dry_run=False)
+            removed = removed or self._clear_tag(file, tag_name, dry_run=False)
 
         return removed
 
     def write(
             self,
+            file: T,
             source: Track,
             target: Track,
             tags: UnitIterable[Tags] = Tags.ALL,
             replace: bool = False,
-            dry_run: bool = True
-    ):
+            dry_run: bool = True,
+            padding: PaddingPolicy | None = None,
+    ) -> SyncResultTrack:
         """
         Write the tags from the ``target`` track to the ``source`` track.
         Filter the tags written by supplying ``tags``.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param source: The source track i.e. the track object representing the currently saved file on the drive.
         :param target: The target track i.e. the track object containing new tags with which to update the file.
         :param tags: The tags to be updated.
         :param replace: Destructively overwrite the tag on the file if the ``source`` and ``target`` tags differ.
         :param dry_run: Run function, but do not modify the file on the disk.
+        :param padding: The :py:class:`PaddingPolicy` to use when saving the file.
+            When None, use the default padding as determined by mutagen.
         :return: The index number of the conditional that was met to warrant updating the file's tags.
             None if none of the conditions were met.
         """
@@ -132,7 +195,7 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
         updated = {}
         for tag in tags:
             method: Callable[Any, Mapping[Tags, int] | int | None] = getattr(self, f"write_{tag.name.lower()}")
-            result = method(source=source, target=target, replace=replace, dry_run=dry_run)
+            result = method(file, source=source, target=target, replace=replace, dry_run=dry_run)
             if result is None:
                 continue
 
@@ -142,15 +205,15 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
                 updated[tag] = result
 
         save = not dry_run and len(updated) > 0
-        if save:
-            self.file.save()
+        rewritten = self._save_file(file, padding=padding) if save else False
 
-        return SyncResultTrack(saved=save, updated=updated)
+        return SyncResultTrack(saved=save, updated=updated, rewritten=rewritten)
 
-    def write_tag(self, tag_id: str | None, tag_value: Any, dry_run: bool = True) -> bool | None:
+    def write_tag(self, file: T, tag_id: str | None, tag_value: Any, dry_run: bool = True) -> bool | None:
         """
         Generic method for updating a tag value in the file.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param tag_id: ID of the tag for this file type.
         :param tag_value: New value to assign.
         :param dry_run: Run function, but do not modify the file on the disk.
@@ -161,22 +224,25 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
             return False
 
         if tag_value is None:
-            if not dry_run and tag_id in self.file and self.file[tag_id] is not None:
-                del self.file[tag_id]
+            if not dry_run and tag_id in file and file[tag_id] is not None:
+                del file[tag_id]
                 return True
             return False
 
-        return self._write_tag(tag_id=tag_id, tag_value=tag_value, dry_run=dry_run)
+        return self._write_tag(file, tag_id=tag_id, tag_value=tag_value, dry_run=dry_run)
 
     @abstractmethod
-    def _write_tag(self, tag_id: str | None, tag_value: Any, dry_run: bool = True) -> bool:
+    def _write_tag(self, file: T, tag_id: str | None, tag_value: Any, dry_run: bool = True) -> bool:
         """Implementation of tag writer specific to this file type."""
         raise NotImplementedError
 
-    def write_title(self, source: Track, target: Track, replace: bool = False, dry_run: bool = True) -> int | None:
+    def write_title(
+            self, file: T, source: Track, target: Track, replace: bool = False, dry_run: bool = True
+    ) -> int | None:
         """
         Write track title tags to file if appropriate related conditions are met.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param source: The source track i.e. the track object representing the currently saved file on the drive.
         :param target: The target track i.e. the track object containing new tags with which to update the file.
         :param replace: Destructively overwrite the tag on the file if the ``source`` and ``target`` tags differ.
@@ -189,23 +255,27 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
             source.title is None and target.title is not None,
             replace and source.title != target.title
         ]
-        if any(conditionals) and self._write_title(track=target, dry_run=dry_run):
+        if any(conditionals) and self._write_title(file, track=target, dry_run=dry_run):
             return next(i for i, c in enumerate(conditionals) if c)
 
-    def _write_title(self, track: Track, dry_run: bool = True) -> bool:
+    def _write_title(self, file: T, track: Track, dry_run: bool = True) -> bool:
         """
-        Write the title tag from ``track`` to the stored file.
+        Write the title tag from ``track`` to the given ``file``.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param track: The track with the tag to be written.
         :param dry_run: Run function, but do not modify the file on the disk.
         :return: True if the file has been updated or would have been written when ``dry_run`` is True.
         """
-        return self.write_tag(next(iter(self.tag_map.title), None), track.title, dry_run)
+        return self.write_tag(file, next(iter(self.tag_map.title), None), track.title, dry_run)
 
-    def write_artist(self, source: Track, target: Track, replace: bool = False, dry_run: bool = True) -> int | None:
+    def write_artist(
+            self, file: T, source: Track, target: Track, replace: bool = False, dry_run: bool = True
+    ) -> int | None:
         """
         Write the track artist tags to file if appropriate related conditions are met.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param source: The source track i.e. the track object representing the currently saved file on the drive.
         :param target: The target track i.e. the track object containing new tags with which to update the file.
         :param replace: Destructively overwrite the tag on the file if the ``source`` and ``target`` tags differ.
@@ -217,23 +287,27 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
             source.artist is None and target.artist is not None,
             replace and source.artist != target.artist
         ]
-        if any(conditionals) and self._write_artist(track=target, dry_run=dry_run):
+        if any(conditionals) and self._write_artist(file, track=target, dry_run=dry_run):
             return next(i for i, c in enumerate(conditionals) if c)
 
-    def _write_artist(self, track: Track, dry_run: bool = True) -> bool:
+    def _write_artist(self, file: T, track: Track, dry_run: bool = True) -> bool:
         """
-        Write the artist tag from ``track`` to the stored file.
+        Write the artist tag from ``track`` to the given ``file``.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param track: The track with the tag to be written.
         :param dry_run: Run function, but do not modify the file on the disk.
         :return: True if the file has been updated or would have been written when ``dry_run`` is True.
         """
-        return self.write_tag(next(iter(self.tag_map.artist), None), track.artist, dry_run)
+        return self.write_tag(file, next(iter(self.tag_map.artist), None), track.artist, dry_run)
 
-    def write_album(self, source: Track, target: Track, replace: bool = False, dry_run: bool = True) -> int | None:
+    def write_album(
+            self, file: T, source: Track, target: Track, replace: bool = False, dry_run: bool = True
+    ) -> int | None:
         """
         Write the track album tags to file if appropriate related conditions are met.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param source: The source track i.e. the track object representing the currently saved file on the drive.
         :param target: The target track i.e. the track object containing new tags with which to update the file.
         :param replace: Destructively overwrite the tag on the file if the ``source`` and ``target`` tags differ.
@@ -245,25 +319,27 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
             source.album is None and target.album is not None,
             replace and source.album != target.album
         ]
-        if any(conditionals) and self._write_album(track=target, dry_run=dry_run):
+        if any(conditionals) and self._write_album(file, track=target, dry_run=dry_run):
             return next(i for i, c in enumerate(conditionals) if c)
 
-    def _write_album(self, track: Track, dry_run: bool = True) -> bool:
+    def _write_album(self, file: T, track: Track, dry_run: bool = True) -> bool:
         """
-        Write the album tag from ``track`` to the stored file.
+        Write the album tag from ``track`` to the given ``file``.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param track: The track with the tag to be written.
         :param dry_run: Run function, but do not modify the file on the disk.
         :return: True if the file has been updated or would have been written when ``dry_run`` is True.
         """
-        return self.write_tag(next(iter(self.tag_map.album), None), track.album, dry_run)
+        return self.write_tag(file, next(iter(self.tag_map.album), None), track.album, dry_run)
 
     def write_album_artist(
-            self, source: Track, target: Track, replace: bool = False, dry_run: bool = True
+            self, file: T, source: Track, target: Track, replace: bool = False, dry_run: bool = True
     ) -> int | None:
         """
         Write the track album artist tags to file if appropriate related conditions are met.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param source: The source track i.e. the track object representing the currently saved file on the drive.
         :param target: The target track i.e. the track object containing new tags with which to update the file.
         :param replace: Destructively overwrite the tag on the file if the ``source`` and ``target`` tags differ.
@@ -275,23 +351,27 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
             source.album_artist is None and target.album_artist is not None,
             replace and source.album_artist != target.album_artist
         ]
-        if any(conditionals) and self._write_album_artist(track=target, dry_run=dry_run):
+        if any(conditionals) and self._write_album_artist(file, track=target, dry_run=dry_run):
             return next(i for i, c in enumerate(conditionals) if c)
 
-    def _write_album_artist(self, track: Track, dry_run: bool = True) -> bool:
+    def _write_album_artist(self, file: T, track: Track, dry_run: bool = True) -> bool:
         """
-        Write the album artist tag from ``track`` to the stored file.
+        Write the album artist tag from ``track`` to the given ``file``.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param track: The track with the tag to be written.
         :param dry_run: Run function, but do not modify the file on the disk.
         :return: True if the file has been updated or would have been written when ``dry_run`` is True.
         """
-        return self.write_tag(next(iter(self.tag_map.album_artist), None), track.album_artist, dry_run)
+        return self.write_tag(file, next(iter(self.tag_map.album_artist), None), track.album_artist, dry_run)
 
-    def write_track(self, source: Track, target: Track, replace: bool = False, dry_run: bool = True) -> int | None:
+    def write_track(
+            self, file: T, source: Track, target: Track, replace: bool = False, dry_run: bool = True
+    ) -> int | None:
         """
         Write the track number and track total tags to file if appropriate related conditions are met.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param source: The source track i.e. the track object representing the currently saved file on the drive.
         :param target: The target track i.e. the track object containing new tags with which to update the file.
         :param replace: Destructively overwrite the tag on the file if the ``source`` and ``target`` tags differ.
@@ -304,13 +384,14 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
             (target.track_number is not None or target.track_total is not None),
             replace and (source.track_number != target.track_number or source.track_total != target.track_total)
         ]
-        if any(conditionals) and self._write_track(track=target, dry_run=dry_run):
+        if any(conditionals) and self._write_track(file, track=target, dry_run=dry_run):
             return next(i for i, c in enumerate(conditionals) if c)
 
-    def _write_track(self, track: Track, dry_run: bool = True) -> bool:
+    def _write_track(self, file: T, track: Track, dry_run: bool = True) -> bool:
         """
-        Write the track number and track total tags from ``track`` to the stored file.
+        Write the track number and track total tags from ``track`` to the given ``file``.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param track: The track with the tag to be written.
         :param dry_run: Run function, but do not modify the file on the disk.
         :return: True if the file has been updated or would have been written when ``dry_run`` is True.
@@ -323,20 +404,23 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
         track_total = str(track.track_total) if track.track_total is not None else None
 
         if tag_id_number != tag_id_total and track_total is not None:
-            number_updated = self.write_tag(tag_id_number, track_number, dry_run)
-            total_updated = self.write_tag(tag_id_total, track_total, dry_run)
+            number_updated = self.write_tag(file, tag_id_number, track_number, dry_run)
+            total_updated = self.write_tag(file, tag_id_total, track_total, dry_run)
             return number_updated or total_updated
         elif track_total is not None:
             tag_value = self.num_sep.join([track_number, track_total])
         else:
             tag_value = track_number
 
-        return self.write_tag(tag_id_number, tag_value, dry_run)
+        return self.write_tag(file, tag_id_number, tag_value, dry_run)
 
-    def write_genres(self, source: Track, target: Track, replace: bool = False, dry_run: bool = True) -> int | None:
+    def write_genres(
+            self, file: T, source: Track, target: Track, replace: bool = False, dry_run: bool = True
+    ) -> int | None:
         """
         Write the track genre tags to file if appropriate related conditions are met.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param source: The source track i.e. the track object representing the currently saved file on the drive.
         :param target: The target track i.e. the track object containing new tags with which to update the file.
         :param replace: Destructively overwrite the tag on the file if the ``source`` and ``target`` tags differ.
@@ -345,25 +429,27 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
             None if none of the conditions were met.
         """
         conditionals = [source.genres is None and bool(target.genres), replace and source.genres != target.genres]
-        if any(conditionals) and self._write_genres(track=target, dry_run=dry_run):
+        if any(conditionals) and self._write_genres(file, track=target, dry_run=dry_run):
             return next(i for i, c in enumerate(conditionals) if c)
 
-    def _write_genres(self, track: Track, dry_run: bool = True) -> bool:
+    def _write_genres(self, file: T, track: Track, dry_run: bool = True) -> bool:
         """
-        Write the genre tags from ``track`` to the stored file.
+        Write the genre tags from ``track`` to the given ``file``.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param track: The track with the tag to be written.
         :param dry_run: Run function, but do not modify the file on the disk.
         :return: True if the file has been updated or would have been written when ``dry_run`` is True.
         """
-        return self.write_tag(next(iter(self.tag_map.genres), None), track.genres, dry_run)
+        return self.write_tag(file, next(iter(self.tag_map.genres), None), track.genres, dry_run)
 
     def write_date(
-            self, source: Track, target: Track, replace: bool = False, dry_run: bool = True
+            self, file: T, source: Track, target: Track, replace: bool = False, dry_run: bool = True
     ) -> dict[Tags, int] | None:
         """
         Write the track date and/or year/month/day tags to file if appropriate related conditions are met.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param source: The source track i.e. the track object representing the currently saved file on the drive.
         :param target: The target track i.e. the track object containing new tags with which to update the file.
         :param replace: Destructively overwrite the tag on the file if the ``source`` and ``target`` tags differ.
@@ -381,7 +467,7 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
         if not any(conditionals):
             return
 
-        date, year, month, day = self._write_date(track=target, dry_run=dry_run)
+        date, year, month, day = self._write_date(file, track=target, dry_run=dry_run)
 
         updated = {}
         condition = next(i for i, c in enumerate(conditionals) if c)
@@ -396,10 +482,11 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
 
         return updated if updated else None
 
-    def _write_date(self, track: Track, dry_run: bool = True) -> tuple[bool, bool, bool, bool]:
+    def _write_date(self, file: T, track: Track, dry_run: bool = True) -> tuple[bool, bool, bool, bool]:
         """
-        Write the date, year, month, and/or day tags from ``track`` to the stored file.
+        Write the date, year, month, and/or day tags from ``track`` to the given ``file``.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param track: The track with the tag to be written.
         :param dry_run: Run function, but do not modify the file on the disk.
         :return: True for each updated tag in the order (date, year, month, day)
@@ -408,20 +495,23 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
         date_str = track.date.strftime(self.date_format) if track.date else None
         if not date_str:
             date_str = f"{track.year}-{str(track.month).zfill(2)}" if track.month else str(track.year)
-        date = self.write_tag(next(iter(self.tag_map.date), None), date_str, dry_run)
+        date = self.write_tag(file, next(iter(self.tag_map.date), None), date_str, dry_run)
         if date:
             return True, False, False, False
 
-        year = self.write_tag(next(iter(self.tag_map.year), None), track.year, dry_run)
-        month = self.write_tag(next(iter(self.tag_map.month), None), track.month, dry_run)
-        day = self.write_tag(next(iter(self.tag_map.day), None), track.day, dry_run)
+        year = self.write_tag(file, next(iter(self.tag_map.year), None), track.year, dry_run)
+        month = self.write_tag(file, next(iter(self.tag_map.month), None), track.month, dry_run)
+        day = self.write_tag(file, next(iter(self.tag_map.day), None), track.day, dry_run)
 
         return date, year, month, day
 
-    def write_bpm(self, source: Track, target: Track, replace: bool = False, dry_run: bool = True) -> int | None:
+    def write_bpm(
+            self, file: T, source: Track, target: Track, replace: bool = False, dry_run: bool = True
+    ) -> int | None:
         """
         Write track bpm tags to file if appropriate related conditions are met.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param source: The source track i.e. the track object representing the currently saved file on the drive.
         :param target: The target track i.e. the track object containing new tags with which to update the file.
         :param replace: Destructively overwrite the tag on the file if the ``source`` and ``target`` tags differ.
@@ -438,23 +528,27 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
             replace and source_bpm != target_bpm
         ]
 
-        if any(conditionals) and self._write_bpm(track=target, dry_run=dry_run):
+        if any(conditionals) and self._write_bpm(file, track=target, dry_run=dry_run):
             return next(i for i, c in enumerate(conditionals) if c)
 
-    def _write_bpm(self, track: Track, dry_run: bool = True) -> bool:
+    def _write_bpm(self, file: T, track: Track, dry_run: bool = True) -> bool:
         """
-        Write the bpm tag from ``track`` to the stored file.
+        Write the bpm tag from ``track`` to the given ``file``.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param track: The track with the tag to be written.
         :param dry_run: Run function, but do not modify the file on the disk.
         :return: True if the file has been updated or would have been written when ``dry_run`` is True.
         """
-        return self.write_tag(next(iter(self.tag_map.bpm), None), track.bpm, dry_run)
+        return self.write_tag(file, next(iter(self.tag_map.bpm), None), track.bpm, dry_run)
 
-    def write_key(self, source: Track, target: Track, replace: bool = False, dry_run: bool = True) -> int | None:
+    def write_key(
+            self, file: T, source: Track, target: Track, replace: bool = False, dry_run: bool = True
+    ) -> int | None:
         """
         Write track key tags to file if appropriate related conditions are met.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param source: The source track i.e. the track object representing the currently saved file on the drive.
         :param target: The target track i.e. the track object containing new tags with which to update the file.
         :param replace: Destructively overwrite the tag on the file if the ``source`` and ``target`` tags differ.
@@ -464,23 +558,27 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
         """
         conditionals = [source.key is None and target.key is not None, replace and source.key != target.key]
 
-        if any(conditionals) and self._write_key(track=target, dry_run=dry_run):
+        if any(conditionals) and self._write_key(file, track=target, dry_run=dry_run):
             return next(i for i, c in enumerate(conditionals) if c)
 
-    def _write_key(self, track: Track, dry_run: bool = True) -> bool:
+    def _write_key(self, file: T, track: Track, dry_run: bool = True) -> bool:
         """
-        Write the key tag from ``track`` to the stored file.
+        Write the key tag from ``track`` to the given ``file``.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param track: The track with the tag to be written.
         :param dry_run: Run function, but do not modify the file on the disk.
         :return: True if the file has been updated or would have been written when ``dry_run`` is True.
         """
-        return self.write_tag(next(iter(self.tag_map.key), None), track.key, dry_run)
+        return self.write_tag(file, next(iter(self.tag_map.key), None), track.key, dry_run)
 
-    def write_disc(self, source: Track, target: Track, replace: bool = False, dry_run: bool = True) -> int | None:
+    def write_disc(
+            self, file: T, source: Track, target: Track, replace: bool = False, dry_run: bool = True
+    ) -> int | None:
         """
         Write track dic number and disc total tags to file if appropriate related conditions are met.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param source: The source track i.e. the track object representing the currently saved file on the drive.
         :param target: The target track i.e. the track object containing new tags with which to update the file.
         :param replace: Destructively overwrite the tag on the file if the ``source`` and ``target`` tags differ.
@@ -493,13 +591,14 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
             (target.disc_number is not None or target.disc_total is not None),
             replace and (source.disc_number != target.disc_number or source.disc_total != target.disc_total)
         ]
-        if any(conditionals) and self._write_disc(track=target, dry_run=dry_run):
+        if any(conditionals) and self._write_disc(file, track=target, dry_run=dry_run):
             return next(i for i, c in enumerate(conditionals) if c)
 
-    def _write_disc(self, track: Track, dry_run: bool = True) -> bool:
+    def _write_disc(self, file: T, track: Track, dry_run: bool = True) -> bool:
         """
-        Write the disc number and disc total tags from ``track`` to the stored file.
+        Write the disc number and disc total tags from ``track`` to the given ``file``.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param track: The track with the tag to be written.
         :param dry_run: Run function, but do not modify the file on the disk.
         :return: True if the file has been updated or would have been written when ``dry_run`` is True.
@@ -512,22 +611,23 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
         disc_total = str(track.disc_total) if track.disc_total is not None else None
 
         if tag_id_number != tag_id_total and disc_total is not None:
-            number_updated = self.write_tag(tag_id_number, disc_number, dry_run)
-            total_updated = self.write_tag(tag_id_total, disc_total, dry_run)
+            number_updated = self.write_tag(file, tag_id_number, disc_number, dry_run)
+            total_updated = self.write_tag(file, tag_id_total, disc_total, dry_run)
             return number_updated or total_updated
         elif disc_total is not None:
             tag_value = self.num_sep.join([disc_number, disc_total])
         else:
             tag_value = disc_number
 
-        return self.write_tag(tag_id_number, tag_value, dry_run)
+        return self.write_tag(file, tag_id_number, tag_value, dry_run)
 
     def write_compilation(
-            self, source: Track, target: Track, replace: bool = False, dry_run: bool = True
+            self, file: T, source: Track, target: Track, replace: bool = False, dry_run: bool = True
     ) -> int | None:
         """
         Write track compilation tags to file if appropriate related conditions are met.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param source: The source track i.e. the track object representing the currently saved file on the drive.
         :param target: The target track i.e. the track object containing new tags with which to update the file.
         :param replace: Destructively overwrite the tag on the file if the ``source`` and ``target`` tags differ.
@@ -539,23 +639,27 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
             source.compilation is None and target.compilation is not None,
             replace and source.compilation != target.compilation
         ]
-        if any(conditionals) and self._write_compilation(track=target, dry_run=dry_run):
+        if any(conditionals) and self._write_compilation(file, track=target, dry_run=dry_run):
             return next(i for i, c in enumerate(conditionals) if c)
 
-    def _write_compilation(self, track: Track, dry_run: bool = True) -> bool:
+    def _write_compilation(self, file: T, track: Track, dry_run: bool = True) -> bool:
         """
-        Write the compilation tag from ``track`` to the stored file.
+        Write the compilation tag from ``track`` to the given ``file``.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param track: The track with the tag to be written.
         :param dry_run: Run function, but do not modify the file on the disk.
         :return: True if the file has been updated or would have been written when ``dry_run`` is True.
         """
-        return self.write_tag(next(iter(self.tag_map.compilation), None), int(track.compilation), dry_run)
+        return self.write_tag(file, next(iter(self.tag_map.compilation), None), int(track.compilation), dry_run)
 
-    def write_comments(self, source: Track, target: Track, replace: bool = False, dry_run: bool = True) -> int | None:
+    def write_comments(
+            self, file: T, source: Track, target: Track, replace: bool = False, dry_run: bool = True
+    ) -> int | None:
         """
         Write track comments tags to file if appropriate related conditions are met.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param source: The source track i.e. the track object representing the currently saved file on the drive.
         :param target: The target track i.e. the track object containing new tags with which to update the file.
         :param replace: Destructively overwrite the tag on the file if the ``source`` and ``target`` tags differ.
@@ -567,24 +671,28 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
             source.comments is None and bool(target.comments),
             replace and source.comments != target.comments
         ]
-        if any(conditionals) and self._write_comments(track=target, dry_run=dry_run):
+        if any(conditionals) and self._write_comments(file, track=target, dry_run=dry_run):
             return next(i for i, c in enumerate(conditionals) if c)
 
-    def _write_comments(self, track: Track, dry_run: bool = True) -> bool:
+    def _write_comments(self, file: T, track: Track, dry_run: bool = True) -> bool:
         """
-        Write the comments tags from ``track`` to the stored file.
+        Write the comments tags from ``track`` to the given ``file``.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param track: The track with the tag to be written.
         :param dry_run: Run function, but do not modify the file on the disk.
         :return: True if the file has been updated or would have been written when ``dry_run`` is True.
         """
-        return self.write_tag(next(iter(self.tag_map.comments), None), track.comments, dry_run)
+        return self.write_tag(file, next(iter(self.tag_map.comments), None), track.comments, dry_run)
 
     # noinspection PyUnusedLocal
-    def write_uri(self, source: Track, target: Track, replace: bool = False, dry_run: bool = True) -> int | None:
+    def write_uri(
+            self, file: T, source: Track, target: Track, replace: bool = False, dry_run: bool = True
+    ) -> int | None:
         """
         Write track URI tag to file if appropriate related conditions are met.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param source: The source track i.e. the track object representing the currently saved file on the drive.
         :param target: The target track i.e. the track object containing new tags with which to update the file.
         :param replace: Ignored.
@@ -597,25 +705,29 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
 
         conditionals = [source.uri != target.uri or source.has_uri != target.has_uri]
 
-        if any(conditionals) and self._write_uri(track=target, dry_run=dry_run):
+        if any(conditionals) and self._write_uri(file, track=target, dry_run=dry_run):
             return next(i for i, c in enumerate(conditionals) if c)
 
-    def _write_uri(self, track: Track, dry_run: bool = True) -> bool:
+    def _write_uri(self, file: T, track: Track, dry_run: bool = True) -> bool:
         """
-        Write the URI tag from ``track`` to the stored file.
+        Write the URI tag from ``track`` to the given ``file``.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param track: The track with the tag to be written.
         :param dry_run: Run function, but do not modify the file on the disk.
         :return: True if the file has been updated or would have been written when ``dry_run`` is True.
         """
         tag_id = next(iter(self.tag_map[self.uri_tag.name.lower()]), None)
         tag_value = self.remote_wrangler.unavailable_uri_dummy if not track.has_uri else track.uri
-        return self.write_tag(tag_id, tag_value, dry_run)
+        return self.write_tag(file, tag_id, tag_value, dry_run)
 
-    def write_images(self, source: Track, target: Track, replace: bool = False, dry_run: bool = True) -> int | None:
+    def write_images(
+            self, file: T, source: Track, target: Track, replace: bool = False, dry_run: bool = True
+    ) -> int | None:
         """
         Write images to file if appropriate related conditions are met.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param source: The source track i.e. the track object representing the currently saved file on the drive.
         :param target: The target track i.e. the track object containing new tags with which to update the file.
         :param replace: Destructively overwrite the tag on the file if the ``source`` and ``target`` tags differ.
@@ -625,14 +737,15 @@ class TagWriter[T: mutagen.FileType](TagProcessor, metaclass=ABCMeta):
         """
         conditionals = [source.has_image is False and bool(target.image_links), replace and bool(target.image_links)]
 
-        if any(conditionals) and self._write_images(track=target, dry_run=dry_run):
+        if any(conditionals) and self._write_images(file, track=target, dry_run=dry_run):
             return next(i for i, c in enumerate(conditionals) if c)
 
     @abstractmethod
-    def _write_images(self, track: Track, dry_run: bool = True) -> bool:
+    def _write_images(self, file: T, track: Track, dry_run: bool = True) -> bool:
         """
-        Write the images from the ``image_links`` in ``track`` to the stored file.
+        Write the images from the ``image_links`` in ``track`` to the given ``file``.
 
+        :param file: The loaded Mutagen object of the file to update.
         :param track: The track with the tag to be written.
         :param dry_run: Run function, but do not modify the file on the disk.
         :return: True if the file has been updated or would have been written when ``dry_run`` is True.
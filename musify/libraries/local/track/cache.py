@@ -0,0 +1,181 @@
+"""
+Persistent cache of the values extracted from track files for faster reloading of unchanged files.
+"""
+import json
+import sqlite3
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import Any, Self
+
+from musify.file.base import get_file_stat
+from musify.libraries.local.track.track import TrackStreamInfo
+from musify.libraries.remote.core.wrangle import RemoteDataWrangler
+
+
+class TrackCache:
+    """
+    Stores the values extracted from track files in an SQLite database on disk.
+
+    Values are keyed on the path of the file, and are only returned when the size and modified time of the file
+    match those stored in the cache, allowing unchanged files to be rebuilt without reading them again.
+    Values are stored as JSON and so only plain values and the :py:class:`TrackStreamInfo` of the track are supported.
+    See :py:func:`.extract_track_values` and :py:func:`.build_track_from_values` for more info.
+
+    :param path: The path of the database file. Created on the first call to :py:meth:`save` if it does not exist.
+    :param remote_wrangler: Optionally, provide the :py:class:`RemoteDataWrangler` object used to process URIs
+        when extracting the values to be cached. Values are only returned when they were extracted
+        with a wrangler for the same remote source.
+    """
+
+    __slots__ = ("path", "remote_source", "_entries", "_pending")
+
+    #: The name of the table in the database which stores the cached values.
+    table_name = "tracks"
+
+    def __init__(self, path: str | Path, remote_wrangler: RemoteDataWrangler | None = None):
+        #: The path of the database file.
+        self.path = Path(path)
+        #: The name of the remote source for which URIs were processed when extracting the cached values.
+        self.remote_source: str | None = remote_wrangler.source if remote_wrangler else None
+
+        # map of path to the (size, modified time, remote source, JSON encoded values) of each cached file
+        self._entries: dict[str, tuple[int, int, str | None, str]] = {}
+        # map of path to the entries which have been added or updated since the last save
+        self._pending: dict[str, tuple[int, int, str | None, str]] = {}
+
+        if self.path.is_file():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, __exc_type, __exc_value, __traceback) -> None:
+        self.save()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path)
+        connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.table_name} ("
+            "path TEXT PRIMARY KEY, size INTEGER, modified INTEGER, remote_source TEXT, data TEXT"
+            ")"
+        )
+        return connection
+
+    def _load(self) -> None:
+        """Load all entries from the database file"""
+        connection = self._connect()
+        try:
+            rows = connection.execute(f"SELECT path, size, modified, remote_source, data FROM {self.table_name}")
+            self._entries = {path: (size, modified, source, data) for path, size, modified, source, data in rows}
+        finally:
+            connection.close()
+
+    def get(self, path: str | Path, stat: tuple[int, int] | None = None) -> dict[str, Any] | None:
+        """
+        Get the cached values for the file at the given ``path``.
+
+        :param path: The path of the file.
+        :param stat: Optionally, provide the size and modified time of the file as given by :py:func:`get_file_stat`
+            if already known to avoid reading them again. When not given, they are read from the file.
+        :return: The cached values if the file is unchanged since it was cached, None otherwise.
+        """
+        entry = self._entries.get(str(path))
+        if entry is None:
+            return
+
+        size, modified, remote_source, data = entry
+        if stat is None:
+            stat = get_file_stat(path)
+        if remote_source != self.remote_source or stat != (size, modified):
+            return
+
+        return self._decode(data)
+
+    @staticmethod
+    def _encode(values: Mapping[str, Any]) -> str:
+        """Encode the given ``values`` extracted from a track file as JSON"""
+        values = dict(values)
+        if isinstance(info := values.get("_info"), TrackStreamInfo):
+            values["_info"] = info._asdict()
+        return json.dumps(values)
+
+    @staticmethod
+    def _decode(data: str | bytes) -> dict[str, Any] | None:
+        """Decode the given JSON ``data`` to the values extracted from a track file, returning None if invalid"""
+        try:
+            values = json.loads(data)
+            if isinstance(values.get("_info"), Mapping):
+                values["_info"] = TrackStreamInfo(**values["_info"])
+        except (ValueError, TypeError, AttributeError):  # data from a previous version or otherwise corrupt
+            return
+
+        return values
+
+    def set(self, path: str | Path, values: Mapping[str, Any], stat: tuple[int, int] | None = None) -> None:
+        """
+        Cache the ``values`` for the file at the given ``path`` against the size and modified time of the file.
+        Values are not written to disk until :py:meth:`save` is called.
+
+        :param path: The path of the file.
+        :param values: The values extracted from the file.
+        :param stat: The size and modified time of the file as given by :py:func:`get_file_stat`
+            when it was read to extract the ``values``. Give this wherever possible so that changes to the file
+            made after the values were read are detected. When not given, they are read from the file.
+        """
+        if stat is None:
+            stat = get_file_stat(path)
+        if stat is None:
+            return
+
+        entry = (*stat, self.remote_source, self._encode(values))
+        self._entries[str(path)] = entry
+        self._pending[str(path)] = entry
+
+    def remove(self, path: str | Path) -> None:
+        """Remove the cached values for the file at the given ``path``"""
+        self._entries.pop(str(path), None)
+        self._pending.pop(str(path), None)
+
+    def save(self, paths: Iterable[str | Path] | None = None) -> None:
+        """
+        Write all values cached since the last save to the database file and
+        remove any entries from the database file which have been removed from this cache.
+
+        :param paths: Optionally, provide the paths of all files which should be kept in the cache
+            e.g. all the track paths currently in a library.
+            Entries for any other files are removed from the cache before saving.
+            When not given, only entries for files which no longer exist are removed.
+        """
+        if paths is not None:
+            paths = set(map(str, paths))
+            self._prune(lambda path: path in paths)
+        else:
+            self._prune(lambda path: Path(path).is_file())
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        connection = self._connect()
+        try:
+            with connection:
+                paths = {path for path, in connection.execute(f"SELECT path FROM {self.table_name}")}
+                connection.executemany(
+                    f"DELETE FROM {self.table_name} WHERE path = ?",
+                    ((path,) for path in paths if path not in self._entries)
+                )
+                connection.executemany(
+                    f"INSERT OR REPLACE INTO {self.table_name} "
+                    "(path, size, modified, remote_source, data) VALUES (?, ?, ?, ?, ?)",
+                    ((path, *entry) for path, entry in self._pending.items())
+                )
+        finally:
+            connection.close()
+
+        self._pending.clear()
+
+    def _prune(self, keep: Callable[[str], bool]) -> None:
+        """Remove all entries from this cache for paths which do not satisfy the given ``keep`` condition"""
+        for path in [path for path in self._entries if not keep(path)]:
+            self.remove(path)
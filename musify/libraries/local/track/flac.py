@@ -14,6 +14,7 @@ from musify.file.image import open_image, get_image_bytes
 from musify.libraries.local.track._tags import TagReader, TagWriter
 from musify.libraries.local.track.field import LocalTrackField
 from musify.libraries.local.track.track import LocalTrack
+from musify.libraries.remote.core.wrangle import RemoteDataWrangler
 
 try:
     from PIL import Image
@@ -25,30 +26,30 @@ class _FLACTagReader(TagReader[mutagen.flac.FLAC]):
 
     __slots__ = ()
 
-    def read_images(self):
+    def read_images(self, file: mutagen.flac.FLAC):
         if Image is None:
             return
 
-        values = self.file.pictures
+        values = file.pictures
         return [Image.open(BytesIO(value.data)) for value in values] if len(values) > 0 else None
 
-    def check_for_images(self) -> bool:
-        return len(self.file.pictures) > 0
+    def check_for_images(self, file: mutagen.flac.FLAC) -> bool:
+        return len(file.pictures) > 0
 
 
 class _FLACTagWriter(TagWriter[mutagen.flac.FLAC]):
 
     __slots__ = ()
 
-    def _write_tag(self, tag_id: str | None, tag_value: Any, dry_run: bool = True) -> bool:
+    def _write_tag(self, file: mutagen.flac.FLAC, tag_id: str | None, tag_value: Any, dry_run: bool = True) -> bool:
         if not dry_run:
             if isinstance(tag_value, (list, set, tuple)):
-                self.file[tag_id] = list(map(str, tag_value))
+                file[tag_id] = list(map(str, tag_value))
             else:
-                self.file[tag_id] = str(tag_value)
+                file[tag_id] = str(tag_value)
         return True
 
-    def _write_images(self, track: LocalTrack, dry_run: bool = True) -> bool:
+    def _write_images(self, file: mutagen.flac.FLAC, track: LocalTrack, dry_run: bool = True) -> bool:
         updated = False
         for image_kind, image_link in track.image_links.items():
             image = open_image(image_link)
@@ -61,13 +62,13 @@ class _FLACTagWriter(TagWriter[mutagen.flac.FLAC]):
 
             if not dry_run:
                 # clear all images, adding back those that don't match the new image's type
-                pictures_current = self.file.pictures.copy()
-                self.file.clear_pictures()
+                pictures_current = file.pictures.copy()
+                file.clear_pictures()
                 for pic in pictures_current:
                     if pic.type != picture.type:
-                        self.file.add_picture(pic)
+                        file.add_picture(pic)
 
-                self.file.add_picture(picture)
+                file.add_picture(picture)
 
             image.close()
             track.has_image = True
@@ -75,9 +76,9 @@ class _FLACTagWriter(TagWriter[mutagen.flac.FLAC]):
 
         return updated
 
-    def _clear_tag(self, tag_name: str, dry_run: bool = True) -> bool:
+    def _clear_tag(self, file: mutagen.flac.FLAC, tag_name: str, dry_run: bool = True) -> bool:
         if tag_name == LocalTrackField.IMAGES.name.lower():
-            self.file.clear_pictures()
+            file.clear_pictures()
             return True
 
         removed = False
@@ -87,9 +88,9 @@ class _FLACTagWriter(TagWriter[mutagen.flac.FLAC]):
             return removed
 
         for tag_id in tag_ids:
-            if tag_id in self.file and self.file[tag_id]:
+            if tag_id in file and file[tag_id]:
                 if not dry_run:
-                    del self.file[tag_id]
+                    del file[tag_id]
                 removed = True
 
         return removed
@@ -121,8 +122,10 @@ class FLAC(LocalTrack[mutagen.flac.FLAC, _FLACTagReader, _FLACTagWriter]):
         comments=["comment", "description"],
     )
 
-    def _create_reader(self, file: mutagen.flac.FLAC):
-        return _FLACTagReader(file, tag_map=self.tag_map, remote_wrangler=self._remote_wrangler)
+    @classmethod
+    def _create_reader(cls, remote_wrangler: RemoteDataWrangler | None = None):
+        return _FLACTagReader(tag_map=cls.tag_map, remote_wrangler=remote_wrangler)
 
-    def _create_writer(self, file: mutagen.flac.FLAC):
-        return _FLACTagWriter(file, tag_map=self.tag_map, remote_wrangler=self._remote_wrangler)
+    @classmethod
+    def _create_writer(cls, remote_wrangler: RemoteDataWrangler | None = None):
+        return _FLACTagWriter(tag_map=cls.tag_map, remote_wrangler=remote_wrangler)
@@ -13,6 +13,7 @@ from musify.file.image import open_image, get_image_bytes
 # noinspection PyProtectedMember
 from musify.libraries.local.track._tags import TagReader, TagWriter
 from musify.libraries.local.track.track import LocalTrack
+from musify.libraries.remote.core.wrangle import RemoteDataWrangler
 from musify.utils import to_collection
 
 try:
@@ -25,11 +26,11 @@ class _M4ATagReader(TagReader[mutagen.mp4.MP4]):
 
     __slots__ = ()
 
-    def read_tag(self, tag_ids: Iterable[str]) -> list[Any] | None:
+    def read_tag(self, file: mutagen.mp4.MP4, tag_ids: Iterable[str]) -> list[Any] | None:
         """Extract all tag values for a given list of tag IDs"""
         values = []
         for tag_id in tag_ids:
-            value = self.file.get(tag_id)
+            value = file.get(tag_id)
             if value is None or (isinstance(value, str) and len(value.strip()) == 0):
                 # skip null or empty/blank strings
                 continue
@@ -43,31 +44,31 @@ class _M4ATagReader(TagReader[mutagen.mp4.MP4]):
 
         return values if len(values) > 0 else None
 
-    def read_track_number(self) -> int | None:
-        values = self.read_tag(self.tag_map.track_number)
+    def read_track_number(self, file: mutagen.mp4.MP4) -> int | None:
+        values = self.read_tag(file, self.tag_map.track_number)
         return int(values[0][0]) if values is not None else None
 
-    def read_track_total(self) -> int | None:
-        values = self.read_tag(self.tag_map.track_total)
+    def read_track_total(self, file: mutagen.mp4.MP4) -> int | None:
+        values = self.read_tag(file, self.tag_map.track_total)
         return int(values[0][1]) if values is not None else None
 
-    def read_key(self) -> str | None:
-        values = self.read_tag(self.tag_map.key)
+    def read_key(self, file: mutagen.mp4.MP4) -> str | None:
+        values = self.read_tag(file, self.tag_map.key)
         return str(values[0][:]) if values is not None else None
 
-    def read_disc_number(self) -> int | None:
-        values = self.read_tag(self.tag_map.disc_number)
+    def read_disc_number(self, file: mutagen.mp4.MP4) -> int | None:
+        values = self.read_tag(file, self.tag_map.disc_number)
         return int(values[0][0]) if values is not None else None
 
-    def read_disc_total(self) -> int | None:
-        values = self.read_tag(self.tag_map.disc_total)
+    def read_disc_total(self, file: mutagen.mp4.MP4) -> int | None:
+        values = self.read_tag(file, self.tag_map.disc_total)
         return int(values[0][1]) if values is not None else None
 
-    def read_images(self):
+    def read_images(self, file: mutagen.mp4.MP4):
         if Image is None:
             return
 
-        values = self.read_tag(self.tag_map.images)
+        values = self.read_tag(file, self.tag_map.images)
         return [Image.open(BytesIO(bytes(value))) for value in values] if values is not None else None
 
 
@@ -75,52 +76,60 @@ class _M4ATagWriter(TagWriter[mutagen.mp4.MP4]):
 
     __slots__ = ()
 
-    def _write_tag(self, tag_id: str | None, tag_value: Any, dry_run: bool = True) -> bool:
+    def _write_tag(self, file: mutagen.mp4.MP4, tag_id: str | None, tag_value: Any, dry_run: bool = True) -> bool:
         if not dry_run:
             if tag_id.startswith("----:com.apple.iTunes"):
-                self.file[tag_id] = [
+                file[tag_id] = [
                     mutagen.mp4.MP4FreeForm(str(v).encode("utf-8"), 1) for v in to_collection(tag_value)
                 ]
             elif isinstance(tag_value, bool):
-                self.file[tag_id] = tag_value
+                file[tag_id] = tag_value
             elif isinstance(tag_value, tuple):
-                self.file[tag_id] = [tag_value]
+                file[tag_id] = [tag_value]
             else:
-                self.file[tag_id] = to_collection(tag_value, list)
+                file[tag_id] = to_collection(tag_value, list)
         return True
 
-    def _write_track(self, track: LocalTrack, dry_run: bool = True) -> bool:
+    def _write_track(self, file: mutagen.mp4.MP4, track: LocalTrack, dry_run: bool = True) -> bool:
         tag_id = next(iter(self.tag_map.track_number), None)
         tag_value = (track.track_number, track.track_total)
-        return self.write_tag(tag_id, tag_value, dry_run)
+        return self.write_tag(file, tag_id, tag_value, dry_run)
 
-    def _write_date(self, track: LocalTrack, dry_run: bool = True) -> tuple[bool, bool, bool, bool]:
+    def _write_date(
+            self, file: mutagen.mp4.MP4, track: LocalTrack, dry_run: bool = True
+    ) -> tuple[bool, bool, bool, bool]:
         date_str = track.date.strftime(self.date_format) if track.date else None
         if not date_str:
             date_str = f"{track.year}-{str(track.month).zfill(2)}" if track.month else str(track.year)
-        date = self.write_tag(next(iter(self.tag_map.date), None), date_str, dry_run)
+        date = self.write_tag(file, next(iter(self.tag_map.date), None), date_str, dry_run)
         if date:
             return date, False, False, False
 
-        year = self.write_tag(next(iter(self.tag_map.year), None), str(track.year) if track.year else None, dry_run)
-        month = self.write_tag(next(iter(self.tag_map.month), None), str(track.month) if track.month else None, dry_run)
-        day = self.write_tag(next(iter(self.tag_map.day), None), str(track.day) if track.day else None, dry_run)
+        year = self.write_tag(
+            file, next(iter(self.tag_map.year), None), str(track.year) if track.year else None, dry_run
+        )
+        month = self.write_tag(
+            file, next(iter(self.tag_map.month), None), str(track.month) if track.month else None, dry_run
+        )
+        day = self.write_tag(
+            file, next(iter(self.tag_map.day), None), str(track.day) if track.day else None, dry_run
+        )
 
         return date, year, month, day
 
-    def _write_bpm(self, track: LocalTrack, dry_run: bool = True) -> bool:
+    def _write_bpm(self, file: mutagen.mp4.MP4, track: LocalTrack, dry_run: bool = True) -> bool:
         bpm = int(track.bpm) if track.bpm is not None else None
-        return self.write_tag(next(iter(self.tag_map.bpm), None), bpm, dry_run)
+        return self.write_tag(file, next(iter(self.tag_map.bpm), None), bpm, dry_run)
 
-    def _write_disc(self, track: LocalTrack, dry_run: bool = True) -> bool:
+    def _write_disc(self, file: mutagen.mp4.MP4, track: LocalTrack, dry_run: bool = True) -> bool:
         tag_id = next(iter(self.tag_map.disc_number), None)
         tag_value = (track.disc_number, track.disc_total)
-        return self.write_tag(tag_id, tag_value, dry_run)
+        return self.write_tag(file, tag_id, tag_value, dry_run)
 
-    def _write_compilation(self, track: LocalTrack, dry_run: bool = True) -> bool:
-        return self.write_tag(next(iter(self.tag_map.compilation), None), track.compilation, dry_run)
+    def _write_compilation(self, file: mutagen.mp4.MP4, track: LocalTrack, dry_run: bool = True) -> bool:
+        return self.write_tag(file, next(iter(self.tag_map.compilation), None), track.compilation, dry_run)
 
-    def _write_images(self, track: LocalTrack, dry_run: bool = True) -> bool:
+    def _write_images(self, file: mutagen.mp4.MP4, track: LocalTrack, dry_run: bool = True) -> bool:
         tag_id = next(iter(self.tag_map.images), None)
 
         updated = False
@@ -137,7 +146,7 @@ class _M4ATagWriter(TagWriter[mutagen.mp4.MP4]):
             image.close()
 
         if len(tag_value) > 0:
-            updated = self.write_tag(tag_id, tag_value, dry_run)
+            updated = self.write_tag(file, tag_id, tag_value, dry_run)
 
         track.has_image = updated or track.has_image
         return updated
@@ -169,8 +178,10 @@ class M4A(LocalTrack[mutagen.mp4.MP4, _M4ATagReader, _M4ATagWriter]):
         images=["covr"],
     )
 
-    def _create_reader(self, file: mutagen.mp4.MP4):
-        return _M4ATagReader(file, tag_map=self.tag_map, remote_wrangler=self._remote_wrangler)
+    @classmethod
+    def _create_reader(cls, remote_wrangler: RemoteDataWrangler | None = None):
+        return _M4ATagReader(tag_map=cls.tag_map, remote_wrangler=remote_wrangler)
 
-    def _create_writer(self, file: mutagen.mp4.MP4):
-        return _M4ATagWriter(file, tag_map=self.tag_map, remote_wrangler=self._remote_wrangler)
+    @classmethod
+    def _create_writer(cls, remote_wrangler: RemoteDataWrangler | None = None):
+        return _M4ATagWriter(tag_map=cls.tag_map, remote_wrangler=remote_wrangler)
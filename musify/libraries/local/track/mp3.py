@@ -16,6 +16,7 @@ from musify.libraries.local.exception import TagError
 from musify.libraries.local.track._tags import TagReader, TagWriter
 from musify.libraries.local.track.field import LocalTrackField
 from musify.libraries.local.track.track import LocalTrack
+from musify.libraries.remote.core.wrangle import RemoteDataWrangler
 
 try:
     from PIL import Image
@@ -27,14 +28,14 @@ class _MP3TagReader(TagReader[mutagen.mp3.MP3]):
 
     __slots__ = ()
 
-    def read_tag(self, tag_ids: Iterable[str]) -> list[Any] | None:
+    def read_tag(self, file: mutagen.mp3.MP3, tag_ids: Iterable[str]) -> list[Any] | None:
         # MP3 tag ids come in parts separated by : i.e. 'COMM:ID3v1 Comment:eng'
         # need to search all actual MP3 tag ids to check if the first part equals any of the given base tag ids
-        tag_ids = tuple(mp3_id for mp3_id in self.file.keys() for tag_id in tag_ids if mp3_id.split(":")[0] == tag_id)
+        tag_ids = tuple(mp3_id for mp3_id in file.keys() for tag_id in tag_ids if mp3_id.split(":")[0] == tag_id)
 
         values = []
         for tag_id in tag_ids:
-            value = self.file.get(tag_id)
+            value = file.get(tag_id)
             if value is None:
                 continue
 
@@ -48,18 +49,18 @@ class _MP3TagReader(TagReader[mutagen.mp3.MP3]):
 
         return values if len(values) > 0 else None
 
-    def read_genres(self) -> list[str] | None:
+    def read_genres(self, file: mutagen.mp3.MP3) -> list[str] | None:
         """Extract metadata from file for genre"""
-        values = self.read_tag(self.tag_map.genres)
+        values = self.read_tag(file, self.tag_map.genres)
         if values is None:
             return
         return [genre for value in values for genre in value.split(";")]
 
-    def read_images(self):
+    def read_images(self, file: mutagen.mp3.MP3):
         if Image is None:
             return
 
-        values = self.read_tag(self.tag_map.images)
+        values = self.read_tag(file, self.tag_map.images)
         return [Image.open(BytesIO(value.data)) for value in values] if values is not None else None
 
 
@@ -67,7 +68,7 @@ class _MP3TagWriter(TagWriter[mutagen.mp3.MP3]):
 
     __slots__ = ()
 
-    def _clear_tag(self, tag_name: str, dry_run: bool = True) -> bool:
+    def _clear_tag(self, file: mutagen.mp3.MP3, tag_name: str, dry_run: bool = True) -> bool:
         removed = False
 
         tag_ids = self.tag_map[tag_name]
@@ -75,24 +76,24 @@ class _MP3TagWriter(TagWriter[mutagen.mp3.MP3]):
             return removed
 
         for tag_id_prefix in tag_ids:
-            for mp3_id in list(self.file.keys()).copy():
-                if mp3_id.split(":")[0] == tag_id_prefix and self.file[mp3_id]:
+            for mp3_id in list(file.keys()).copy():
+                if mp3_id.split(":")[0] == tag_id_prefix and file[mp3_id]:
                     if not dry_run:
-                        del self.file[mp3_id]
+                        del file[mp3_id]
                     removed = True
 
         return removed
 
-    def _write_tag(self, tag_id: str | None, tag_value: Any, dry_run: bool = True) -> bool:
+    def _write_tag(self, file: mutagen.mp3.MP3, tag_id: str | None, tag_value: Any, dry_run: bool = True) -> bool:
         if not dry_run:
-            self.file[tag_id] = getattr(mutagen.id3, tag_id)(3, text=str(tag_value))
+            file[tag_id] = getattr(mutagen.id3, tag_id)(3, text=str(tag_value))
         return True
 
-    def _write_genres(self, track: LocalTrack, dry_run: bool = True) -> bool:
+    def _write_genres(self, file: mutagen.mp3.MP3, track: LocalTrack, dry_run: bool = True) -> bool:
         values = ";".join(track.genres or [])
-        return self.write_tag(next(iter(self.tag_map.genres), None), values, dry_run)
+        return self.write_tag(file, next(iter(self.tag_map.genres), None), values, dry_run)
 
-    def _write_images(self, track: LocalTrack, dry_run: bool = True) -> bool:
+    def _write_images(self, file: mutagen.mp3.MP3, track: LocalTrack, dry_run: bool = True) -> bool:
         tag_id_prefix = next(iter(self.tag_map.images), None)
 
         updated = False
@@ -105,7 +106,7 @@ class _MP3TagWriter(TagWriter[mutagen.mp3.MP3]):
                 tag_id = f"{tag_id_prefix}:{image_kind}"
 
                 # noinspection PyUnresolvedReferences
-                self.file[tag_id] = mutagen.id3.APIC(
+                file[tag_id] = mutagen.id3.APIC(
                     encoding=mutagen.id3.Encoding.UTF8,
                     # desc=image_kind,
                     mime=Image.MIME[image.format],
@@ -119,9 +120,11 @@ class _MP3TagWriter(TagWriter[mutagen.mp3.MP3]):
 
         return updated
 
-    def _write_comments(self, track: LocalTrack, dry_run: bool = True) -> bool:
+    def _write_comments(self, file: mutagen.mp3.MP3, track: LocalTrack, dry_run: bool = True) -> bool:
         tag_id_prefix = next(iter(self.tag_map.comments), None)
-        self.delete_tags(tags=LocalTrackField.COMMENTS, dry_run=dry_run)
+        # clear in memory only, the file is saved once all tags have been written
+        for tag_name in LocalTrackField.to_tags(LocalTrackField.COMMENTS):
+            self._clear_tag(file, tag_name, dry_run)
 
         for comment in track.comments:
             # noinspection PyUnresolvedReferences
@@ -131,11 +134,11 @@ class _MP3TagWriter(TagWriter[mutagen.mp3.MP3]):
             # noinspection PyUnresolvedReferences
             tag_id = f"{tag_id_prefix}:{comm.desc}:{comm.lang}"
             if not dry_run and tag_id is not None:
-                self.file[tag_id] = comm
+                file[tag_id] = comm
 
         return tag_id_prefix is not None
 
-    def _write_uri(self, track: LocalTrack, dry_run: bool = True) -> bool:
+    def _write_uri(self, file: mutagen.mp3.MP3, track: LocalTrack, dry_run: bool = True) -> bool:
         if not self.remote_wrangler:
             return False
 
@@ -144,19 +147,20 @@ class _MP3TagWriter(TagWriter[mutagen.mp3.MP3]):
         # if applying URI as comment, clear comments and add manually with custom description
         if self.uri_tag == LocalTrackField.COMMENTS:
             tag_id_prefix = next(iter(self.tag_map.comments), None)
-            self.delete_tags(tags=self.uri_tag, dry_run=dry_run)
+            for tag_name in LocalTrackField.to_tags(self.uri_tag):
+                self._clear_tag(file, tag_name, dry_run)
 
             # noinspection PyUnresolvedReferences
             comm = mutagen.id3.COMM(encoding=mutagen.id3.Encoding.UTF8, lang="eng", desc="URI", text=[tag_value])
             # noinspection PyUnresolvedReferences
             tag_id = f"{tag_id_prefix}:{comm.desc}:{comm.lang}"
             if not dry_run and tag_id is not None:
-                self.file[tag_id] = comm
+                file[tag_id] = comm
 
             return tag_id is not None
         else:
             tag_id = next(iter(self.tag_map[self.uri_tag.name.lower()]), None)
-            return self.write_tag(tag_id, tag_value, dry_run)
+            return self.write_tag(file, tag_id, tag_value, dry_run)
 
 
 class MP3(LocalTrack[mutagen.mp3.MP3, _MP3TagReader, _MP3TagWriter]):
@@ -186,8 +190,10 @@ class MP3(LocalTrack[mutagen.mp3.MP3, _MP3TagReader, _MP3TagWriter]):
         images=["APIC"],
     )
 
-    def _create_reader(self, file: mutagen.mp3.MP3):
-        return _MP3TagReader(file, tag_map=self.tag_map, remote_wrangler=self._remote_wrangler)
+    @classmethod
+    def _create_reader(cls, remote_wrangler: RemoteDataWrangler | None = None):
+        return _MP3TagReader(tag_map=cls.tag_map, remote_wrangler=remote_wrangler)
 
-    def _create_writer(self, file: mutagen.mp3.MP3):
-        return _MP3TagWriter(file, tag_map=self.tag_map, remote_wrangler=self._remote_wrangler)
+    @classmethod
+    def _create_writer(cls, remote_wrangler: RemoteDataWrangler | None = None):
+        return _MP3TagWriter(tag_map=cls.tag_map, remote_wrangler=remote_wrangler)
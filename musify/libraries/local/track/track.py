@@ -4,10 +4,10 @@ Compositely combine reader and writer classes for metadata/tags/properties opera
 import datetime
 import re
 from abc import ABCMeta, abstractmethod
-from collections.abc import Generator
+from collections.abc import Generator, Mapping, Iterable
 from copy import deepcopy, copy
 from pathlib import Path
-from typing import Any, Self
+from typing import Any, Self, NamedTuple
 
 import mutagen
 from aiorequestful.types import UnitIterable
@@ -21,12 +21,42 @@ from musify.file.exception import FileDoesNotExistError, UnexpectedPathError
 from musify.libraries.core.object import Track
 from musify.libraries.local.base import LocalItem
 # noinspection PyProtectedMember
-from musify.libraries.local.track._tags import TagReader, TagWriter, SyncResultTrack
+from musify.libraries.local.track._tags import TagReader, TagWriter, SyncResultTrack, PaddingPolicy
 from musify.libraries.local.track.field import LocalTrackField as Tags, LocalTrackField
 from musify.libraries.remote.core.wrangle import RemoteDataWrangler
 from musify.utils import to_collection
 
 
+class TrackStreamInfo(NamedTuple):
+    """
+    Stores only the properties of the audio stream of a track needed by :py:class:`LocalTrack`.
+    Used in place of the mutagen stream info when the mutagen object for a track has been released.
+    """
+    #: The length of the track in seconds.
+    length: float
+    #: The number of channels in the audio stream.
+    channels: int
+    #: The bit rate of the audio stream in bits per second.
+    bitrate: int
+    #: The sample rate of the audio stream in Hz.
+    sample_rate: int
+    #: The bit depth of the audio stream in bits, if available for this file type.
+    bits_per_sample: int | None = None
+
+    @classmethod
+    def from_info(cls, info: mutagen.StreamInfo | Self) -> Self:
+        """Extract the required properties from the given mutagen stream ``info``"""
+        if isinstance(info, cls):
+            return info
+        return cls(
+            length=info.length,
+            channels=info.channels,
+            bitrate=info.bitrate,
+            sample_rate=info.sample_rate,
+            bits_per_sample=getattr(info, "bits_per_sample", None),
+        )
+
+
 class LocalTrack[T: mutagen.FileType, U: TagReader, V: TagWriter](LocalItem, Track, metaclass=ABCMeta):
     """
     Generic track object for extracting, modifying, and saving metadata/tags/properties for a given file.
@@ -36,15 +66,21 @@ class LocalTrack[T: mutagen.FileType, U: TagReader, V: TagWriter](LocalItem, Tra
         This object will be used to check for and validate a URI tag on the file.
         The tag that is used for reading and writing is set by the ``uri_tag`` class attribute.
         If no ``remote_wrangler`` is given, no URI processing will occur.
+    :param detached: When True, release the mutagen object for this track after loading the file to reduce memory
+        usage, keeping only the values needed for its properties. The mutagen object is loaded again from the file
+        as and when it is needed i.e. when saving, deleting tags, or extracting images, and released again after.
     """
 
     __slots__ = (
         "_path",
         "_new_path",
-        "_remote_wrangler",
+        "_file",
         "_reader",
         "_writer",
+        "_info",
         "_loaded",
+        "_snapshot",
+        "detached",
         "_title",
         "_artist",
         "_album",
@@ -71,7 +107,43 @@ class LocalTrack[T: mutagen.FileType, U: TagReader, V: TagWriter](LocalItem, Tra
         "_play_count",
     )
     __attributes_classes__ = (Track, LocalItem)
-    __attributes_ignore__ = ("tag_map",)
+    __attributes_ignore__ = ("tag_map", "padding_policy")
+
+    #: The :py:class:`PaddingPolicy` to use when saving tags to files of this track type.
+    #: When None, use the default padding as determined by mutagen.
+    padding_policy: PaddingPolicy | None = PaddingPolicy()
+
+    #: Map of the shared tag processors for each track type and the remote wrangler they use.
+    #: See :py:meth:`_get_tag_processors` for more info.
+    _tag_processors: dict[tuple[type, RemoteDataWrangler | None], tuple[TagReader, TagWriter]] = {}
+
+    #: The slots of this track which store the values extracted from the file when it is loaded.
+    _file_value_slots = (
+        "_title",
+        "_artist",
+        "_album",
+        "_album_artist",
+        "_track_number",
+        "_track_total",
+        "_genres",
+        "_year",
+        "_month",
+        "_day",
+        "_bpm",
+        "_key",
+        "_disc_number",
+        "_disc_total",
+        "_compilation",
+        "_comments",
+        "_uri",
+        "_has_uri",
+        "_has_image",
+        "_info",
+    )
+    #: The slots of this track which store the tag values of the file.
+    #: A snapshot of these values is taken whenever they are read from or written to the file
+    #: to identify the tags which have been modified since.
+    _tag_value_slots = tuple(key for key in _file_value_slots if key != "_info")
 
     @property
     def name(self):
@@ -279,7 +351,7 @@ class LocalTrack[T: mutagen.FileType, U: TagReader, V: TagWriter](LocalItem, Tra
 
     @property
     def length(self):
-        return self._reader.file.info.length
+        return self._info.length
 
     @property
     def rating(self):
@@ -319,25 +391,25 @@ class LocalTrack[T: mutagen.FileType, U: TagReader, V: TagWriter](LocalItem, Tra
     @property
     def channels(self) -> int:
         """The number of channels in this audio file i.e. 1 for mono, 2 for stereo, ..."""
-        return self._reader.file.info.channels
+        return self._info.channels
 
     @property
     def bit_rate(self) -> float:
         """The bit rate of this track in kilobytes per second"""
-        return self._reader.file.info.bitrate / 1000
+        return self._info.bitrate / 1000
 
     @property
     def bit_depth(self) -> int | None:
         """The bit depth of this track in bits"""
         try:
-            return self._reader.file.info.bits_per_sample
+            return self._info.bits_per_sample
         except AttributeError:
             return None
 
     @property
     def sample_rate(self) -> float:
         """The sample rate of this track in kHz"""
-        return self._reader.file.info.sample_rate / 1000
+        return self._info.sample_rate / 1000
 
     @property
     def date_added(self) -> datetime.datetime | None:
@@ -366,28 +438,49 @@ class LocalTrack[T: mutagen.FileType, U: TagReader, V: TagWriter](LocalItem, Tra
     def play_count(self, value: int | None):
         self._play_count = value
 
+    @classmethod
     @abstractmethod
-    def _create_reader(self, file: T) -> U:
+    def _create_reader(cls, remote_wrangler: RemoteDataWrangler | None = None) -> U:
         """Return a :py:class:`TagReader` object for this track type"""
         raise NotImplementedError
 
+    @classmethod
     @abstractmethod
-    def _create_writer(self, file: T) -> V:
+    def _create_writer(cls, remote_wrangler: RemoteDataWrangler | None = None) -> V:
         """Return a :py:class:`TagWriter` object for this track type"""
         raise NotImplementedError
 
-    def __init__(self, file: str | Path | T, remote_wrangler: RemoteDataWrangler = None):
+    @classmethod
+    def _get_tag_processors(cls, remote_wrangler: RemoteDataWrangler | None = None) -> tuple[U, V]:
+        """
+        Get the :py:class:`TagReader` and :py:class:`TagWriter` objects for this track type and ``remote_wrangler``.
+        The processors are only created once and are then shared between all tracks of this type.
+        """
+        key = (cls, remote_wrangler)
+        processors = cls._tag_processors.get(key)
+        if processors is None:
+            processors = (cls._create_reader(remote_wrangler), cls._create_writer(remote_wrangler))
+            processors = cls._tag_processors.setdefault(key, processors)
+        return processors
+
+    def __init__(self, file: str | Path | T, remote_wrangler: RemoteDataWrangler = None, detached: bool = False):
         super().__init__()
 
         self._path: Path = Path(file if isinstance(file, str | Path) else file.filename)
         self._new_path = self._path
         self._validate_type(self._path)
 
-        self._remote_wrangler = remote_wrangler
+        # mutagen object is only assigned if given, otherwise it is loaded on calling load
+        file_loaded: T | None = file if isinstance(file, mutagen.FileType) else None
 
         self._loaded = False
-        self._reader: TagReader[T] | None = None
-        self._writer: TagWriter[T] | None = None
+        self._snapshot: dict[str, Any] | None = None
+        self._file: T | None = file_loaded
+        self._reader, self._writer = self._get_tag_processors(remote_wrangler)
+        self._info: mutagen.StreamInfo | TrackStreamInfo | None = file_loaded.info if file_loaded is not None else None
+        #: When True, the mutagen object for this track is released after loading the file and after each operation
+        #: which needs it, keeping only the values needed for the properties of this track.
+        self.detached = detached
 
         self._title = None
         self._artist = None
@@ -416,10 +509,10 @@ class LocalTrack[T: mutagen.FileType, U: TagReader, V: TagWriter](LocalItem, Tra
         self._last_played = None
         self._play_count = None
 
-        if isinstance(file, mutagen.FileType):
-            self._reader = self._create_reader(file)
-            self._writer = self._create_writer(file)
+        if file_loaded is not None:
             self.refresh()
+            if self.detached:
+                self._release_file()
 
     def __await__(self) -> Generator[Any, None, Self]:
         return self.load().__await__()
@@ -433,74 +526,227 @@ class LocalTrack[T: mutagen.FileType, U: TagReader, V: TagWriter](LocalItem, Tra
         :raise FileDoesNotExistError: If the file cannot be found.
         :raise InvalidFileType: If the file type is not supported.
         """
+        self._load_file()
+        self.refresh()
+        if self.detached:
+            self._release_file()
+
+        return self
+
+    def _load_file(self) -> None:
+        """
+        Load the mutagen object for this track from the path stored in this object
+        without refreshing the metadata loaded into this object.
+
+        :raise FileDoesNotExistError: If the file cannot be found.
+        """
         if not self._path.is_file():
             raise FileDoesNotExistError(self._path)
 
-        file = mutagen.File(self.path)
-        self._reader = self._create_reader(file)
-        self._writer = self._create_writer(file)
+        self._file = mutagen.File(self.path)
+        self._info = self._file.info
 
-        self.refresh()
+    def _check_file_loaded(self) -> None:
+        """
+        Load the mutagen object for this track if it has not yet been loaded
+        e.g. when this track was built from values extracted in another process.
+        """
+        if self._file is not None:
+            return
 
-        return self
+        self._load_file()
+        # to reduce memory usage, remove any embedded images from the loaded file
+        self._writer.clear_loaded_images(self._file)
+
+    def _release_file(self) -> None:
+        """
+        Release the mutagen object for this track to reduce memory usage,
+        keeping only the stream info needed for the properties of this track.
+        The mutagen object will be loaded again as and when it is needed.
+        """
+        if self._info is not None:
+            self._info = TrackStreamInfo.from_info(self._info)
+
+        self._file = None
+
+    def _get_file_values(self) -> dict[str, Any]:
+        """
+        Get the values extracted from the file for this track.
+        The returned values may be passed to :py:meth:`_set_file_values` on another track object
+        to rebuild this track without reading the file again.
+        """
+        values = {key: getattr(self, key) for key in self._file_value_slots}
+        if values["_info"] is not None:
+            values["_info"] = TrackStreamInfo.from_info(values["_info"])
+        return values
+
+    def _set_file_values(self, values: Mapping[str, Any]) -> None:
+        """
+        Set the values extracted from the file for this track as given by :py:meth:`_get_file_values`
+        and mark this track as loaded.
+        The mutagen object for this track will be loaded as and when it is needed.
+        """
+        for key in self._file_value_slots:
+            setattr(self, key, values.get(key))
+
+        self._take_snapshot()
+        self._loaded = True
+
+    def _take_snapshot(self, keys: Iterable[str] | None = None) -> None:
+        """
+        Store a snapshot of the current tag values of this track as the values currently saved to the file.
+        Optionally, give the slot ``keys`` to only update the snapshot for these values.
+        """
+        if keys is None or self._snapshot is None:
+            self._snapshot = {}
+            keys = self._tag_value_slots
+
+        for key in keys:
+            self._snapshot[key] = copy(getattr(self, key))
+
+    def _get_snapshot_keys(self, tags: Iterable[Tags]) -> set[str]:
+        """Get the slot keys in the snapshot of this track which store the values for the given ``tags``"""
+        names = {name for tag in tags for name in tag.to_tag()}
+        if Tags.IMAGES.name.lower() in names:
+            names.add("has_image")
+        if Tags.URI.name.lower() in names:
+            names.update({"has_uri", self._reader.uri_tag.name.lower()})
+
+        return {key for key in map("_{}".format, names) if key in self._tag_value_slots}
+
+    def _get_modified_keys(self) -> set[str]:
+        """
+        Get the slot keys of the tag values on this track which have been modified since the last snapshot
+        i.e. since these values were last read from or written to the file.
+        """
+        if self._snapshot is None:
+            return set(self._tag_value_slots)
+        return {key for key, value in self._snapshot.items() if getattr(self, key) != value}
+
+    def _get_snapshot_track(self) -> Self:
+        """Build a new track which represents the tag values currently saved to the file as given by the snapshot"""
+        track = self.__class__(file=self.path, remote_wrangler=self._reader.remote_wrangler, detached=self.detached)
+        for key, value in self._snapshot.items():
+            setattr(track, key, copy(value))
+
+        track._info = self._info
+        track._loaded = True
+        return track
 
     def refresh(self) -> None:
         """Extract update tags for this object from the loaded mutagen object."""
         self._refresh()
+        self._take_snapshot()
 
         # to reduce memory usage, remove any embedded images from the loaded file
-        self._writer.clear_loaded_images()
+        self._writer.clear_loaded_images(self._file)
 
         self._loaded = True
 
     def _refresh(self):
         """Simply refresh the metadata from file without any post-processing."""
-        self.title = self._reader.read_title()
-        self.artist = self._reader.read_artist()
-        self.album = self._reader.read_album()
-        self.album_artist = self._reader.read_album_artist()
-        self.track_number = self._reader.read_track_number()
-        self.track_total = self._reader.read_track_total()
-        self.genres = self._reader.read_genres()
-        self.year, self.month, self.day = self._reader.read_date() or (None, None, None)
-        self.bpm = self._reader.read_bpm()
-        self.key = self._reader.read_key()
-        self.disc_number = self._reader.read_disc_number()
-        self.disc_total = self._reader.read_disc_total()
-        self.compilation = self._reader.read_compilation()
-        self.comments = self._reader.read_comments()
-
-        self.uri = self._reader.read_uri()
+        self.title = self._reader.read_title(self._file)
+        self.artist = self._reader.read_artist(self._file)
+        self.album = self._reader.read_album(self._file)
+        self.album_artist = self._reader.read_album_artist(self._file)
+        self.track_number = self._reader.read_track_number(self._file)
+        self.track_total = self._reader.read_track_total(self._file)
+        self.genres = self._reader.read_genres(self._file)
+        self.year, self.month, self.day = self._reader.read_date(self._file) or (None, None, None)
+        self.bpm = self._reader.read_bpm(self._file)
+        self.key = self._reader.read_key(self._file)
+        self.disc_number = self._reader.read_disc_number(self._file)
+        self.disc_total = self._reader.read_disc_total(self._file)
+        self.compilation = self._reader.read_compilation(self._file)
+        self.comments = self._reader.read_comments(self._file)
+
+        self.uri = self._reader.read_uri(self._file)
         if not self._loaded:
-            self.has_image = self._reader.check_for_images()
+            self.has_image = self._reader.check_for_images(self._file)
 
     async def save(
-            self, tags: UnitIterable[Tags] = Tags.ALL, replace: bool = False, dry_run: bool = True
+            self,
+            tags: UnitIterable[Tags] = Tags.ALL,
+            replace: bool = False,
+            dry_run: bool = True,
+            verify: bool = False,
     ) -> SyncResultTrack:
         """
         Update file's tags from given dictionary of tags.
 
+        By default, the tags of this track are compared against a snapshot of the tag values
+        last read from or written to the file, and only the modified tags are written.
+        Tracks with no modified tags are not saved and the file is not opened.
+
         :param tags: Tags to be updated.
         :param replace: Destructively replace tags in each file.
         :param dry_run: Run function, but do not modify the file on the disk.
+        :param verify: Reload the file and compare against the tags currently saved to the file
+            instead of the snapshot. Use when the file may have been modified by another program since it was loaded.
         :return: List of tags that have been updated.
         """
-        # copy and reload the mutagen object to ensure comparison are being made against current data
-        current = copy(self)
-        current._writer.file.load(current._writer.file.filename)
-        current._refresh()
+        return self._save(tags=tags, replace=replace, dry_run=dry_run, verify=verify)
+
+    def _save(
+            self,
+            tags: UnitIterable[Tags] = Tags.ALL,
+            replace: bool = False,
+            dry_run: bool = True,
+            verify: bool = False,
+    ) -> SyncResultTrack:
+        """
+        Synchronous implementation of :py:meth:`save`.
+        Allows saving to be run in a worker thread of an :py:class:`Executor`.
+        """
+        path_fields = (Tags.PATH, Tags.FOLDER, Tags.FILENAME)
+        save_path = tags == LocalTrackField.ALL or any((field in to_collection(tags) for field in path_fields))
+        move = save_path and self._new_path != self.path
 
-        result = self._writer.write(source=current, target=self, tags=tags, replace=replace, dry_run=dry_run)
+        verify = verify or self._snapshot is None
+        if not verify and not move and not self.image_links and not self._get_modified_keys():
+            return SyncResultTrack(saved=False, updated={})
 
-        path_fields = (Tags.PATH, Tags.FOLDER, Tags.FILENAME)
-        if tags == LocalTrackField.ALL or any((field in to_collection(tags) for field in path_fields)):
-            if self._new_path != self.path:
-                if not dry_run:
-                    await self.move(self._new_path)
-                result = SyncResultTrack(saved=result.saved or not dry_run, updated=result.updated | {Tags.PATH: 0})
+        if verify:
+            self._check_file_loaded()
+
+            # copy and reload the mutagen object to ensure comparison are being made against current data
+            current = copy(self)
+            current._file.load(current._file.filename)
+            current._refresh()
+            self._snapshot = {key: copy(getattr(current, key)) for key in self._tag_value_slots}
+        else:
+            # the mutagen object must hold all tags currently saved to the file to be saved without losing data
+            if self._file is None:
+                self._load_file()
+            else:
+                self._file.load(self._file.filename)
+            current = self._get_snapshot_track()
+
+        result = self._writer.write(
+            self._file,
+            source=current,
+            target=self,
+            tags=tags,
+            replace=replace,
+            dry_run=dry_run,
+            padding=self.padding_policy,
+        )
+        if result.saved:
+            self._take_snapshot(self._get_snapshot_keys(result.updated))
+
+        if move:
+            if not dry_run:
+                self._move(self._new_path)
+            result = SyncResultTrack(
+                saved=result.saved or not dry_run,
+                updated=result.updated | {Tags.PATH: 0},
+                rewritten=result.rewritten,
+            )
 
         # to reduce memory usage, remove any embedded images from the loaded file
-        current._writer.clear_loaded_images()
+        self._writer.clear_loaded_images(self._file)
+        if self.detached:
+            self._release_file()
         return result
 
     async def move(self, path: str | Path) -> None:
@@ -512,10 +758,14 @@ class LocalTrack[T: mutagen.FileType, U: TagReader, V: TagWriter](LocalItem, Tra
 
         :param path: The path to move the file to.
         """
+        self._move(path)
+
+    def _move(self, path: str | Path) -> None:
+        """Synchronous implementation of :py:meth:`move`"""
         path.parent.mkdir(parents=True, exist_ok=True)
         self._path = self.path.rename(path)
-        self._reader.file.filename = str(self.path)
-        self._writer.file.filename = str(self.path)
+        if self._file is not None:
+            self._file.filename = str(self.path)
 
     async def rename(self, filename: str | Path) -> None:
         """
@@ -541,9 +791,17 @@ class LocalTrack[T: mutagen.FileType, U: TagReader, V: TagWriter](LocalItem, Tra
         :param dry_run: Run function, but do not modify the file on the disk.
         :return: List of tags that have been removed.
         """
-        result = self._writer.delete_tags(tags=tags, dry_run=dry_run)
+        self._check_file_loaded()
+
+        result = self._writer.delete_tags(self._file, tags=tags, dry_run=dry_run, padding=self.padding_policy)
         if Tags.IMAGES in result.updated:
             self.has_image = False
+        if result.saved and self._snapshot is not None:
+            self._snapshot.update({key: None for key in self._get_snapshot_keys(result.updated)})
+            if Tags.IMAGES in result.updated:
+                self._snapshot["_has_image"] = False
+        if self.detached:
+            self._release_file()
         return result
 
     def merge(self, track: Track, tags: UnitIterable[TrackField] = TrackField.ALL) -> None:
@@ -556,9 +814,19 @@ class LocalTrack[T: mutagen.FileType, U: TagReader, V: TagWriter](LocalItem, Tra
 
     def extract_images_to_file(self, output_folder: str | Path) -> int:
         """Reload the file, extract and save all embedded images from file. Returns the number of images extracted."""
-        self._reader.file.load(self._reader.file.filename)
+        if self._file is None:
+            self._load_file()
+        else:
+            self._file.load(self._file.filename)
+
+        images = self._reader.read_images(self._file)
+
+        # to reduce memory usage, remove any embedded images from the loaded file
+        if self.detached:
+            self._release_file()
+        else:
+            self._writer.clear_loaded_images(self._file)
 
-        images = self._reader.read_images()
         if images is None:
             return 0
 
@@ -575,9 +843,6 @@ class LocalTrack[T: mutagen.FileType, U: TagReader, V: TagWriter](LocalItem, Tra
             image.save(output_path)
             count += 1
 
-        # to reduce memory usage, remove any embedded images from the loaded file
-        self._writer.clear_loaded_images()
-
         return count
 
     def as_dict(self):
@@ -597,32 +862,37 @@ class LocalTrack[T: mutagen.FileType, U: TagReader, V: TagWriter](LocalItem, Tra
 
     def __copy__(self):
         """Copy object by reloading from the file object in memory"""
-        new = self.__class__(file=self.path, remote_wrangler=self._reader.remote_wrangler)
-        new._reader = self._reader
-        new._writer = self._writer
+        new = self.__class__(file=self.path, remote_wrangler=self._reader.remote_wrangler, detached=self.detached)
+        new._file = self._file
+        new._info = self._info
 
-        if self._reader.file.tags:
+        if self._file is not None and self._file.tags:
             new._refresh()
             # image is deleted from loaded file on refresh in initial run
             # set parameter manually here rather than rely on the 2nd refresh to set it
             new.has_image = self.has_image
             new.image_links = self.image_links
-        else:  # file is not a real file, used in testing. Set shallow copy of attributes manually
+        else:  # file is not loaded or not a real file as used in testing. Set shallow copy of attributes manually
             keys = [key for key in LocalTrack.__slots__ if key.lstrip("_") in dir(self)]
             for key in keys:
                 setattr(new, key, copy(getattr(self, key)))
 
+        new._snapshot = dict(self._snapshot) if self._snapshot is not None else None
         return new
 
     def __deepcopy__(self, _: dict = None):
         """Deepcopy object by reloading from the file on disk and refreshing loaded metadata from it."""
-        new = self.__class__(file=self.path, remote_wrangler=self._reader.remote_wrangler)
+        new = self.__class__(file=self.path, remote_wrangler=self._reader.remote_wrangler, detached=self.detached)
 
-        file = mutagen.File(self.path) if self._reader.file.tags else self._reader.file
-        new._reader = self._create_reader(file)
-        new._writer = self._create_writer(file)
+        file = self._file
+        if file is None or file.tags:
+            file = mutagen.File(self.path)
+        new._file = file
+        new._info = file.info
 
         new.refresh()
+        if new.detached:
+            new._release_file()
         return new
 
     def __setitem__(self, key: str | LocalTrackField, value: Any):
@@ -4,7 +4,9 @@ Utilities for operations on :py:class:`LocalTrack` types.
 Generally, this will contain global variables representing all supported audio file types
 and a utility function for loading the appropriate :py:class:`LocalTrack` type for a path based on its extension.
 """
+from collections.abc import Mapping
 from pathlib import Path
+from typing import Any
 
 from musify.file.exception import InvalidFileType
 from musify.libraries.local.track import LocalTrack
@@ -18,7 +20,22 @@ TRACK_CLASSES = frozenset({FLAC, MP3, M4A, WMA})
 TRACK_FILETYPES = frozenset(filetype for c in TRACK_CLASSES for filetype in c.valid_extensions)
 
 
-async def load_track(path: str | Path, remote_wrangler: RemoteDataWrangler = None) -> LocalTrack:
+def _get_track_class(path: str | Path) -> type[LocalTrack]:
+    """
+    Get the appropriate :py:class:`LocalTrack` class for the given ``path`` based on its extension.
+
+    :raise InvalidFileType: If the file type is not supported.
+    """
+    ext = Path(path).suffix.lower()
+    if ext not in TRACK_FILETYPES:
+        raise InvalidFileType(ext, f"Not an accepted extension. Use only: {', '.join(TRACK_FILETYPES)}")
+
+    return next(cls for cls in TRACK_CLASSES if ext in cls.valid_extensions)
+
+
+async def load_track(
+        path: str | Path, remote_wrangler: RemoteDataWrangler = None, detached: bool = False
+) -> LocalTrack:
     """
     Attempt to load a file from a given path, returning the appropriate :py:class:`LocalTrack` object
 
@@ -27,12 +44,58 @@ async def load_track(path: str | Path, remote_wrangler: RemoteDataWrangler = Non
         This object will be used to check for and validate a URI tag on the file.
         The tag that is used for reading and writing is set by the ``uri_tag`` class attribute on the track object.
         If no ``remote_wrangler`` is given, no URI processing will occur.
+    :param detached: When True, release the mutagen object for the track after loading to reduce memory usage.
+        See :py:class:`LocalTrack` for more info.
     :return: Loaded :py:class:`LocalTrack` object
     :raise InvalidFileType: If the file type is not supported.
     """
-    ext = Path(path).suffix
-    if ext not in TRACK_FILETYPES:
-        raise InvalidFileType(ext, f"Not an accepted extension. Use only: {', '.join(TRACK_FILETYPES)}")
+    cls = _get_track_class(path)
+    return await cls(file=path, remote_wrangler=remote_wrangler, detached=detached)
+
+
+# noinspection PyProtectedMember
+def extract_track_values(path: str | Path, remote_wrangler: RemoteDataWrangler = None) -> dict[str, Any]:
+    """
+    Load a file from a given path and extract its tags and properties.
+
+    This function is synchronous and returns only picklable values
+    so that it may be run in a separate thread or process.
+    Pass the returned values to :py:func:`build_track_from_values` to rebuild the :py:class:`LocalTrack` object.
+
+    :param path: The path of the file to load.
+    :param remote_wrangler: Optionally, provide a :py:class:`RemoteDataWrangler` object for processing URIs.
+        This object will be used to check for and validate a URI tag on the file.
+        If no ``remote_wrangler`` is given, no URI processing will occur.
+    :return: The values extracted from the file.
+    :raise InvalidFileType: If the file type is not supported.
+    :raise FileDoesNotExistError: If the file cannot be found.
+    """
+    track = _get_track_class(path)(file=path, remote_wrangler=remote_wrangler)
+    track._load_file()
+    track.refresh()
+
+    return track._get_file_values()
+
+
+# noinspection PyProtectedMember
+def build_track_from_values(
+        path: str | Path, values: Mapping[str, Any], remote_wrangler: RemoteDataWrangler = None, detached: bool = False
+) -> LocalTrack:
+    """
+    Build the appropriate :py:class:`LocalTrack` object for a given path from values extracted from its file
+    by :py:func:`extract_track_values` without reading the file again.
+    The mutagen object for the track is only loaded from the file as and when it is needed e.g. when saving.
+
+    :param path: The path of the file the values were extracted from.
+    :param values: The values extracted from the file.
+    :param remote_wrangler: Optionally, provide a :py:class:`RemoteDataWrangler` object for processing URIs.
+        This should be the same object given when extracting the values.
+    :param detached: When True, release the mutagen object for the track again after each time it is loaded.
+        See :py:class:`LocalTrack` for more info.
+    :return: Loaded :py:class:`LocalTrack` object
+    :raise InvalidFileType: If the file type is not supported.
+    """
+    track = _get_track_class(path)(file=path, remote_wrangler=remote_wrangler, detached=detached)
+    track._set_file_values(values)
 
-    cls = next(cls for cls in TRACK_CLASSES if ext in cls.valid_extensions)
-    return await cls(file=path, remote_wrangler=remote_wrangler)
+    return track
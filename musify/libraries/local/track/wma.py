@@ -15,6 +15,7 @@ from musify.file.image import open_image, get_image_bytes
 # noinspection PyProtectedMember
 from musify.libraries.local.track._tags import TagReader, TagWriter
 from musify.libraries.local.track.track import LocalTrack
+from musify.libraries.remote.core.wrangle import RemoteDataWrangler
 
 try:
     from PIL import Image, UnidentifiedImageError
@@ -27,11 +28,11 @@ class _WMATagReader(TagReader[mutagen.asf.ASF]):
 
     __slots__ = ()
 
-    def read_tag(self, tag_ids: Iterable[str]) -> list[Any] | None:
+    def read_tag(self, file: mutagen.asf.ASF, tag_ids: Iterable[str]) -> list[Any] | None:
         # WMA tag values are returned as mutagen.asf._attrs.ASFUnicodeAttribute
         values = []
         for tag_id in tag_ids:
-            value: Collection[mutagen.asf.ASFBaseAttribute] = self.file.get(tag_id)
+            value: Collection[mutagen.asf.ASFBaseAttribute] = file.get(tag_id)
             if value is None:
                 # skip null or empty/blank strings
                 continue
@@ -40,11 +41,11 @@ class _WMATagReader(TagReader[mutagen.asf.ASF]):
 
         return values if len(values) > 0 else None
 
-    def read_images(self):
+    def read_images(self, file: mutagen.asf.ASF):
         if Image is None:
             return
 
-        values = self.read_tag(self.tag_map.images)
+        values = self.read_tag(file, self.tag_map.images)
         if values is None:
             return
 
@@ -85,18 +86,18 @@ class _WMATagWriter(TagWriter[mutagen.asf.ASF]):
 
     __slots__ = ()
 
-    def _write_tag(self, tag_id: str | None, tag_value: Any, dry_run: bool = True) -> bool:
+    def _write_tag(self, file: mutagen.asf.ASF, tag_id: str | None, tag_value: Any, dry_run: bool = True) -> bool:
         if not dry_run:
             if isinstance(tag_value, (list, set, tuple)):
                 if all(isinstance(v, mutagen.asf.ASFByteArrayAttribute) for v in tag_value):
-                    self.file[tag_id] = tag_value
+                    file[tag_id] = tag_value
                 else:
-                    self.file[tag_id] = [mutagen.asf.ASFUnicodeAttribute(str(v)) for v in tag_value]
+                    file[tag_id] = [mutagen.asf.ASFUnicodeAttribute(str(v)) for v in tag_value]
             else:
-                self.file[tag_id] = mutagen.asf.ASFUnicodeAttribute(str(tag_value))
+                file[tag_id] = mutagen.asf.ASFUnicodeAttribute(str(tag_value))
         return True
 
-    def _write_images(self, track: LocalTrack, dry_run: bool = True) -> bool:
+    def _write_images(self, file: mutagen.asf.ASF, track: LocalTrack, dry_run: bool = True) -> bool:
         tag_id = next(iter(self.tag_map.images), None)
 
         updated = False
@@ -116,7 +117,7 @@ class _WMATagWriter(TagWriter[mutagen.asf.ASF]):
             image.close()
 
         if len(tag_value) > 0:
-            updated = self.write_tag(tag_id, tag_value, dry_run)
+            updated = self.write_tag(file, tag_id, tag_value, dry_run)
 
         track.has_image = updated or track.has_image
         return updated
@@ -147,8 +148,10 @@ class WMA(LocalTrack[mutagen.asf.ASF, _WMATagReader, _WMATagWriter]):
         images=["WM/Picture"],
     )
 
-    def _create_reader(self, file: mutagen.asf.ASF):
-        return _WMATagReader(file, tag_map=self.tag_map, remote_wrangler=self._remote_wrangler)
+    @classmethod
+    def _create_reader(cls, remote_wrangler: RemoteDataWrangler | None = None):
+        return _WMATagReader(tag_map=cls.tag_map, remote_wrangler=remote_wrangler)
 
-    def _create_writer(self, file: mutagen.asf.ASF):
-        return _WMATagWriter(file, tag_map=self.tag_map, remote_wrangler=self._remote_wrangler)
+    @classmethod
+    def _create_writer(cls, remote_wrangler: RemoteDataWrangler | None = None):
+        return _WMATagWriter(tag_map=cls.tag_map, remote_wrangler=remote_wrangler)
@@ -7,8 +7,10 @@ from collections.abc import Collection, Mapping, Iterable
 from typing import Any, Literal, Self
 
 from musify.base import MusifyItem
+from musify.exception import MusifyKeyError
 from musify.libraries.core.object import Track, Library, Playlist
 from musify.libraries.remote.core.api import RemoteAPI
+from musify.libraries.remote.core.base import RemoteObject
 from musify.libraries.remote.core.factory import RemoteObjectFactory
 from musify.libraries.remote.core.object import RemoteCollection, SyncResultRemotePlaylist
 from musify.libraries.remote.core.object import RemoteTrack, RemotePlaylist, RemoteArtist, RemoteAlbum
@@ -41,7 +43,9 @@ class RemoteLibrary[
         loading playlists. Playlist names will be passed to this filter to limit which playlists are loaded.
     """
 
-    __slots__ = ("logger", "_factory", "_playlists", "_tracks", "_albums", "_artists", "playlist_filter")
+    __slots__ = (
+        "logger", "_factory", "_playlists", "_tracks", "_albums", "_artists", "_uri_maps", "playlist_filter"
+    )
     __attributes_classes__ = (Library, RemoteCollection)
     __attributes_ignore__ = ("api", "factory")
 
@@ -112,6 +116,64 @@ class RemoteLibrary[
         self._albums: list[AL] = []
         self._artists: list[AR] = []
 
+        # map of object type to the list of loaded objects, its length and last object when mapped,
+        # and the map of URI to the position of the first loaded object with that URI
+        self._uri_maps: dict[RemoteObjectType, tuple[list[RemoteObject], int, RemoteObject | None, dict[str, int]]] = {}
+
+    def _get_loaded(self, kind: RemoteObjectType) -> list[RemoteObject]:
+        """Get the list of loaded objects in this library for the given ``kind``"""
+        if kind == RemoteObjectType.TRACK:
+            return self._tracks
+        elif kind == RemoteObjectType.ALBUM:
+            return self._albums
+        elif kind == RemoteObjectType.ARTIST:
+            return self._artists
+        raise MusifyKeyError(f"Objects of type {kind.name!r} are not stored in this library")
+
+    def _get_uri_map(self, kind: RemoteObjectType, rebuild: bool = False) -> dict[str, int]:
+        """
+        Get the map of URI to the position of the first loaded object with that URI for the given ``kind``.
+        The map is rebuilt when ``rebuild`` is True or the list of loaded objects has been
+        replaced, resized, or had its last object changed without updating the map.
+        """
+        items = self._get_loaded(kind)
+        last = items[-1] if items else None
+        items_mapped, size, last_mapped, uri_map = self._uri_maps.get(kind, (None, 0, None, {}))
+        if not rebuild and items_mapped is items and size == len(items) and last_mapped is last:
+            return uri_map
+
+        uri_map = {}
+        for i, item in enumerate(items):
+            uri_map.setdefault(item.uri, i)
+
+        self._uri_maps[kind] = (items, len(items), last, uri_map)
+        return uri_map
+
+    def _get_loaded_by_uri(self, kind: RemoteObjectType, uri: str) -> RemoteObject | None:
+        """
+        Get the first loaded object with the given ``uri`` for the given ``kind``, or None if not loaded.
+        The map of URIs is rebuilt once when the object at the mapped position no longer has this URI
+        i.e. when the list of loaded objects has been modified in-place without updating the map.
+        """
+        items = self._get_loaded(kind)
+        uri_map = self._get_uri_map(kind)
+        if uri not in uri_map:
+            return
+
+        position = uri_map[uri]
+        if position >= len(items) or items[position].uri != uri:
+            position = self._get_uri_map(kind, rebuild=True).get(uri)
+        return items[position] if position is not None else None
+
+    def _add_loaded(self, kind: RemoteObjectType, item: RemoteObject) -> None:
+        """Add the given ``item`` to the list of loaded objects for the given ``kind``, updating its map of URIs"""
+        uri_map = self._get_uri_map(kind)
+        items = self._get_loaded(kind)
+
+        items.append(item)
+        uri_map.setdefault(item.uri, len(items) - 1)
+        self._uri_maps[kind] = (items, len(items), item, uri_map)
+
     async def __aenter__(self) -> Self:
         await self.api.__aenter__()
         return self
@@ -120,14 +182,28 @@ class RemoteLibrary[
         await self.api.__aexit__(exc_type, exc_val, exc_tb)
 
     async def extend(self, __items: Iterable[MusifyItem], allow_duplicates: bool = True) -> None:
+        """
+        Append many items to the tracks in this library.
+        Items which are not :py:class:`RemoteTrack` objects are loaded from the API by their URI.
+        Items without a URI are skipped unless they are :py:class:`RemoteTrack` objects.
+
+        :param __items: The items to add.
+        :param allow_duplicates: When False, skip any items which have the same URI as a track already in this library.
+            Duplicates are identified by URI only, so items without a URI are always added,
+            and items with a different URI are added even when their title, artist, and album match a loaded track.
+        """
         self.logger.debug(f"Extend {self.api.source} tracks data: START")
 
         load_uris = []
         for item in __items:
-            if not allow_duplicates and item in self.items:
+            if (
+                    not allow_duplicates
+                    and item.has_uri
+                    and self._get_loaded_by_uri(RemoteObjectType.TRACK, item.uri) is not None
+            ):
                 continue
             elif isinstance(item, RemoteTrack):
-                self.items.append(item)
+                self._add_loaded(RemoteObjectType.TRACK, item)
             elif item.has_uri:
                 load_uris.append(item.uri)
 
@@ -140,7 +216,8 @@ class RemoteLibrary[
         )
 
         load_tracks = await self.api.get_tracks(load_uris)
-        self.items.extend(map(self.factory.track, load_tracks))
+        for track in map(self.factory.track, load_tracks):
+            self._add_loaded(RemoteObjectType.TRACK, track)
 
         self.logger.print_line(STAT)
         self.log_tracks()
@@ -234,9 +311,9 @@ class RemoteLibrary[
             if not track.has_uri:  # skip any invalid non-remote responses
                 continue
 
-            current = next((item for item in self._tracks if item == track), None)
+            current = self._get_loaded_by_uri(RemoteObjectType.TRACK, track.uri)
             if current is None:
-                self._tracks.append(track)
+                self._add_loaded(RemoteObjectType.TRACK, track)
                 continue
 
             current._response = track.response
@@ -253,7 +330,7 @@ class RemoteLibrary[
 
     def log_tracks(self) -> None:
         in_playlists = len(self.tracks_in_playlists)
-        album_tracks = [track.uri for tracks in self.albums for track in tracks]
+        album_tracks = {track.uri for tracks in self.albums for track in tracks}
         in_albums = sum(1 for track in self.tracks if track.uri in album_tracks)
 
         width = get_max_width(self.playlists, min_width=self._log_min_width)
@@ -278,19 +355,23 @@ class RemoteLibrary[
         for response in self.logger.get_synchronous_iterator(responses, desc="Processing albums", unit="albums"):
             album = self.factory.album(response=response, skip_checks=True)
 
-            current = next((item for item in self._albums if item == album), None)
+            current = self._get_loaded_by_uri(RemoteObjectType.ALBUM, album.uri)
             if current is None:
-                self._albums.append(album)
+                self._add_loaded(RemoteObjectType.ALBUM, album)
             else:
                 current._response = album.response
                 current.refresh(skip_checks=True)
 
-            for track in album.tracks:  # add tracks from this album to the user's saved tracks
-                if track not in self.tracks:
-                    self._tracks.append(track)
+            self._add_album_tracks(album)
 
         self.logger.debug(f"Load user's saved {self.api.source} albums: DONE")
 
+    def _add_album_tracks(self, album: AL) -> None:
+        """Add the tracks from the given ``album`` to the user's saved tracks if not already loaded"""
+        for track in album.tracks:
+            if self._get_loaded_by_uri(RemoteObjectType.TRACK, track.uri) is None:
+                self._add_loaded(RemoteObjectType.TRACK, track)
+
     async def enrich_saved_albums(self, *_, **__) -> None:
         """
         Call API to enrich elements of user's saved album objects improving metadata coverage.
@@ -322,9 +403,9 @@ class RemoteLibrary[
         for response in self.logger.get_synchronous_iterator(responses, desc="Processing artists", unit="artists"):
             artist = self.factory.artist(response=response, skip_checks=True)
 
-            current = next((item for item in self._artists if item == artist), None)
+            current = self._get_loaded_by_uri(RemoteObjectType.ARTIST, artist.uri)
             if current is None:
-                self._artists.append(artist)
+                self._add_loaded(RemoteObjectType.ARTIST, artist)
                 continue
 
             current._response = artist.response
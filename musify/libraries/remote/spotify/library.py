@@ -112,10 +112,7 @@ class SpotifyLibrary(RemoteLibrary[SpotifyAPI, SpotifyPlaylist, SpotifyTrack, Sp
 
         for album in self.albums:
             album.refresh(skip_checks=False)
-
-            for track in album.tracks:  # add tracks from this album to the user's saved tracks
-                if track not in self.tracks:
-                    self._tracks.append(track)
+            self._add_album_tracks(album)
 
         self.logger.debug(f"Enrich {self.api.source} artists: DONE\n")
 
@@ -8,6 +8,7 @@ import logging.handlers
 import os
 import sys
 from collections.abc import Iterable, Awaitable
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 
@@ -135,6 +136,38 @@ class MusifyLogger(logging.Logger):
 
         return tqdm.gather(*tasks, **self._get_tqdm_kwargs(**kwargs))
 
+    async def gather_with_progress[T](
+            self, tasks: Iterable[Awaitable[T]], max_in_flight: int | None = None, **kwargs
+    ) -> list[T]:
+        """
+        Run the given awaitable objects from ``tasks`` concurrently, displaying a progress bar if tqdm is installed.
+
+        The progress bar is only updated from the running event loop as each task completes,
+        making it safe to use when tasks run concurrently in other threads e.g. by awaiting
+        :py:meth:`asyncio.loop.run_in_executor` within each task.
+        For tqdm kwargs, see :py:class:`tqdm`
+
+        :param tasks: The awaitable objects to run. Each coroutine is only started once it is allowed to run.
+        :param max_in_flight: The maximum number of tasks to run at any one time. When None, run all tasks at once.
+        :return: The results of the tasks in the order the tasks were given.
+        """
+        tasks = list(tasks)
+        bar = self.get_synchronous_iterator(total=len(tasks), **kwargs)
+        semaphore = asyncio.Semaphore(max_in_flight) if max_in_flight else nullcontext()
+
+        async def _run_task(task: Awaitable[T]) -> T:
+            async with semaphore:
+                result = await task
+            if tqdm is not None:
+                bar.update()
+            return result
+
+        try:
+            return await asyncio.gather(*map(_run_task, tasks))
+        finally:
+            if tqdm is not None:
+                bar.close()
+
     def _get_tqdm_kwargs(self, **kwargs) -> dict[str, Any]:
         # noinspection SpellCheckingInspection
         preset_keys = ("leave", "disable", "file", "ncols", "colour", "smoothing")
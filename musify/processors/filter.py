@@ -30,16 +30,49 @@ class FilterDefinedList[T: str | Path | MusifyObject](Filter[T], Collection[T]):
     def __call__(self, *args, **kwargs) -> Collection[T]:
         return self.process(*args, **kwargs)
 
-    def process(self, values: Collection[T] | None = None, *_, **__) -> Collection[T]:
-        """Returns all ``values`` that match this filter's settings"""
+    def process(
+            self, values: Collection[T] | None = None, *_, transformed: Mapping[Any, T] | None = None, **__
+    ) -> Collection[T]:
+        """
+        Returns all ``values`` that match this filter's settings
+
+        :param values: The values to filter.
+        :param transformed: Optionally, provide a map of ``{<transformed value>: <value>}`` where each value
+            has been transformed by this filter's ``transform``. When given, the values of this filter are looked up
+            in this map instead of transforming each value. The map may contain values other than the given
+            ``values``, but only those which are in the given ``values`` are returned.
+        """
         if not self.ready:
             return values
 
-        matches = [value for value in values if self.transform(value) in self.values]
+        # map of each value in this filter to the position it first appears at
+        positions: dict[Any, int] = {}
+        try:
+            for i, value in enumerate(self.values):
+                positions.setdefault(value, i)
+        except TypeError:  # values are not hashable, search through the values directly instead
+            positions = None
+
+        if positions is None:
+            matches = [value for value in values if self.transform(value) in self.values]
+            if isinstance(self.values, Sequence):
+                matches = sorted((self.values.index(self.transform(match)), match) for match in matches)
+                return [match[1] for match in matches]
+            return matches
+
+        if transformed is not None:
+            value_ids = {id(value) for value in values}
+            if isinstance(self.values, Sequence):
+                matches = (transformed[value] for value in positions if value in transformed)
+            else:
+                matches = (value for key, value in transformed.items() if key in positions)
+            return [match for match in matches if id(match) in value_ids]
+
+        matches = [(positions.get(self.transform(value)), value) for value in values]
+        matches = [match for match in matches if match[0] is not None]
         if isinstance(self.values, Sequence):
-            matches = sorted((self.values.index(self.transform(match)), match) for match in matches)
-            return [match[1] for match in matches]
-        return matches
+            matches.sort(key=lambda match: match[0])
+        return [match[1] for match in matches]
 
     def as_dict(self) -> dict[str, Any]:
         return {"values": self.values}
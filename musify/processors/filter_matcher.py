@@ -4,7 +4,7 @@ Processors that filter down objects and data types based on some given configura
 from __future__ import annotations
 
 import logging
-from collections.abc import Collection
+from collections.abc import Collection, Mapping
 from dataclasses import field, dataclass
 from typing import Any
 
@@ -13,6 +13,7 @@ from musify.field import TagField
 from musify.logger import MusifyLogger
 from musify.processors.base import Filter, FilterComposite
 from musify.processors.filter import FilterComparers, FilterDefinedList
+from musify.processors.sort import ItemSorter
 
 
 @dataclass(frozen=True)
@@ -75,26 +76,47 @@ class FilterMatcher[T: Any, U: Filter, V: Filter, X: FilterComparers](FilterComp
     def __call__(self, *args, **kwargs) -> list[T]:
         return self.process(*args, **kwargs)
 
-    def process(self, values: Collection[T], reference: T | None = None, *_, **__) -> list[T]:
+    def process(
+            self,
+            values: Collection[T],
+            reference: T | None = None,
+            *_,
+            transformed: Mapping[Any, T] | None = None,
+            **__
+    ) -> list[T]:
         """
         Return a new, filtered list of items from input ``values`` that match the stored filters.
 
         :param values: List of items to filter.
         :param reference: Optional reference track to use when filtering on
             comparers and the comparer has no expected value.
+        :param transformed: Optionally, provide a map of ``{<transformed value>: <value>}`` for all the given
+            ``values`` to pass to the ``include`` and ``exclude`` filters.
+            See :py:meth:`.FilterDefinedList.process` for more info.
         :return: List of items that match the conditions.
         """
-        return self.process_to_result(values=values, reference=reference).combined
+        return self.process_to_result(values=values, reference=reference, transformed=transformed).combined
 
-    def process_to_result(self, values: Collection[T], reference: T | None = None, *_, **__) -> MatchResult:
+    def process_to_result(
+            self,
+            values: Collection[T],
+            reference: T | None = None,
+            *_,
+            transformed: Mapping[Any, T] | None = None,
+            **__
+    ) -> MatchResult:
         """Same as :py:meth:`process` but returns the results of each filter to a :py:class`MatchResult` object"""
         if len(values) == 0:  # skip match
             return MatchResult()
 
-        included = self.include(values)
-        excluded = self.exclude(values) if self.exclude.ready else ()
-        tracks_reduced = {track for track in values if track not in included}
-        compared = self.comparers(tracks_reduced, reference=reference) if self.comparers.ready else ()
+        included = self.include(values, transformed=transformed)
+        excluded = self.exclude(values, transformed=transformed) if self.exclude.ready else ()
+
+        compared = ()
+        if self.comparers.ready:
+            included_ids = {id(track) for track in included}
+            tracks_reduced = {track for track in values if id(track) not in included_ids}
+            compared = self.comparers(tracks_reduced, reference=reference)
 
         result = MatchResult(included=included, excluded=excluded, compared=compared)
         grouped = self._get_group_by_results(values, matched=result.combined)
@@ -107,13 +129,17 @@ class FilterMatcher[T: Any, U: Filter, V: Filter, X: FilterComparers](FilterComp
         if not self.group_by or len(values) == len(matched):
             return ()
         tag_names = self.group_by.to_tag()
-        tag_values = {item[tag_name] for item in matched for tag_name in tag_names if hasattr(item, tag_name)}
+        fields = [field for field in self.group_by.map(self.group_by) if field.name.lower() in tag_names]
+
+        # group all values in a single pass and extend on every group which contains a matched item
+        matched_ids = {id(item) for item in matched}
+        grouped_ids = set()
+        for groups in ItemSorter.group_by_fields(values, fields=fields).values():
+            for group in groups.values():
+                if any(id(item) in matched_ids for item in group):
+                    grouped_ids.update(map(id, group))
 
-        return tuple(
-            item for item in values
-            if item not in matched
-            and any(item[tag_name] in tag_values for tag_name in tag_names if hasattr(item, tag_name))
-        )
+        return tuple(item for item in values if id(item) in grouped_ids and item not in matched)
 
     def __eq__(self, item: Any):
         return isinstance(item, self.__class__) and all((
@@ -1,13 +1,15 @@
 """
 Processor that matches objects and data types based on given configuration.
 """
-import inspect
+import asyncio
 import logging
-import re
-from collections.abc import Iterable, Callable, MutableSequence
-from concurrent.futures import ThreadPoolExecutor, Future, Executor
+import operator
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Callable, Collection, MutableSequence, Mapping
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 from aiorequestful.types import UnitIterable
 
@@ -17,7 +19,7 @@ from musify.libraries.core.collection import MusifyCollection
 from musify.logger import MusifyLogger
 from musify.printer import PrettyPrinter
 from musify.processors.base import Processor
-from musify.utils import limit_value, to_collection
+from musify.utils import limit_value, to_collection, casefold, get_tag_string_cleaner, NORMALISE_CACHE_SIZE
 
 
 @dataclass
@@ -32,6 +34,28 @@ class CleanTagConfig(PrettyPrinter):
     #: A function to apply before the remove and split values are applied.
     preprocess: Callable[[str], str] = field(default=lambda x: x)
 
+    def compile(self, remove: Iterable[str] = (), split: Iterable[str] = ()) -> Callable[[str], str]:
+        """
+        Compile this config once into a function which cleans string tag values,
+        caching the cleaned values for recently given raw values.
+        See :py:func:`.get_tag_string_cleaner` for more info.
+
+        :param remove: Extra string values to remove from the tag along with the ``remove`` values of this config.
+        :param split: Extra string values to split the tag on along with the ``split`` values of this config.
+        :return: The function which cleans a given raw string value.
+        """
+        cleaner = get_tag_string_cleaner(
+            remove=frozenset(self.remove.union(remove)), split=frozenset(self.split.union(split))
+        )
+        preprocess = self.preprocess
+
+        @lru_cache(maxsize=NORMALISE_CACHE_SIZE)
+        def clean(value: str) -> str:
+            """Apply transformations to the given ``value`` to clean it"""
+            return cleaner(preprocess(value))
+
+        return clean
+
     def as_dict(self) -> dict[str, Any]:
         return {
             "tag": self.tag.name.lower(),
@@ -41,10 +65,19 @@ class CleanTagConfig(PrettyPrinter):
         }
 
 
+class _CleanedItem(NamedTuple):
+    """The cleaned tags and the values needed to score an item when matching outside the process of the item"""
+    name: str
+    artist: str | None
+    album: str | None
+    uri: str | None
+    clean_tags: dict[TagField, Any]
+
+
 class ItemMatcher(Processor):
     """Matches source items/collections to given result(s)."""
 
-    __slots__ = ("logger",)
+    __slots__ = ("logger", "_clean_tags_settings", "_clean_tags_pipelines")
 
     #: A set of words to search for in tag values that identify the item as being a karaoke item.
     karaoke_tags = {"karaoke", "backing", "instrumental"}
@@ -78,11 +111,23 @@ class ItemMatcher(Processor):
     #: is found in the result but not in the source :py:class:`MusifyObject`.
     reduce_name_score_factor = 0.5
 
+    # config for bulk matching
+    #: The size in seconds of the buckets of lengths used to block results when matching in bulk.
+    #: Sources with no words in their name or artist tags are scored against results
+    #: with a length in the same or adjacent bucket.
+    #: See the :py:meth:`match_bulk` method for more information.
+    bulk_length_bucket_size = 10
+
     def __init__(self):
         # noinspection PyTypeChecker
         #: The :py:class:`MusifyLogger` for this  object
         self.logger: MusifyLogger = logging.getLogger(__name__)
 
+        # the clean tags settings from which the current pipelines were compiled
+        self._clean_tags_settings: tuple[Any, Any, Any] | None = None
+        # the tag, tag name, and compiled pipeline for each config in clean_tags_config
+        self._clean_tags_pipelines: tuple[tuple[TagField, str, Callable[[str], str]], ...] = ()
+
     def log(self, messages: MutableSequence[str], pad: str = ' ') -> None:
         """
         Log lists of ``messages`` in a uniform aligned format with a given ``pad`` character.
@@ -90,20 +135,46 @@ class ItemMatcher(Processor):
         Convenience function for ensuring consistent log format for results of operations of this class
         and any other classes which use this class.
         """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+
         messages[0] = pad * 3 + ' ' + (messages[0] if messages[0] else "unknown")
         self.logger.debug(" | ".join(messages))
 
-    def _log_algorithm(self, source: MusifyObject, extra: Iterable[str] = ()) -> None:
+    def _log_algorithm(self, source: MusifyObject, algorithm: str, extra: Iterable[str] = ()) -> None:
         """Wrapper for initially logging an algorithm in a uniform aligned format"""
-        algorithm = inspect.stack()[1][0].f_code.co_name.upper().lstrip("_").replace("_", " ")
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+
         log = [source.name, algorithm]
         if extra:
             log.extend(extra)
         self.log(log, pad='>')
 
-    def _log_test[T: MusifyObject](self, source: T, result: T | None, test: Any, extra: Iterable[str] = ()) -> None:
-        """Wrapper for initially logging a test result in a uniform aligned format"""
-        algorithm = inspect.stack()[1][0].f_code.co_name.replace("match", "").upper().lstrip("_").replace("_", " ")
+    def _log_test[T: MusifyObject](
+            self,
+            source: T,
+            result: T | None,
+            test: Any,
+            algorithm: str,
+            values: tuple[Any, Any] | None = None,
+            extra: Iterable[str] = (),
+    ) -> None:
+        """
+        Wrapper for initially logging a test result in a uniform aligned format.
+
+        Messages are only built when the logger is enabled for debug messages.
+        Pass the ``values`` compared in the test as a tuple of (source value, result value)
+        to have them formatted into the message only when it is logged.
+        """
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+
+        if isinstance(test, float):
+            test = round(test, 2)
+        if values is not None:
+            values = [round(value, 2) if isinstance(value, float) else value for value in values]
+            extra = [f"{values[0]} -> {values[1]}", *extra]
 
         if result is not None and hasattr(result, "uri"):
             log_result = f"> Testing URI: {result.uri}"
@@ -117,6 +188,9 @@ class ItemMatcher(Processor):
 
     def _log_match[T: MusifyObject](self, source: T, result: T, extra: Iterable[str] = ()) -> None:
         """Wrapper for initially logging a match in a correctly aligned format"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+
         log = [source.name, f"< Matched URI: {result.uri}"]
         if extra:
             log.extend(extra)
@@ -126,43 +200,50 @@ class ItemMatcher(Processor):
         """
         Clean tags on the input item and assign to its ``clean_tags`` attribute. Used for better matching/searching.
         Clean by removing words, and only taking phrases before a certain word e.g. 'featuring', 'part'.
-        Cleaning config for string-type tags is set in ``_clean_tags_config``.
+        Cleaning config for string-type tags is set in ``clean_tags_config``.
+
+        Each config is compiled once to a pipeline which caches the cleaned values for recently given raw values.
+        Pipelines are compiled again when any of the ``clean_tags_config``, ``clean_tags_remove_all``,
+        or ``clean_tags_split_all`` attributes are replaced.
 
         :param source: The base object with tags to clean.
         """
-        def process(val: str, conf: CleanTagConfig) -> str:
-            """Apply transformations to the given ``val`` to clean it"""
-            val = conf.preprocess(val)
-            val = re.sub(r"[(\[].*?[)\]]", "", val).casefold()
-
-            for word in conf.remove | self.clean_tags_remove_all:
-                val = re.sub(rf"\s{word}\s|^{word}\s|\s{word}$", " ", val)
-
-            for word in conf.split | self.clean_tags_split_all:
-                val = val.split(word)[0].rstrip()
-
-            return re.sub(r"[^\w']+", ' ', val).strip()
-
         source.clean_tags.clear()
         source.clean_tags[Tag.NAME] = ""
         name = source.name
 
         # process string tags according to config
-        for config in self.clean_tags_config:
-            tag_name = config.tag.to_tag().pop()
+        for tag, tag_name, pipeline in self._get_clean_tags_pipelines():
             value = getattr(source, tag_name, None)
             if not value:
-                source.clean_tags[config.tag] = ""
+                source.clean_tags[tag] = ""
                 continue
 
-            value_cleaned = process(value, conf=config)
-            source.clean_tags[config.tag] = value_cleaned
+            value_cleaned = pipeline(value)
+            source.clean_tags[tag] = value_cleaned
             if name == value:
                 source.clean_tags[Tag.NAME] = value_cleaned
 
         source.clean_tags[Tag.LENGTH] = getattr(source, Tag.LENGTH.name.lower(), None)
         source.clean_tags[Tag.YEAR] = getattr(source, Tag.YEAR.name.lower(), None)
 
+    def _get_clean_tags_pipelines(self) -> tuple[tuple[TagField, str, Callable[[str], str]], ...]:
+        """Get the compiled pipeline for each config, compiling them again if the clean tags settings were replaced"""
+        settings = (self.clean_tags_config, self.clean_tags_remove_all, self.clean_tags_split_all)
+        if self._clean_tags_settings is not None and all(map(operator.is_, settings, self._clean_tags_settings)):
+            return self._clean_tags_pipelines
+
+        self._clean_tags_pipelines = tuple(
+            (
+                config.tag,
+                config.tag.to_tag().pop(),
+                config.compile(remove=self.clean_tags_remove_all, split=self.clean_tags_split_all)
+            )
+            for config in self.clean_tags_config
+        )
+        self._clean_tags_settings = settings
+        return self._clean_tags_pipelines
+
     ###########################################################################
     ## Conditions
     ###########################################################################
@@ -170,9 +251,11 @@ class ItemMatcher(Processor):
         """Checks if a result is not a karaoke item that is either 0 when item is karaoke or 1 when not karaoke."""
         def is_karaoke(*values: str) -> bool:
             """Check if the words in the given ``values`` match any word in ``karaoke_tags``"""
-            values = {v for value in values for v in value.casefold().split()}
-            karaoke = any(word.casefold() in values for word in self.karaoke_tags)
-            self._log_test(source=source, result=result, test=karaoke, extra=[f"{self.karaoke_tags} -> {values}"])
+            values = {v for value in values for v in casefold(value).split()}
+            karaoke = any(casefold(word) in values for word in self.karaoke_tags)
+            self._log_test(
+                source=source, result=result, test=karaoke, algorithm="IS KARAOKE", values=(self.karaoke_tags, values)
+            )
             return karaoke
 
         if is_karaoke(result.name):
@@ -194,11 +277,11 @@ class ItemMatcher(Processor):
 
             # reduce a score if certain keywords are present in result and not source
             reduce_on = self.reduce_name_score_on | self.karaoke_tags
-            reduce_on = {word.casefold() for word in reduce_on}
-            if any(word in result.name.casefold() and word not in source.name.casefold() for word in reduce_on):
+            reduce_on = {casefold(word) for word in reduce_on}
+            if any(word in casefold(result.name) and word not in casefold(source.name) for word in reduce_on):
                 score = max(score * self.reduce_name_score_factor, 0)
 
-        self._log_test(source=source, result=result, test=round(score, 2), extra=[f"{source_val} -> {result_val}"])
+        self._log_test(source=source, result=result, test=score, algorithm="NAME", values=(source_val, result_val))
         return score
 
     def match_artist[T: MusifyObject](self, source: T, result: T) -> float:
@@ -213,7 +296,9 @@ class ItemMatcher(Processor):
         result_val = result.clean_tags.get(Tag.ARTIST)
 
         if not source_val or not result_val:
-            self._log_test(source=source, result=result, test=score, extra=[f"{source_val} -> {result_val}"])
+            self._log_test(
+                source=source, result=result, test=score, algorithm="ARTIST", values=(source_val, result_val)
+            )
             return score
 
         artists_source = source_val.replace(MusifyObject.tag_sep, " ")
@@ -221,7 +306,7 @@ class ItemMatcher(Processor):
 
         for i, artist in enumerate(artists_result, 1):
             score += (sum(word in artists_source for word in artist.split()) / len(artists_source.split())) * (1 / i)
-        self._log_test(source=source, result=result, test=round(score, 2), extra=[f"{source_val} -> {result_val}"])
+        self._log_test(source=source, result=result, test=score, algorithm="ARTIST", values=(source_val, result_val))
         return score
 
     def match_album[T: MusifyObject](self, source: T, result: T) -> float:
@@ -234,7 +319,7 @@ class ItemMatcher(Processor):
         if source_val and result_val:
             score = sum(word in result_val for word in source_val.split()) / len(source_val.split())
 
-        self._log_test(source=source, result=result, test=round(score, 2), extra=[f"{source_val} -> {result_val}"])
+        self._log_test(source=source, result=result, test=score, algorithm="ALBUM", values=(source_val, result_val))
         return score
 
     def match_length[T: MusifyObject](self, source: T, result: T) -> float:
@@ -246,8 +331,7 @@ class ItemMatcher(Processor):
         if source_val and result_val:
             score = max((source_val - abs(source_val - result_val)), 0) / source_val
 
-        extra = [f"{round(source_val, 2) if source_val else None} -> {round(result_val, 2) if result_val else None}"]
-        self._log_test(source=source, result=result, test=round(score, 2), extra=extra)
+        self._log_test(source=source, result=result, test=score, algorithm="LENGTH", values=(source_val, result_val))
         return score
 
     def match_year[T: MusifyObject](self, source: T, result: T) -> float:
@@ -264,7 +348,7 @@ class ItemMatcher(Processor):
         if source_val and result_val:
             score = max((self.year_range - abs(source_val - result_val)), 0) / self.year_range
 
-        self._log_test(source=source, result=result, test=round(score, 2), extra=[f"{source_val} -> {result_val}"])
+        self._log_test(source=source, result=result, test=score, algorithm="YEAR", values=(source_val, result_val))
         return score
 
     ###########################################################################
@@ -300,7 +384,192 @@ class ItemMatcher(Processor):
         if not source.clean_tags:
             self.clean_tags(source)
 
-        # process and limit match options
+        return self._match(
+            source=source,
+            results=results,
+            min_score=min_score,
+            max_score=max_score,
+            match_on=self._get_match_on(match_on),
+            allow_karaoke=allow_karaoke,
+        )
+
+    def match_bulk[T: MusifyObject](
+            self,
+            sources: Iterable[T],
+            results: Iterable[T],
+            min_score: float = 0.1,
+            max_score: float = 0.8,
+            match_on: UnitIterable[TagField] = ALL_TAG_FIELDS,
+            allow_karaoke: bool = False,
+    ) -> list[tuple[T, T | None]]:
+        """
+        Perform match algorithm for many items against one shared set of results
+        e.g. to match all the tracks of a local library against the tracks of a loaded remote library.
+
+        The results are first indexed into blocks on each word of their cleaned name and artist tags,
+        and on buckets of their length as per ``bulk_length_bucket_size``.
+        Each item is then only scored against the results which share at least one word block with it,
+        in the order the results were given, using the same scoring and thresholds as :py:meth:`match`.
+        Items with no words in their name or artist tags are scored against the results
+        in the same or adjacent length buckets instead. Items which share no block with any result are not matched.
+        Items which cannot be blocked at all are scored against all results as per :py:meth:`match`
+        i.e. when ``match_on`` contains none of ``title``, ``artist``, or ``length``,
+        or when the item has no value for any of these fields.
+
+        :param sources: Source items to compare against and find a match for.
+        :param results: Results for comparisons.
+        :param min_score: Only return the result as a match if the score is above this value.
+            Value will be limited to between 0.01 and 1.0.
+        :param max_score: Stop matching once this score has been reached.
+            Value will be limited to between 0.01 and 1.0.
+        :param match_on: List of tags to match on. Currently only the following fields are supported:
+            ``title``, ``artist``, ``album``, ``year``, ``length``.
+        :param allow_karaoke: When True, items determined to be karaoke are allowed when matching added items.
+            Skip karaoke results otherwise. Karaoke items are identified using the ``karaoke_tags`` attribute.
+        :return: List of tuples of (the source item, the result that matched best or None if no result matched).
+        """
+        match_on = self._get_match_on(match_on)
+
+        results = list(results)
+        index: dict[tuple[TagField, Any], list[int]] = defaultdict(list)
+        for i, result in enumerate(results):
+            self.clean_tags(result)
+            for key in self._get_block_keys(result, match_on=match_on):
+                index[key].append(i)
+
+        matches: list[tuple[T, T | None]] = []
+        for source in sources:
+            if not source.clean_tags:
+                self.clean_tags(source)
+
+            keys = self._get_block_keys(source, match_on=match_on, query=True)
+            if keys:
+                positions = {i for key in keys for i in index.get(key, ())}
+                candidates = [results[i] for i in sorted(positions)]
+            else:  # source cannot be blocked, score against all results
+                candidates = results
+
+            result = self._match(
+                source=source,
+                results=candidates,
+                min_score=min_score,
+                max_score=max_score,
+                match_on=match_on,
+                allow_karaoke=allow_karaoke,
+                clean_results=False,
+            )
+            matches.append((source, result))
+
+        return matches
+
+    async def match_batch[T: MusifyObject](
+            self,
+            pairs: Iterable[tuple[T, Iterable[T]]],
+            min_score: float = 0.1,
+            max_score: float = 0.8,
+            match_on: UnitIterable[TagField] = ALL_TAG_FIELDS,
+            allow_karaoke: bool = False,
+            executor: Executor | None = None,
+            chunk_size: int = 100,
+    ) -> list[T | None]:
+        """
+        Perform match algorithm for many independent pairs of a source item and its results.
+        See :py:meth:`match` for more info on the scoring parameters.
+
+        :param pairs: The pairs of (source item, results for comparisons) to match.
+        :param min_score: Only return the result as a match if the score is above this value.
+            Value will be limited to between 0.01 and 1.0.
+        :param max_score: Stop matching once this score has been reached.
+            Value will be limited to between 0.01 and 1.0.
+        :param match_on: List of tags to match on. Currently only the following fields are supported:
+            ``title``, ``artist``, ``album``, ``year``, ``length``.
+        :param allow_karaoke: When True, items determined to be karaoke are allowed when matching added items.
+            Skip karaoke results otherwise. Karaoke items are identified using the ``karaoke_tags`` attribute.
+        :param executor: Optionally, provide an :py:class:`Executor` e.g. a :py:class:`ProcessPoolExecutor`
+            to score the pairs in. The tags of all items are cleaned in this process
+            and only the cleaned tags and the values needed for scoring are passed to the executor.
+            Pairs which contain collections are always matched in this process.
+            The pairs are scored in the executor by a new instance of the class of this matcher,
+            so subclasses must be defined at module-level and be instantiable without arguments
+            to be used with a :py:class:`ProcessPoolExecutor`.
+        :param chunk_size: The number of pairs to score in each task submitted to the ``executor``.
+        :return: The result that matched best for each pair in the order given, or None if no result matched.
+        """
+        match_on = self._get_match_on(match_on)
+
+        pairs = [(source, list(results)) for source, results in pairs]
+        matches: list[T | None] = [None] * len(pairs)
+
+        cleaned: list[tuple[int, _CleanedItem, list[_CleanedItem]]] = []
+        for i, (source, results) in enumerate(pairs):
+            if not source.clean_tags:
+                self.clean_tags(source)
+
+            items = [source, *results]
+            if executor is None or any(isinstance(item, MusifyCollection) for item in items):
+                matches[i] = self._match(
+                    source=source,
+                    results=results,
+                    min_score=min_score,
+                    max_score=max_score,
+                    match_on=match_on,
+                    allow_karaoke=allow_karaoke,
+                )
+                continue
+
+            for result in results:
+                self.clean_tags(result)
+            cleaned.append((i, self._get_cleaned_item(source), list(map(self._get_cleaned_item, results))))
+
+        if not cleaned:
+            return matches
+
+        settings = {
+            "karaoke_tags": self.karaoke_tags,
+            "year_range": self.year_range,
+            "reduce_name_score_on": self.reduce_name_score_on,
+            "reduce_name_score_factor": self.reduce_name_score_factor,
+        }
+        chunk_size = max(chunk_size, 1)
+        chunks = [cleaned[i:i + chunk_size] for i in range(0, len(cleaned), chunk_size)]
+
+        loop = asyncio.get_running_loop()
+        chunk_indices = await asyncio.gather(*(
+            loop.run_in_executor(
+                executor,
+                _match_cleaned,
+                type(self),
+                settings,
+                [(source, results) for _, source, results in chunk],
+                min_score,
+                max_score,
+                match_on,
+                allow_karaoke,
+            )
+            for chunk in chunks
+        ))
+
+        for chunk, indices in zip(chunks, chunk_indices):
+            for (i, _, _), index in zip(chunk, indices):
+                if index is not None:
+                    matches[i] = pairs[i][1][index]
+
+        return matches
+
+    @staticmethod
+    def _get_cleaned_item(item: MusifyObject) -> _CleanedItem:
+        """Get the values needed to score a cleaned ``item`` as a :py:class:`_CleanedItem`"""
+        return _CleanedItem(
+            name=item.name,
+            artist=getattr(item, "artist", None),
+            album=getattr(item, "album", None),
+            uri=getattr(item, "uri", None),
+            clean_tags=dict(item.clean_tags),
+        )
+
+    @staticmethod
+    def _get_match_on(match_on: UnitIterable[TagField]) -> set[TagField]:
+        """Get the set of fields to match on, expanding any ``ALL`` fields to all the fields it represents"""
         match_on_filtered = set()
         for match_field in to_collection(match_on, set):
             if match_field == Tag.ALL:
@@ -308,139 +577,176 @@ class ItemMatcher(Processor):
             else:
                 match_on_filtered.add(match_field)
 
-        min_score = limit_value(min_score, floor=0.01, ceil=1.0)
-        max_score = limit_value(max_score, floor=0.01, ceil=1.0)
-        self._log_algorithm(source=source, extra=[f"max_score={max_score}"])
+        return match_on_filtered
 
-        with ThreadPoolExecutor(thread_name_prefix="matcher") as executor:
-            scores = self._score(
-                source=source,
-                results=results,
-                executor=executor,
-                match_on=match_on_filtered,
-                allow_karaoke=allow_karaoke
-            )
+    def _get_block_keys(
+            self, item: MusifyObject, match_on: set[TagField], query: bool = False
+    ) -> set[tuple[TagField, Any]]:
+        """
+        Get the keys of the blocks a cleaned ``item`` belongs to when matching in bulk.
+
+        :param item: The item with assigned ``clean_tags``.
+        :param match_on: The fields to match on. Only the keys for supported fields in this set are returned.
+        :param query: When True, get the keys to find the results for this item from the index instead.
+            Keys for length buckets are then only returned when the item has no word blocks,
+            and include the buckets adjacent to the item's bucket.
+        :return: Set of keys in the form of (field, value).
+        """
+        keys = set()
+        if Tag.TITLE in match_on and (name := item.clean_tags.get(Tag.NAME)):
+            keys.update((Tag.NAME, word) for word in name.split())
+        if Tag.ARTIST in match_on and (artist := item.clean_tags.get(Tag.ARTIST)):
+            keys.update((Tag.ARTIST, word) for word in artist.replace(MusifyObject.tag_sep, " ").split())
+        if query and keys:
+            return keys
+
+        if Tag.LENGTH in match_on and (length := item.clean_tags.get(Tag.LENGTH)):
+            bucket = int(length // self.bulk_length_bucket_size)
+            buckets = range(bucket - 1, bucket + 2) if query else (bucket,)
+            keys.update((Tag.LENGTH, bucket) for bucket in buckets)
+
+        return keys
+
+    def _match[T: MusifyObject](
+            self,
+            source: T,
+            results: Iterable[T],
+            min_score: float,
+            max_score: float,
+            match_on: set[TagField],
+            allow_karaoke: bool,
+            clean_results: bool = True,
+    ) -> T | None:
+        """
+        Perform match algorithm for a cleaned ``source`` and its results.
+        See :py:meth:`match` for more info on the parameters.
 
+        :param clean_results: When True, clean the tags of each result before scoring.
+            Set to False when the results have already been cleaned.
+        """
+        min_score = limit_value(min_score, floor=0.01, ceil=1.0)
+        max_score = limit_value(max_score, floor=0.01, ceil=1.0)
+        self._log_algorithm(source=source, algorithm="MATCH", extra=[f"max_score={max_score}"])
+
+        scores = self._score(
+            source=source,
+            results=results,
+            match_on=match_on,
+            allow_karaoke=allow_karaoke,
+            clean_results=clean_results,
+        )
         result, score = self._get_match_from_scores(scores, max_score=max_score)
 
         if result is not None and score > min_score:
-            extra = [
-                f"best score: {score:.2f} > {min_score:.2f}"
-                if score < max_score else
-                f"max score reached: {score:.2f} > {max_score:.2f}"
-            ]
-            self._log_match(source=source, result=result, extra=extra)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                extra = [
+                    f"best score: {score:.2f} > {min_score:.2f}"
+                    if score < max_score else
+                    f"max score reached: {score:.2f} > {max_score:.2f}"
+                ]
+                self._log_match(source=source, result=result, extra=extra)
             return result
 
-        self._log_test(
-            source=source, result=result, test=score, extra=[f"NO MATCH: {score:.2f}<{min_score:.2f}"]
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log_test(
+                source=source, result=result, test=score, algorithm="", extra=[f"NO MATCH: {score:.2f}<{min_score:.2f}"]
+            )
 
     def _score[T: MusifyObject](
             self,
             source: T,
             results: Iterable[T],
-            executor: Executor,
             match_on: set[TagField] = ALL_TAG_FIELDS,
             allow_karaoke: bool = False,
-    ) -> list[tuple[T, dict[TagField, Future[float] | list[list[Future[float]]]]]]:
+            clean_results: bool = True,
+    ) -> Iterator[tuple[T, list[float]]]:
         """
-        Gets the scores for all given ``results`` against a cleaned ``source``.
+        Lazily gets the scores for all given ``results`` against a cleaned ``source``.
+        Each result is only cleaned and scored when the returned iterator reaches it.
 
         :param source: Source item to compare against and find a match for with assigned ``clean_tags``.
         :param results: Result items for comparisons.
-        :param executor: The executor to submit tasks to.
         :param match_on: List of tags to match on. Currently only the following fields are supported:
             ``title``, ``artist``, ``album``, ``year``, ``length``.
         :param allow_karaoke: When True, items determined to be karaoke are allowed when matching added items.
             Skip karaoke results otherwise. Karaoke items are identified using the ``karaoke_tags`` attribute.
-        :return: Tuple of (the score between 0-1, the item that had the best score)
+        :param clean_results: When True, clean the tags of each result before scoring.
+            Set to False when the results have already been cleaned.
+        :return: Iterator of tuples of (the result, the score vector for the result).
+            Results with no scores are skipped.
         """
-        scores: list[tuple[T, dict[TagField, Future[float] | list[Future[float]]]]] = []
         if not results:
-            self._log_algorithm(source=source, extra=["NO RESULTS GIVEN, SKIPPING"])
-            return scores
+            self._log_algorithm(source=source, algorithm="SCORE", extra=["NO RESULTS GIVEN, SKIPPING"])
+            return
 
         for result in results:
-            self.clean_tags(result)
+            if clean_results:
+                self.clean_tags(result)
             result_scores = self._get_scores(
-                source=source, result=result, executor=executor, match_on=match_on, allow_karaoke=allow_karaoke
+                source=source, result=result, match_on=match_on, allow_karaoke=allow_karaoke
             )
             if not result_scores:
                 continue
-            scores.append((result, result_scores))
-
-        return scores
+            yield result, result_scores
 
     def _get_scores[T: MusifyObject](
             self,
             source: T,
             result: T,
-            executor: Executor,
             match_on: set[TagField] = ALL_TAG_FIELDS,
             allow_karaoke: bool = False,
-    ) -> dict[TagField, Future[float] | list[list[Future[float]]]]:
+    ) -> list[float]:
         """
         Gets the scores from a cleaned source and result to match on.
         When an MusifyCollection is given to match on,
-        scores are also calculated for each of the items in the collection.
+        scores are also calculated for each of the items in the collection
+        and the average of these scores is added as one final score.
         Scores are always between 0-1.
 
         :param source: Source item to compare against and find a match for with assigned ``clean_tags``.
         :param result: Result item to compare against with assigned ``clean_tags``.
-        :param executor: The executor to submit tasks to.
         :param match_on: List of tags to match on. Currently only the following fields are supported:
             ``title``, ``artist``, ``album``, ``year``, ``length``.
         :param allow_karaoke: When True, items determined to be karaoke are allowed when matching added items.
             Skip karaoke results otherwise. Karaoke items are identified using the ``karaoke_tags`` attribute.
-        :return: Map of score type name to score.
+        :return: The vector of scores for each field matched on.
         """
-        scores: dict[TagField, Future[float] | list[list[Future[float]]]] = {}
+        scores: list[float] = []
         if not allow_karaoke and self.match_not_karaoke(source, result) < 1:
             return scores
 
         if Tag.TITLE in match_on:
-            scores[Tag.TITLE] = executor.submit(self.match_name, source=source, result=result)
+            scores.append(self.match_name(source=source, result=result))
         if Tag.ARTIST in match_on:
-            scores[Tag.ARTIST] = executor.submit(self.match_artist, source=source, result=result)
+            scores.append(self.match_artist(source=source, result=result))
         if Tag.ALBUM in match_on:
-            scores[Tag.ALBUM] = executor.submit(self.match_album, source=source, result=result)
+            scores.append(self.match_album(source=source, result=result))
         if Tag.LENGTH in match_on:
-            scores[Tag.LENGTH] = executor.submit(self.match_length, source=source, result=result)
+            scores.append(self.match_length(source=source, result=result))
         if Tag.YEAR in match_on:
-            scores[Tag.YEAR] = executor.submit(self.match_year, source=source, result=result)
+            scores.append(self.match_year(source=source, result=result))
 
         if isinstance(source, MusifyCollection) and isinstance(result, MusifyCollection):
             # also score all the items individually in the collection
-            scores[Tag.ALL] = []
+            items_scores: list[float] = []
             for item in source.items:
                 self.clean_tags(item)
                 item_scores = self._score(
-                    source=item, results=result.items, match_on=match_on, allow_karaoke=allow_karaoke, executor=executor
+                    source=item, results=result.items, match_on=match_on, allow_karaoke=allow_karaoke
                 )
-                for _, item_score in item_scores:
-                    scores[Tag.ALL].append([score for score in item_score.values() if not isinstance(score, list)])
+                items_scores.extend(sum(item_score) / len(item_score) for _, item_score in item_scores)
+            scores.append(sum(items_scores) / len(items_scores))
 
         return scores
 
     @staticmethod
     def _get_match_from_scores[T: MusifyObject](
-            scores: Iterable[tuple[T, dict[TagField, Future[float] | list[list[Future[float]]]]]],
-            max_score: float,
+            scores: Iterable[tuple[T, Collection[float]]], max_score: float
     ) -> tuple[T | None, float]:
         best_result = None
         best_score = 0
 
-        def sum_nested_scores(futures: list[list[Future[float]]]) -> float:
-            """Sum the scores from a given list of nested Futures"""
-            scores_summed = [sum(score.result() for score in nested) / len(nested) for nested in futures]
-            return sum(scores_summed) / len(scores_summed)
-
         for result, result_scores in scores:
-            result_scores = [
-                sum_nested_scores(score) if isinstance(score, list) else score.result()
-                for score in result_scores.values()
-            ]
             score = sum(result_scores) / len(result_scores)
             if score > best_score:
                 best_score = score
@@ -461,3 +767,41 @@ class ItemMatcher(Processor):
             "karaoke_tags": self.karaoke_tags,
             "year_range": self.year_range,
         }
+
+
+def _match_cleaned(
+        matcher_class: type[ItemMatcher],
+        settings: Mapping[str, Any],
+        pairs: Iterable[tuple[_CleanedItem, list[_CleanedItem]]],
+        min_score: float,
+        max_score: float,
+        match_on: set[TagField],
+        allow_karaoke: bool,
+) -> list[int | None]:
+    """
+    Perform match algorithm for the given pairs of cleaned items with an instance of the given ``matcher_class``
+    configured with the given ``settings``. Used by :py:meth:`ItemMatcher.match_batch` to score pairs in an executor.
+
+    :return: The index of the result that matched best for each pair, or None if no result matched.
+    """
+    # settings are class attributes which are read-only on instances,
+    # apply any which were changed at runtime e.g. when the class was copied to another process
+    for name, value in settings.items():
+        if getattr(matcher_class, name) != value:
+            setattr(matcher_class, name, value)
+    matcher = matcher_class()
+
+    indices = []
+    for source, results in pairs:
+        result = matcher._match(
+            source=source,
+            results=results,
+            min_score=min_score,
+            max_score=max_score,
+            match_on=match_on,
+            allow_karaoke=allow_karaoke,
+            clean_results=False,
+        )
+        indices.append(next((i for i, item in enumerate(results) if item is result), None))
+
+    return indices
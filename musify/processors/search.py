@@ -6,6 +6,7 @@ and assigns the ID of the matched object back to the item.
 """
 import logging
 from collections.abc import Mapping, Sequence, Iterable, Collection, Awaitable
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from typing import Any, Self
 
@@ -70,9 +71,12 @@ class RemoteItemSearcher(Processor):
         during the checking operation
     :param object_factory: The :py:class:`RemoteObjectFactory` to use when creating new remote objects.
         This must have a :py:class:`RemoteAPI` assigned for this processor to work as expected.
+    :param executor: Optionally, provide an :py:class:`Executor` e.g. a :py:class:`ProcessPoolExecutor`
+        to score the results of each search in, keeping the event loop free to make other calls to the API.
+        See :py:meth:`.ItemMatcher.match_batch` for more info.
     """
 
-    __slots__ = ("logger", "matcher", "factory")
+    __slots__ = ("logger", "matcher", "factory", "executor")
 
     #: The :py:class:`SearchSettings` for each :py:class:`RemoteObjectType`
     search_settings: dict[RemoteObjectType, SearchConfig] = {
@@ -102,7 +106,7 @@ class RemoteItemSearcher(Processor):
         """The :py:class:`RemoteAPI` to call"""
         return self.factory.api
 
-    def __init__(self, matcher: ItemMatcher, object_factory: RemoteObjectFactory):
+    def __init__(self, matcher: ItemMatcher, object_factory: RemoteObjectFactory, executor: Executor | None = None):
         # noinspection PyTypeChecker
         #: The :py:class:`MusifyLogger` for this  object
         self.logger: MusifyLogger = logging.getLogger(__name__)
@@ -112,6 +116,9 @@ class RemoteItemSearcher(Processor):
         self.matcher = matcher
         #: The :py:class:`RemoteObjectFactory` to use when creating new remote objects.
         self.factory = object_factory
+        #: The :py:class:`Executor` to score the results of each search in.
+        #: Results are scored in the running process when None.
+        self.executor = executor
 
     async def __aenter__(self) -> Self:
         await self.api.__aenter__()
@@ -268,14 +275,29 @@ class RemoteItemSearcher(Processor):
             # noinspection PyTypeChecker
             results: Iterable[T] = map(self.factory[kind], responses or ())
 
+        if not results:
+            return item, None
+
+        match_on = match_on if match_on is not None else search_config.match_fields
+        if self.executor is not None:
+            result, = await self.matcher.match_batch(
+                [(item, results)],
+                match_on=match_on,
+                min_score=search_config.min_score,
+                max_score=search_config.max_score,
+                allow_karaoke=search_config.allow_karaoke,
+                executor=self.executor,
+            )
+            return item, result
+
         result = self.matcher(
             item,
             results=results,
-            match_on=match_on if match_on is not None else search_config.match_fields,
+            match_on=match_on,
             min_score=search_config.min_score,
             max_score=search_config.max_score,
             allow_karaoke=search_config.allow_karaoke,
-        ) if results else None
+        )
 
         return item, result
 
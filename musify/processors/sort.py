@@ -2,9 +2,9 @@
 Processor that sorts the given collection of items based on given configuration.
 """
 import random
-from collections.abc import Callable, Mapping, MutableMapping, Sequence, Iterable
-from copy import copy
+from collections.abc import Callable, Mapping, Sequence, Iterable
 from datetime import datetime
+from operator import attrgetter
 from random import shuffle
 from typing import Any
 
@@ -15,7 +15,7 @@ from musify.field import Field
 from musify.processors.base import Processor
 from musify.processors.exception import SorterProcessorError
 from musify.types import MusifyEnum
-from musify.utils import flatten_nested, strip_ignore_words, to_collection, limit_value, IGNORE_WORDS_DEFAULT
+from musify.utils import get_sort_string, to_collection, limit_value, IGNORE_WORDS_DEFAULT
 
 
 class ShuffleMode(MusifyEnum):
@@ -78,33 +78,47 @@ class ItemSorter(Processor):
                 items.reverse()
             return
 
-        tag_name = field.map(field)[0].name.lower()
+        getter = attrgetter(field.map(field)[0].name.lower())
+        sort_key = cls._get_sort_key(map(getter, items), ignore_words=ignore_words)
+        if sort_key is None:
+            # if no example value found, all values are None and so no sort can happen safely. Skip
+            return
+
+        items.sort(key=lambda it: sort_key(getter(it)), reverse=reverse)
+
+    @classmethod
+    def _get_sort_key(
+            cls, values: Iterable[Any], ignore_words: Iterable[str] = IGNORE_WORDS_DEFAULT
+    ) -> Callable[[Any], Any] | None:
+        """
+        Get the sort key for the given ``values`` based on the type of the first value which is not None.
 
+        :param values: The values to find an example value from.
+        :param ignore_words: The words to ignore at the beginning of a string when sorting string values.
+        :return: Sort key which takes a value as its argument, or None when all ``values`` are None.
+        """
         # attempt to find an example value to determine the value type for this sort
-        example_value = None
-        for item in items:
-            example_value = item[tag_name]
-            if example_value is not None:
-                break
+        example_value = next((value for value in values if value is not None), None)
         if example_value is None:
-            # if no example value found, all values are None and so no sort can happen safely. Skip
             return
 
         # get sort key based on value type
         if isinstance(example_value, datetime):  # key converts datetime to floats
-            def sort_key(it: MusifyItem) -> float:
-                """Get the sort key for timestamp tags from the given ``it``"""
-                value = it[tag_name]
+            def sort_key(value: datetime | None) -> float:
+                """Get the sort key for the given timestamp ``value``"""
                 return value.timestamp() if value is not None else 0.0
         elif isinstance(example_value, str):  # key strips ignore words from string
-            def sort_key(it: MusifyItem) -> tuple[bool, str]:
-                """Get the sort key for string tags from the given ``it``"""
-                not_special_start, value = strip_ignore_words(it[tag_name], words=ignore_words)
-                return not_special_start, value.casefold()
+            words = ignore_words if isinstance(ignore_words, tuple | frozenset) else tuple(ignore_words or ())
+
+            def sort_key(value: str | None) -> tuple[bool, str]:
+                """Get the sort key for the given string ``value``"""
+                return get_sort_string(value, words=words)
         else:
-            sort_key: Callable[[MusifyItem], object] = lambda t: t[tag_name] if t[tag_name] else 0
+            def sort_key(value: Any) -> Any:
+                """Get the sort key for the given ``value``"""
+                return value if value else 0
 
-        items.sort(key=sort_key, reverse=reverse)
+        return sort_key
 
     @classmethod
     def group_by_field[T: MusifyItem](cls, items: UnitIterable[T], field: Field | None = None) -> dict[Any, list[T]]:
@@ -117,26 +131,56 @@ class ItemSorter(Processor):
         """
         if field is None:  # group by None
             return {None: to_collection(items, list)}
+        return cls.group_by_fields(items, fields=field)[field]
 
-        tag_name = field.map(field)[0].name.lower()
+    @classmethod
+    def group_by_fields[T: MusifyItem](
+            cls, items: UnitIterable[T], fields: UnitIterable[Field | None] = ()
+    ) -> dict[Field | None, dict[Any, list[T]]]:
+        """
+        Group items by the values of each of the given fields in a single pass over the items.
 
-        def group(v: Any) -> None:
-            """Group items by the given value ``v``"""
-            if grouped.get(v) is None:
-                grouped[v] = []
-            grouped[v].append(item)
+        Items are grouped under each of their values for fields which have many values e.g. genres.
 
-        grouped: dict[Any | None, list[T]] = {}
-        for item in items:  # produce map of grouped values
-            value = to_collection(item[tag_name])
-            if isinstance(value, Iterable):
-                for val in value:
-                    group(val)
-            else:
-                group(value)
+        :param items: List of items to group.
+        :param fields: Tags or properties to group by. None groups all items under the key ``None``.
+        :return: Map of ``{<field>: <map of grouped items>}`` for each of the given fields.
+        """
+        items = to_collection(items, list)
+        fields = [fields] if fields is None or isinstance(fields, Field) else fields
+
+        grouped: dict[Field | None, dict[Any, list[T]]] = {}
+        getters: list[tuple[Callable[[T], Any], dict[Any, list[T]]]] = []
+        for field in fields:
+            if field in grouped:
+                continue
+            if field is None:  # group by None
+                grouped[field] = {None: items}
+                continue
+
+            grouped[field] = {}
+            getters.append((attrgetter(field.map(field)[0].name.lower()), grouped[field]))
+
+        for item in items:  # produce maps of grouped values
+            for getter, groups in getters:
+                value = getter(item)
+                if isinstance(value, Iterable) and not isinstance(value, str | Mapping):
+                    for val in value:
+                        cls._add_to_group(groups, key=val, item=item)
+                else:
+                    cls._add_to_group(groups, key=value, item=item)
 
         return grouped
 
+    @staticmethod
+    def _add_to_group[T: MusifyItem](groups: dict[Any, list[T]], key: Any, item: T) -> None:
+        """Add the given ``item`` to the group for the given ``key`` in ``groups``"""
+        group_items = groups.get(key)
+        if group_items is None:
+            groups[key] = [item]
+        else:
+            group_items.append(item)
+
     def __init__(
             self,
             fields: UnitSequence[Field | None] | Mapping[Field | None, bool] = (),
@@ -161,11 +205,7 @@ class ItemSorter(Processor):
             return
 
         if self.sort_fields:
-            items_nested = self._sort_by_fields(
-                {None: items}, fields=self.sort_fields, ignore_words=self.ignore_words
-            )
-            items.clear()
-            items.extend(flatten_nested(items_nested))
+            self._sort_by_fields(items, fields=self.sort_fields, ignore_words=self.ignore_words)
         elif self.shuffle_mode == ShuffleMode.RANDOM:
             shuffle(items)
         elif self.shuffle_mode == ShuffleMode.HIGHER_RATING:
@@ -226,30 +266,45 @@ class ItemSorter(Processor):
     @classmethod
     def _sort_by_fields(
             cls,
-            items_grouped: MutableMapping, fields: MutableMapping[Field | None, bool],
+            items: list[MusifyItem],
+            fields: Mapping[Field | None, bool],
             ignore_words: Iterable[str] = IGNORE_WORDS_DEFAULT
-    ) -> MutableMapping:
+    ) -> None:
         """
-        Sort items by the given fields recursively in the order given.
+        Sort items in-place by the given fields in the order given with a single sort on a composite key.
+
+        For each field, items with equal sort keys but different values e.g. strings which only differ in case,
+        are kept grouped by their values in the order each value first appears before sorting on the next field.
 
-        :param items_grouped: Map of items grouped by the last sort value.
+        :param items: List of items to sort.
+        :param fields: Map of ``{<tag/property>: <reversed>}``. Fields after the first None field are ignored.
         :param ignore_words: The words to ignore at the beginning of a string when sorting string values.
-        :return: Map of grouped and sorted items.
         """
-        field, reverse = next(iter(fields.items()), (None, None))
-        if field is None:  # sorting complete
-            return items_grouped
+        keys: list[list[int]] = [[] for _ in items]
+        groups: list[int] = [0] * len(items)
+
+        for field, reverse in fields.items():
+            if field is None:  # sorting complete
+                break
+
+            getter = attrgetter(field.map(field)[0].name.lower())
+            values = [tuple(value) if isinstance(value, list | set) else value for value in map(getter, items)]
+            sort_key = cls._get_sort_key(values, ignore_words=ignore_words)
+            if sort_key is None:  # all values are None, skip
+                continue
 
-        fields = copy(fields)
-        fields.pop(field)
+            # rank each distinct value once on its sort key, negating ranks to reverse the order of this field
+            sort_keys = {value: sort_key(value) for value in set(values)}
+            ranks = {key: -i if reverse else i for i, key in enumerate(sorted(set(sort_keys.values())))}
 
-        # sort each group and recurse through each field for each group
-        for i, (key, items) in enumerate(items_grouped.items(), 1):
-            cls.sort_by_field(items=items, field=field, reverse=reverse, ignore_words=ignore_words)
-            groups = cls.group_by_field(items, field=field)
-            items_grouped[key] = cls._sort_by_fields(groups, fields=fields, ignore_words=ignore_words)
+            # group items by their values for this and all previous fields, identified by first position in the group
+            first_positions: dict[tuple[int, Any], int] = {}
+            for i, value in enumerate(values):
+                groups[i] = first_positions.setdefault((groups[i], value), i)
+                keys[i].extend((ranks[sort_keys[value]], groups[i]))
 
-        return items_grouped
+        positions = sorted(range(len(items)), key=keys.__getitem__)
+        items[:] = [items[i] for i in positions]
 
     def as_dict(self):
         fields = None
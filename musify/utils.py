@@ -4,7 +4,8 @@ Generic utility functions and classes which can be used throughout the entire pa
 import re
 import unicodedata
 from collections import Counter
-from collections.abc import Iterable, Collection, MutableSequence, Mapping, MutableMapping
+from collections.abc import Iterable, Collection, MutableSequence, Mapping, MutableMapping, Callable
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from aiorequestful.types import Number
@@ -174,6 +175,73 @@ def align_string(value: Any, max_width: int = 0, truncate_left: bool = False) ->
     return f"{value_truncated:<{max_width}.{max_width}}"
 
 
+###########################################################################
+## String normalisation
+###########################################################################
+#: The maximum number of results to cache for each of the string normalisation functions.
+NORMALISE_CACHE_SIZE = 2 ** 16
+
+
+@lru_cache(maxsize=NORMALISE_CACHE_SIZE)
+def casefold(value: str) -> str:
+    """Returns the casefolded ``value``, caching the results for recently given values"""
+    return value.casefold()
+
+
+def get_sort_string(value: str | None, words: Iterable[str] | None = IGNORE_WORDS_DEFAULT) -> tuple[bool, str]:
+    """
+    Get the key to sort on for the given string ``value``, caching the results for recently given values.
+
+    :return: Tuple of (True if the string does not start with some special character,
+        the casefolded string with any ignorable start word removed as per :py:func:`strip_ignore_words`)
+    """
+    if not value:
+        return False, ""
+    return _get_sort_string(value, words=words if isinstance(words, tuple | frozenset) else tuple(words or ()))
+
+
+@lru_cache(maxsize=NORMALISE_CACHE_SIZE)
+def _get_sort_string(value: str, words: tuple[str, ...] | frozenset[str]) -> tuple[bool, str]:
+    not_special_start, value = strip_ignore_words(value, words=words)
+    return not_special_start, value.casefold()
+
+
+_BRACKETS_PATTERN = re.compile(r"[(\[].*?[)\]]")
+_SPECIAL_CHARACTERS_PATTERN = re.compile(r"[^\w']+")
+
+
+@lru_cache(maxsize=2 ** 8)
+def get_tag_string_cleaner(
+        remove: frozenset[str] = frozenset(), split: frozenset[str] = frozenset()
+) -> Callable[[str], str]:
+    """
+    Compile the given ``remove`` and ``split`` words once into a function which cleans string tag values for matching.
+
+    The returned function removes any text in brackets, casefolds, removes all words in ``remove``,
+    slices the value on the first word in ``split`` taking only the text before it, and removes any special characters.
+    All ``remove`` words are removed with a single regex pattern
+    and the value is sliced on the first match of a single regex pattern for all ``split`` words.
+    The results of this function are cached for recently given words.
+    """
+    remove_pattern = None
+    if remove:
+        words = "|".join(map(re.escape, sorted(remove)))
+        remove_pattern = re.compile(rf"(?<=\s)(?:{words})(?=\s|$)|^(?:{words})(?=\s)")
+    split_pattern = re.compile("|".join(map(re.escape, sorted(split)))) if split else None
+
+    def clean(value: str) -> str:
+        """Clean the given string tag ``value``"""
+        value = _BRACKETS_PATTERN.sub("", value).casefold()
+        if remove_pattern is not None:
+            value = remove_pattern.sub(" ", value)
+        if split_pattern is not None and (match := split_pattern.search(value)) is not None:
+            value = value[:match.start()].rstrip()
+
+        return _SPECIAL_CHARACTERS_PATTERN.sub(" ", value).strip()
+
+    return clean
+
+
 ###########################################################################
 ## Number
 ###########################################################################
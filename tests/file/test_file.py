@@ -1,15 +1,41 @@
+from pathlib import Path
 from random import choice
 
 import pytest
 
-from musify.file.base import File
+from musify.file.base import File, get_filepaths_by_extension
 from musify.file.path_mapper import PathMapper, PathStemMapper
 from tests.libraries.local.track.utils import random_tracks
-from tests.libraries.local.utils import path_track_all
+from tests.libraries.local.utils import path_track_all, path_track_resources
 from tests.testers import PrettyPrinterTester
 from tests.utils import random_str
 
 
+def test_get_filepaths_by_extension(tmp_path: Path):
+    extensions = {path.suffix for path in path_track_all}
+    paths = get_filepaths_by_extension(path_track_resources, extensions=extensions)
+    assert set(paths) == extensions
+    assert {path for ext_paths in paths.values() for path in ext_paths} == path_track_all
+    assert all(path.suffix == ext for ext, ext_paths in paths.items() for path in ext_paths)
+
+    expected = {
+        tmp_path.joinpath("track.flac"),
+        tmp_path.joinpath("sub", "folder", "track.flac"),
+        tmp_path.joinpath("sub", "TRACK.FLAC"),
+    }
+    ignored = {
+        tmp_path.joinpath(".hidden.flac"),
+        tmp_path.joinpath("track.mp3"),
+        tmp_path.joinpath("$RECYCLE.BIN", "track.flac"),
+    }
+    for path in expected | ignored:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.touch()
+
+    assert get_filepaths_by_extension(tmp_path, extensions={".flac"}) == {".flac": expected}
+    assert get_filepaths_by_extension(tmp_path.joinpath("does_not_exist"), extensions={".flac"}) == {".flac": set()}
+
+
 class TestPathMapper(PrettyPrinterTester):
     @pytest.fixture
     def obj(self) -> PathMapper:
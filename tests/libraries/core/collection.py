@@ -5,7 +5,7 @@ from copy import deepcopy
 import pytest
 
 from musify.base import MusifyItem
-from musify.exception import MusifyTypeError
+from musify.exception import MusifyTypeError, MusifyKeyError
 from musify.libraries.collection import BasicCollection
 from musify.libraries.core.collection import MusifyCollection
 from musify.libraries.remote.core.library import RemoteLibrary
@@ -186,6 +186,52 @@ class MusifyCollectionTester(PrettyPrinterTester, metaclass=ABCMeta):
         del collection[item]
         assert item not in collection
 
+    @staticmethod
+    def test_collection_getitem_index_updates(collection: MusifyCollection):
+        names = [item.name for item in collection.items]
+        item = next(i for i in collection.items if collection.items.count(i) == 1 and names.count(i.name) == 1)
+        assert collection[item.name] is item
+
+        collection.remove(item)
+        with pytest.raises(MusifyKeyError):
+            assert collection[item.name]
+
+        collection.append(item)
+        assert collection[item.name] is item
+        assert collection.items.index(item) == len(collection) - 1
+
+        collection.pop()
+        collection.insert(0, item)
+        assert collection[item.name] is item
+        assert collection.items.index(item) == 0
+
+        # changes to the list of items made directly are also picked up
+        collection.items.pop(0)
+        with pytest.raises(MusifyKeyError):
+            assert collection[item.name]
+        collection.items.append(item)
+        assert collection[item.name] is item
+
+        collection.clear()
+        with pytest.raises(MusifyKeyError):
+            assert collection[item.name]
+
+    @staticmethod
+    def test_collection_membership(collection: MusifyCollection, collection_merge_items: Iterable[MusifyItem]):
+        merge_items = list(collection_merge_items)
+        assert all(item in collection for item in collection.items)
+        assert all(item not in collection for item in merge_items)
+
+        length = len(collection)
+        collection.extend(collection.items[:2] + merge_items + merge_items, allow_duplicates=False)
+        assert len(collection) == length + len(merge_items)
+        assert collection.items[length:] == merge_items
+        assert all(item in collection for item in merge_items)
+
+        collection.append(merge_items[0], allow_duplicates=False)
+        collection.insert(0, merge_items[0], allow_duplicates=False)
+        assert len(collection) == length + len(merge_items)
+
     @staticmethod
     def test_collection_sort(collection: MusifyCollection):
         items = collection.items.copy()
@@ -1,9 +1,13 @@
+import os
+import shutil
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 from random import randrange, sample
 
 import pytest
+from pytest_mock import MockerFixture
 
 from musify.base import MusifyItem
 from musify.file.path_mapper import PathMapper, PathStemMapper
@@ -15,7 +19,7 @@ from tests.libraries.local.library.testers import LocalLibraryTester
 from tests.libraries.local.track.utils import random_track, random_tracks
 from tests.libraries.local.utils import path_playlist_m3u, path_playlist_xautopf_bp
 from tests.libraries.local.utils import path_playlist_resources, path_playlist_all
-from tests.libraries.local.utils import path_track_resources, path_track_all
+from tests.libraries.local.utils import path_track_resources, path_track_all, path_track_flac, path_track_mp3
 from tests.utils import path_resources
 
 
@@ -100,6 +104,27 @@ class TestLocalLibrary(LocalLibraryTester):
         assert len(library.artists) == len(set(artist for track in library.tracks for artist in track.artists))
         assert len(library.genres) == len(set(genre for track in library.tracks for genre in track.genres))
 
+    def test_collection_creators_cached(self, library: LocalLibrary):
+        albums = library.albums
+        assert [album.name for album in library.albums] == [album.name for album in albums]
+        assert all(album_cached is not album for album_cached, album in zip(library.albums, albums))
+
+        # changes to the returned collections do not affect later calls
+        album = albums[0]
+        album.pop()
+        assert len(next(alb for alb in library.albums if alb.name == album.name)) == len(album) + 1
+
+        # regenerated when tracks are removed from the library
+        track = next(track for track in library.tracks if track.album)
+        library.remove(track)
+        assert all(track not in album for album in library.albums)
+
+        # regenerated when the index is cleared after changing tags directly
+        library.tracks[0].album = "a brand new album"
+        assert "a brand new album" not in {album.name for album in library.albums}
+        library.clear_index()
+        assert "a brand new album" in {album.name for album in library.albums}
+
     async def test_load(self, path_mapper: PathMapper):
         library = LocalLibrary(
             library_folders=path_track_resources, playlist_folder=path_playlist_resources, path_mapper=path_mapper
@@ -121,6 +146,109 @@ class TestLocalLibrary(LocalLibraryTester):
 
         assert len(library.tracks) == len(library._track_paths) == len(path_track_all) + 2
 
+    async def test_load_tracks_with_executor(self, mocker: MockerFixture):
+        library = LocalLibrary(library_folders=path_track_resources)
+        path_missing = path_track_resources.joinpath("does_not_exist.flac")
+        library._track_paths.add(path_missing)
+
+        # errors are cleared after logging, patch the logging to check the errors recorded
+        log_errors = mocker.patch.object(LocalLibrary, "_log_errors")
+        with ThreadPoolExecutor() as executor:
+            await library.load_tracks(executor=executor)
+
+        assert {track.path for track in library.tracks} == path_track_all
+        assert library.errors == [path_missing]
+        log_errors.assert_called_once()
+
+        library_sequential = LocalLibrary(library_folders=path_track_resources)
+        await library_sequential.load_tracks()
+        for track in library.tracks:
+            track_sequential = library_sequential[track.path]
+            assert track.__class__ == track_sequential.__class__
+            assert track.title == track_sequential.title
+            assert track.uri == track_sequential.uri
+            assert track.length == track_sequential.length
+
+    async def test_load_tracks_with_upper_case_extensions(self, tmp_path: Path):
+        paths = {
+            shutil.copy(path, tmp_path.joinpath(path.with_suffix(path.suffix.upper()).name))
+            for path in (path_track_flac, path_track_mp3)
+        }
+
+        library = LocalLibrary(library_folders=tmp_path)
+        assert library._track_paths == paths
+
+        await library.load_tracks()
+        assert {track.path for track in library.tracks} == paths
+        assert not library.errors
+
+    async def test_load_tracks_with_cache(self, tmp_path: Path):
+        path_cache = tmp_path.joinpath("cache.db")
+        library = LocalLibrary(library_folders=path_track_resources, track_cache_path=path_cache)
+        await library.load_tracks()
+
+        assert path_cache.is_file()
+        assert len(library.track_cache) == len(path_track_all)
+        assert all(track._file is not None for track in library.tracks)
+
+        library_cached = LocalLibrary(library_folders=path_track_resources, track_cache_path=path_cache)
+        await library_cached.load_tracks()
+
+        assert {track.path for track in library_cached.tracks} == path_track_all
+        assert all(track._file is None for track in library_cached.tracks)  # all rebuilt from the cache
+        for track in library_cached.tracks:
+            track_loaded = library[track.path]
+            assert track.__class__ == track_loaded.__class__
+            assert track.title == track_loaded.title
+            assert track.uri == track_loaded.uri
+            assert track.length == track_loaded.length
+
+    async def test_refresh(self, tmp_path: Path):
+        library_folder = tmp_path.joinpath("library")
+        shutil.copytree(path_track_resources, library_folder)
+        paths = sorted(library_folder.joinpath(path.name) for path in path_track_all)
+        path_removed, path_modified, path_unchanged = paths[:3]
+
+        playlist_folder = tmp_path.joinpath("playlists")
+        playlist_folder.mkdir()
+        playlist_folder.joinpath("removed.m3u").write_text(str(path_removed), encoding="utf-8")
+        playlist_folder.joinpath("unchanged.m3u").write_text(str(path_unchanged), encoding="utf-8")
+
+        library = LocalLibrary(library_folders=library_folder, playlist_folder=playlist_folder)
+        await library.load()
+        track_unchanged = library[path_unchanged]
+        playlist_unchanged = library.playlists["unchanged"]
+
+        result = await library.refresh()
+        assert not result.added and not result.removed and not result.modified
+        assert not result.playlists_loaded and not result.playlists_removed
+        assert library[path_unchanged] is track_unchanged
+
+        path_added = library_folder.joinpath("folder", path_removed.name)
+        path_added.parent.mkdir()
+        path_removed.rename(path_added)
+        stat = path_modified.stat()
+        os.utime(path_modified, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        playlist_folder.joinpath("new.m3u").write_text(str(path_added), encoding="utf-8")
+
+        result = await library.refresh()
+        assert result.added == {path_added}
+        assert result.removed == {path_removed}
+        assert result.modified == {path_modified}
+        assert result.playlists_loaded == {"removed", "new"}
+        assert not result.playlists_removed
+
+        assert {track.path for track in library.tracks} == set(paths) - {path_removed} | {path_added}
+        assert library[path_unchanged] is track_unchanged
+        assert library.playlists["unchanged"] is playlist_unchanged
+        assert len(library.playlists["removed"]) == 0
+        assert library.playlists["new"].tracks == [library[path_added]]
+
+        playlist_folder.joinpath("new.m3u").unlink()
+        result = await library.refresh()
+        assert result.playlists_removed == {"new"}
+        assert set(library.playlists) == {"removed", "unchanged"}
+
     @pytest.fixture
     def merge_playlists_updated_paths(
             self, library: LocalLibrary, collection_merge_items: Iterable[MusifyItem], tmp_path: Path
@@ -185,6 +185,41 @@ class TestMusicBee(LocalLibraryTester):
         assert track_wma.last_played == datetime(2023, 5, 30, 22, 57, 24)
         assert track_wma.play_count == 200
 
+    async def test_refresh(self, musicbee_folder: Path, path_mapper: PathMapper):
+        library = MusicBee(musicbee_folder=musicbee_folder, path_mapper=path_mapper)
+        await library.load()
+
+        track_mp3: LocalTrack = library[path_track_mp3]
+        track_mp3.rating = None
+        track_mp3.play_count = 0
+
+        # only reloaded tracks are enriched when the library file has not been modified
+        result = await library.refresh()
+        assert not result.added and not result.removed and not result.modified
+        assert library[path_track_mp3] is track_mp3
+        assert track_mp3.rating is None
+        assert track_mp3.play_count == 0
+
+        library._track_stats[path_track_mp3] = None  # force the track to be reloaded
+        result = await library.refresh()
+        assert result.modified == {path_track_mp3}
+        assert library[path_track_mp3] is not track_mp3
+        assert library[path_track_mp3].rating == 20
+        assert library[path_track_mp3].play_count == 5
+
+        # all tracks are enriched again when the library file has been modified
+        track_mp3 = library[path_track_mp3]
+        track_mp3.rating = None
+        track_mp3.play_count = 0
+
+        stat = library._library_xml_path.stat()
+        os.utime(library._library_xml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        await library.refresh()
+        assert library._library_xml_stat == (stat.st_size, stat.st_mtime_ns + 1_000_000_000)
+        assert library[path_track_mp3] is track_mp3
+        assert track_mp3.rating == 20
+        assert track_mp3.play_count == 5
+
     # noinspection PyTestUnpassedFixture
     async def test_save(self, musicbee_folder: Path, path_mapper: PathMapper, remote_wrangler: RemoteDataWrangler):
         library = MusicBee(musicbee_folder=musicbee_folder, path_mapper=path_mapper, remote_wrangler=remote_wrangler)
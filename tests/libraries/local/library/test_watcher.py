@@ -0,0 +1,123 @@
+import asyncio
+import errno
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+
+from musify.file.exception import FileDoesNotExistError
+from musify.libraries.local.library import LocalLibrary, LibraryWatcher, RefreshResult
+from musify.libraries.local.library.watcher import _Inotify
+from tests.libraries.local.utils import path_track_all, path_track_resources
+
+
+class TestLibraryWatcher:
+
+    @pytest.fixture
+    async def library(self, tmp_path: Path) -> LocalLibrary:
+        """Yields a loaded :py:class:`LocalLibrary` with library and playlist folders in a temporary folder"""
+        shutil.copytree(path_track_resources, tmp_path.joinpath("library"))
+        tmp_path.joinpath("playlists").mkdir()
+
+        library = LocalLibrary(
+            library_folders=tmp_path.joinpath("library"), playlist_folder=tmp_path.joinpath("playlists")
+        )
+        await library.load()
+        return library
+
+    @staticmethod
+    async def get_result(watcher: LibraryWatcher) -> RefreshResult:
+        """Wait for the next result from the given ``watcher``"""
+        return await asyncio.wait_for(anext(watcher), timeout=5)
+
+    @pytest.mark.parametrize("use_polling", [
+        pytest.param(False, marks=pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")),
+        True,
+    ])
+    async def test_watch(self, library: LocalLibrary, use_polling: bool, tmp_path: Path):
+        library_folder = library.library_folders[0]
+        paths = sorted(library_folder.joinpath(path.name) for path in path_track_all)
+
+        watcher = LibraryWatcher(library, debounce=0.1, poll_interval=0.1, use_polling=use_polling)
+        async with watcher:
+            assert watcher.running
+            assert watcher.polling == use_polling
+
+            # copy outside the library first to avoid detecting partially written files when polling
+            path_copy = tmp_path.joinpath(paths[0].name)
+            shutil.copyfile(paths[0], path_copy)
+            path_added = library_folder.joinpath("folder", "sub-folder", paths[0].name)
+            path_added.parent.mkdir(parents=True)
+            path_copy.rename(path_added)
+
+            result = await self.get_result(watcher)
+            assert result.added == {path_added}
+            assert path_added in {track.path for track in library.tracks}
+
+            shutil.move(library_folder.joinpath("folder"), tmp_path.joinpath("folder"))
+            result = await self.get_result(watcher)
+            assert result.removed == {path_added}
+            assert path_added not in {track.path for track in library.tracks}
+
+            library.playlist_folder.joinpath("playlist.m3u").write_text(str(paths[1]), encoding="utf-8")
+            result = await self.get_result(watcher)
+            assert result.playlists_loaded == {"playlist"}
+            assert library.playlists["playlist"].tracks == [library[paths[1]]]
+
+            stat = paths[1].stat()
+            os.utime(paths[1], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            result = await self.get_result(watcher)
+            assert result.modified == {paths[1]}
+            assert result.playlists_loaded == {"playlist"}
+
+        assert not watcher.running
+        assert [result async for result in watcher] == []
+
+    async def test_watch_continues_on_error(self, library: LocalLibrary, tmp_path: Path, mocker: MockerFixture):
+        library_folder = library.library_folders[0]
+        path = next(library_folder.joinpath(path.name) for path in path_track_all)
+
+        refresh = LocalLibrary.refresh
+        calls = 0
+
+        async def refresh_fails_once(*args, **kwargs) -> RefreshResult:
+            """Raise on the first refresh e.g. as when a file is removed before it can be read"""
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise FileDoesNotExistError(path)
+            return await refresh(*args, **kwargs)
+
+        mocker.patch.object(LocalLibrary, "refresh", new=refresh_fails_once)
+
+        watcher = LibraryWatcher(library, debounce=0.1, poll_interval=0.1, use_polling=True)
+        async with watcher:
+            path_copy = tmp_path.joinpath(path.name)
+            shutil.copyfile(path, path_copy)
+            path_added = library_folder.joinpath("folder", path.name)
+            path_added.parent.mkdir(parents=True)
+            path_copy.rename(path_added)
+
+            result = await self.get_result(watcher)
+            assert calls > 1
+            assert watcher.running
+            assert result.added == {path_added}
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Linux only")
+    def test_inotify_read_on_watch_limit(self, tmp_path: Path, mocker: MockerFixture):
+        inotify = _Inotify()
+        try:
+            inotify.add(tmp_path)
+
+            mocker.patch.object(_Inotify, "add", side_effect=OSError(errno.ENOSPC, os.strerror(errno.ENOSPC)))
+            folder = tmp_path.joinpath("folder")
+            folder.mkdir()
+
+            paths, overflow = inotify.read()
+            assert folder in paths
+            assert overflow
+        finally:
+            inotify.close()
@@ -1,7 +1,11 @@
 from abc import ABCMeta
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import pytest
+
+from musify.exception import MusifyTypeError
 from musify.libraries.local.library import LocalLibrary
 from musify.libraries.local.playlist.m3u import SyncResultM3U
 from musify.libraries.local.playlist.xautopf import SyncResultXAutoPF
@@ -18,6 +22,7 @@ class LocalLibraryTester(LibraryTester, LocalCollectionTester, metaclass=ABCMeta
             playlist.pop()
 
         results = await library.save_playlists(dry_run=True)
+        assert await library.save_playlists(dry_run=True, max_in_flight=4) == results
 
         assert len(results) == len(library.playlists)
         for pl, result in results.items():
@@ -29,6 +34,14 @@ class LocalLibraryTester(LibraryTester, LocalCollectionTester, metaclass=ABCMeta
             elif isinstance(result, SyncResultXAutoPF):
                 assert result.start - result.final == 1
 
+    @staticmethod
+    async def test_playlists_with_process_pool_fails(library: LocalLibrary):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            with pytest.raises(MusifyTypeError):
+                await library.load_playlists(executor=executor)
+            with pytest.raises(MusifyTypeError):
+                await library.save_playlists(dry_run=True, executor=executor)
+
     @staticmethod
     def test_restore_tracks(library: LocalLibrary):
         new_title = "brand new title"
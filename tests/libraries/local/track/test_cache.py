@@ -0,0 +1,115 @@
+import json
+import os
+import shutil
+import sqlite3
+from pathlib import Path
+
+from musify.file.base import get_file_stat
+from musify.libraries.local.track import LocalTrack, TrackCache, extract_track_values
+from musify.libraries.remote.core.wrangle import RemoteDataWrangler
+
+
+def test_get_and_set(track: LocalTrack, remote_wrangler: RemoteDataWrangler, tmp_path: Path):
+    cache = TrackCache(tmp_path.joinpath("cache.db"), remote_wrangler=remote_wrangler)
+    assert len(cache) == 0
+    assert cache.get(track.path) is None
+
+    values = extract_track_values(track.path, remote_wrangler=remote_wrangler)
+    cache.set(track.path, values)
+    assert len(cache) == 1
+
+    values_cached = cache.get(track.path)
+    assert values_cached.keys() == values.keys()
+    assert values_cached["_title"] == track.title
+    assert values_cached["_uri"] == track.uri
+    assert values_cached["_info"] == values["_info"]
+
+    # does not return values when the file has changed since it was cached
+    stat = track.path.stat()
+    os.utime(track.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get(track.path) is None
+
+    cache.set(track.path, values)
+    assert cache.get(track.path) is not None
+    cache.remove(track.path)
+    assert len(cache) == 0
+    assert cache.get(track.path) is None
+
+
+def test_get_and_set_with_stat(track: LocalTrack, remote_wrangler: RemoteDataWrangler, tmp_path: Path):
+    cache = TrackCache(tmp_path.joinpath("cache.db"), remote_wrangler=remote_wrangler)
+    stat = get_file_stat(track.path)
+    values = extract_track_values(track.path, remote_wrangler=remote_wrangler)
+
+    # file changes after the values were read
+    os.utime(track.path, ns=(track.path.stat().st_atime_ns, stat[1] + 1_000_000_000))
+    cache.set(track.path, values, stat=stat)
+    assert cache.get(track.path, stat=stat) is not None
+    assert cache.get(track.path) is None
+    assert cache.get(track.path, stat=get_file_stat(track.path)) is None
+
+
+def test_save_and_load(track: LocalTrack, remote_wrangler: RemoteDataWrangler, tmp_path: Path):
+    path = tmp_path.joinpath("folder", "cache.db")
+    values = extract_track_values(track.path, remote_wrangler=remote_wrangler)
+
+    with TrackCache(path, remote_wrangler=remote_wrangler) as cache:
+        cache.set(track.path, values)
+        cache.set(tmp_path.joinpath("does_not_exist.flac"), values)  # not cached when the file does not exist
+    assert path.is_file()
+
+    cache = TrackCache(path, remote_wrangler=remote_wrangler)
+    assert len(cache) == 1
+    assert cache.get(track.path)["_title"] == track.title
+
+    # values are only returned for the same remote source
+    assert TrackCache(path).get(track.path) is None
+
+    cache.remove(track.path)
+    cache.save()
+    assert len(TrackCache(path, remote_wrangler=remote_wrangler)) == 0
+
+
+def test_stored_as_json(track: LocalTrack, remote_wrangler: RemoteDataWrangler, tmp_path: Path):
+    path = tmp_path.joinpath("cache.db")
+    with TrackCache(path, remote_wrangler=remote_wrangler) as cache:
+        cache.set(track.path, extract_track_values(track.path, remote_wrangler=remote_wrangler))
+
+    connection = sqlite3.connect(path)
+    try:
+        (data,), = connection.execute(f"SELECT data FROM {TrackCache.table_name}")
+        assert json.loads(data)["_title"] == track.title
+
+        # ignores values which cannot be decoded e.g. from a previous version of the cache
+        with connection:
+            connection.execute(f"UPDATE {TrackCache.table_name} SET data = ?", (b"\x80\x05invalid",))
+    finally:
+        connection.close()
+
+    cache = TrackCache(path, remote_wrangler=remote_wrangler)
+    assert len(cache) == 1
+    assert cache.get(track.path) is None
+
+
+def test_save_prunes_entries(track: LocalTrack, remote_wrangler: RemoteDataWrangler, tmp_path: Path):
+    path = tmp_path.joinpath("cache.db")
+    values = extract_track_values(track.path, remote_wrangler=remote_wrangler)
+    path_other = tmp_path.joinpath(f"other{track.ext}")
+    shutil.copyfile(track.path, path_other)
+
+    cache = TrackCache(path, remote_wrangler=remote_wrangler)
+    cache.set(track.path, values)
+    cache.set(path_other, values)
+    cache.save()
+    assert len(TrackCache(path, remote_wrangler=remote_wrangler)) == 2
+
+    # removes entries for files which no longer exist
+    path_other.unlink()
+    cache.save()
+    assert len(cache) == 1
+    assert len(TrackCache(path, remote_wrangler=remote_wrangler)) == 1
+
+    # removes entries for files which are not in the given paths
+    cache.save(paths=[])
+    assert len(cache) == 0
+    assert len(TrackCache(path, remote_wrangler=remote_wrangler)) == 0
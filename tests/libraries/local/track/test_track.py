@@ -12,7 +12,9 @@ from musify.file.exception import InvalidFileType, FileDoesNotExistError
 from musify.file.image import open_image
 from musify.libraries.core.object import Track
 from musify.libraries.local.track import LocalTrack, load_track, FLAC, M4A, MP3, WMA, SyncResultTrack
+from musify.libraries.local.track import extract_track_values, build_track_from_values, PaddingPolicy
 from musify.libraries.local.track.field import LocalTrackField
+from musify.libraries.local.track.track import TrackStreamInfo
 from musify.libraries.remote.core.types import RemoteObjectType
 from tests.libraries.core.object import TrackTester
 from tests.libraries.local.utils import path_track_all, path_track_img, path_track_resources
@@ -25,6 +27,16 @@ except ImportError:
     Image = None
 
 
+def test_padding_policy():
+    policy = PaddingPolicy(reserve=1000, reserve_ratio=0.1, max_padding=5000)
+    assert policy(mutagen.PaddingInfo(padding=200, size=10000)) == 200  # tags fit, keep current padding
+    assert policy(mutagen.PaddingInfo(padding=-10, size=10000)) == 2000  # tags do not fit, reserve new padding
+    assert policy(mutagen.PaddingInfo(padding=6000, size=10000)) == 2000  # too much padding, reserve new padding
+
+    # always keeps the current padding when the tags fit and no max is given
+    assert PaddingPolicy()(mutagen.PaddingInfo(padding=10 ** 7, size=10000)) == 10 ** 7
+
+
 async def test_load_fails():
     # raises error on unrecognised file type
     with pytest.raises(InvalidFileType):
@@ -197,7 +209,7 @@ def test_loaded_attributes_common(track: LocalTrack):
     assert track.last_played is None
     assert track.play_count is None
 
-    assert not track._reader.read_images()  # images are always cleared to save memory
+    assert not track._reader.read_images(track._file)  # images are always cleared to save memory
 
 
 class TestLocalTrack(TrackTester):
@@ -263,7 +275,7 @@ class TestLocalTrack(TrackTester):
 
     async def test_load_track_class(self, track: LocalTrack):
         # has actually reloaded the file
-        assert id(track._reader.file) != id(await track.load())
+        assert id(track._file) != id(await track.load())
 
         # raises error on unrecognised file type
         with pytest.raises(InvalidFileType):
@@ -273,23 +285,113 @@ class TestLocalTrack(TrackTester):
         with pytest.raises(FileDoesNotExistError):
             await track.__class__(file=f"does_not_exist.{set(track.valid_extensions).pop()}")
 
+    async def test_shared_tag_processors(self, track: LocalTrack):
+        remote_wrangler = track._reader.remote_wrangler
+        track_other = await load_track(track.path, remote_wrangler=remote_wrangler)
+        assert track_other._file is not track._file
+        assert track_other._reader is track._reader
+        assert track_other._writer is track._writer
+
+        # processors are not shared between tracks which use a different remote wrangler
+        track_no_wrangler = await load_track(track.path)
+        assert track_no_wrangler._reader is not track._reader
+        assert track_no_wrangler._reader.remote_wrangler is None
+        assert track_no_wrangler.uri is None
+
+    async def test_build_track_from_values(self, track: LocalTrack):
+        remote_wrangler = track._reader.remote_wrangler
+        values = extract_track_values(track.path, remote_wrangler=remote_wrangler)
+        track_built = build_track_from_values(track.path, values=values, remote_wrangler=remote_wrangler)
+
+        assert track_built.__class__ == track.__class__
+        assert track_built == track
+        assert track_built._file is None  # file is only loaded when needed
+
+        assert track_built.title == track.title
+        assert track_built.artist == track.artist
+        assert track_built.date == track.date
+        assert track_built.comments == track.comments
+        assert track_built.uri == track.uri
+        assert track_built.has_uri == track.has_uri
+        assert track_built.has_image == track.has_image
+        assert track_built.length == track.length
+        assert track_built.bit_rate == track.bit_rate
+        assert track_built.sample_rate == track.sample_rate
+
+        # file is not loaded when saving a track with no changes
+        result = await track_built.save(dry_run=True)
+        assert not result.saved
+        assert track_built._file is None
+
+        # file is loaded when saving a track with changes
+        track_built.title = "new title"
+        result = await track_built.save(tags=LocalTrackField.TITLE, replace=True, dry_run=True)
+        assert not result.saved
+        assert track_built._file is not None
+
+    async def test_detached(self, track: LocalTrack, tmp_path: Path):
+        remote_wrangler = track._reader.remote_wrangler
+        track_detached = await load_track(track.path, remote_wrangler=remote_wrangler, detached=True)
+
+        assert track_detached.detached
+        assert track_detached._file is None
+        assert isinstance(track_detached._info, TrackStreamInfo)
+
+        assert track_detached.title == track.title
+        assert track_detached.length == track.length
+        assert track_detached.channels == track.channels
+        assert track_detached.bit_rate == track.bit_rate
+        assert track_detached.bit_depth == track.bit_depth
+        assert track_detached.sample_rate == track.sample_rate
+
+        # file is loaded when needed and released again after
+        track_detached.title = "new title"
+        result = await track_detached.save(tags=LocalTrackField.TITLE, replace=True, dry_run=False)
+        assert result.saved
+        assert track_detached._file is None
+        assert (await load_track(track.path)).title == "new title"
+
+        await track_detached.delete_tags(tags=LocalTrackField.TITLE, dry_run=True)
+        assert track_detached._file is None
+
+        assert (track_detached.extract_images_to_file(tmp_path) > 0) == track.has_image
+        assert track_detached._file is None
+
+        assert copy(track_detached).detached
+        assert deepcopy(track_detached)._file is None
+
+    async def test_load_untagged_file(self, track: LocalTrack):
+        file = mutagen.File(track.path)
+        file.delete()
+
+        track_untagged = await load_track(track.path)
+        assert not track_untagged._file  # mutagen files with no tags are falsy
+        assert track_untagged._info is not None
+
+        assert track_untagged.title is None
+        assert track_untagged.length == track.length
+        assert track_untagged.channels == track.channels
+        assert track_untagged.bit_rate == track.bit_rate
+        assert track_untagged.sample_rate == track.sample_rate
+        assert copy(track_untagged).length == track.length
+
     async def test_copy_track(self, track: LocalTrack):
-        track_from_file = track.__class__(file=track._reader.file)
-        assert id(track._reader.file) == id(track_from_file._reader.file)
+        track_from_file = track.__class__(file=track._file)
+        assert id(track._file) == id(track_from_file._file)
 
         keys = [key for key in track.__slots__ if key.lstrip("_") in dir(track)]
 
         track.title = "fake title 1"
         track_copy = copy(track)
-        assert id(track._reader.file) == id(track_copy._reader.file)
-        assert id(track._writer.file) == id(track_copy._writer.file)
+        assert id(track._file) == id(track_copy._file)
+        assert track._reader is track_copy._reader
         assert track_copy.title != track.title
         for key in keys:
             assert getattr(track, key) == getattr(track_copy, key)
 
         track_deepcopy = deepcopy(track)
-        assert id(track._reader.file) != id(track_deepcopy._reader.file)
-        assert id(track._writer.file) != id(track_deepcopy._writer.file)
+        assert id(track._file) != id(track_deepcopy._file)
+        assert track._writer is track_deepcopy._writer
         assert track_deepcopy.title != track.title
 
     def test_set_and_find_file_paths(self, track: LocalTrack, tmp_path: Path):
@@ -347,8 +449,7 @@ class TestLocalTrack(TrackTester):
         await track.move(new_path)
 
         assert track.path == new_path
-        assert track._reader.file.filename == str(new_path)
-        assert track._writer.file.filename == str(new_path)
+        assert track._file.filename == str(new_path)
 
         assert not old_path.is_file()
         assert new_path.is_file()
@@ -368,8 +469,7 @@ class TestLocalTrack(TrackTester):
 
         assert track.path != new_path
         assert track.path == expected
-        assert track._reader.file.filename == str(expected)
-        assert track._writer.file.filename == str(expected)
+        assert track._file.filename == str(expected)
 
         assert not old_path.is_file()
         assert not new_path.is_file()
@@ -417,7 +517,7 @@ class TestLocalTrack(TrackTester):
     def test_extract_images(self, track: LocalTrack, tmp_path: Path):
         # all tracks have an embedded image
         # images should be removed in refresh step, they should then be reloaded during extraction call
-        assert not track._reader.read_images()
+        assert not track._reader.read_images(track._file)
         assert track.has_image
 
         def _get_paths():
@@ -429,7 +529,7 @@ class TestLocalTrack(TrackTester):
         assert len(_get_paths()) == count > 0
 
         # deletes loaded images again after running
-        assert not track._reader.read_images()
+        assert not track._reader.read_images(track._file)
 
 
 class TestLocalTrackWriter:
@@ -660,6 +760,60 @@ class TestLocalTrackWriter:
         assert result.saved
         assert set(result.updated) == tags_to_update
 
+    async def test_update_tags_from_snapshot(self, track: LocalTrack):
+        # saving a track with no modified tags is skipped without loading the file
+        track._release_file()
+        result = await track.save(tags=LocalTrackField.ALL, replace=True, dry_run=False)
+        assert not result.saved
+        assert not result.updated
+        assert track._file is None
+
+        track.title = "new title"
+        result = await track.save(tags=LocalTrackField.ALL, replace=True, dry_run=False)
+        assert result.saved
+        assert set(result.updated) == {LocalTrackField.TITLE}
+        assert not track._get_modified_keys()
+
+        # snapshot does not reflect changes made to the file elsewhere, verify reloads the file to compare against
+        track_other = await load_track(track.path, remote_wrangler=track._reader.remote_wrangler)
+        track_other.album = "new album"
+        await track_other.save(tags=LocalTrackField.ALBUM, replace=True, dry_run=False)
+
+        result = await track.save(tags=LocalTrackField.ALL, replace=True, dry_run=True)
+        assert not result.updated
+        result = await track.save(tags=LocalTrackField.ALL, replace=True, dry_run=True, verify=True)
+        assert set(result.updated) == {LocalTrackField.ALBUM}
+
+    async def test_update_tags_in_place(self, track: LocalTrack):
+        size = track.path.stat().st_size
+        track.title = "new title" * 2000  # larger than the padding in most files
+
+        result = await track.save(tags=LocalTrackField.TITLE, replace=True, dry_run=False)
+        assert result.saved
+        assert result.rewritten == (track.path.stat().st_size != size)
+
+        # padding is reserved when the file is rewritten so small changes after can be written in place
+        size = track.path.stat().st_size
+        track.title = "another new title" * 1000
+        result = await track.save(tags=LocalTrackField.TITLE, replace=True, dry_run=False)
+        assert result.saved
+        assert not result.rewritten
+        assert track.path.stat().st_size == size
+
+    async def test_update_uri_in_place_mp3(self, track_mp3: MP3):
+        # force a rewrite so that the padding policy reserves more padding than mutagen would keep by default
+        track_mp3.title = "new title" * 2000
+        assert (await track_mp3.save(tags=LocalTrackField.TITLE, replace=True, dry_run=False)).rewritten
+
+        # URIs are written as comments for MP3 which are cleared before writing
+        size = track_mp3.path.stat().st_size
+        for _ in range(2):
+            track_mp3.uri = random_uri(kind=RemoteObjectType.TRACK)
+            result = await track_mp3.save(tags=LocalTrackField.URI, replace=True, dry_run=False)
+            assert result.saved
+            assert not result.rewritten
+            assert track_mp3.path.stat().st_size == size
+
     ###########################################################################
     ## Update images
     ###########################################################################
@@ -670,8 +824,7 @@ class TestLocalTrackWriter:
         track_copy = copy(track)
 
         # assign back to ensure tests can load the original image to compare against
-        track._reader.file = mutagen.File(track.path)
-        track._writer.file = track._reader.file
+        track._file = track_copy._file = mutagen.File(track.path)
 
         return track, track_copy
 
@@ -681,8 +834,8 @@ class TestLocalTrackWriter:
         assert result.saved
         assert deepcopy(track).has_image
 
-        track._reader.file = mutagen.File(track.path)
-        images = track._reader.read_images()
+        track._file = mutagen.File(track.path)
+        images = track._reader.read_images(track._file)
 
         if not isinstance(track, MP3):
             # MP3 tagging works slightly differently so more than one image will be saved
@@ -692,7 +845,7 @@ class TestLocalTrackWriter:
     async def test_update_image_dry_run(self, track: LocalTrack):
         track_original, track_update = self.get_update_image_test_track(track)
 
-        image_original = track_original._reader.read_images()[0]
+        image_original = track_original._reader.read_images(track_original._file)[0]
 
         # dry run, no updates should happen
         result = await track_update.save(tags=LocalTrackField.IMAGES, replace=False, dry_run=True)
@@ -701,8 +854,8 @@ class TestLocalTrackWriter:
         track_on_disk = deepcopy(track_update)
         assert track_on_disk.has_image == track_original.has_image
 
-        track_update._reader.file = mutagen.File(track_update.path)
-        images = track_update._reader.read_images()
+        track_update._file = mutagen.File(track_update.path)
+        images = track_update._reader.read_images(track_update._file)
         assert len(images) == 1
         assert images[0].size == image_original.size
 
@@ -1,16 +1,17 @@
 from abc import ABCMeta
 from collections.abc import Iterable, Collection
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from random import randrange, sample
 
 import pytest
 
-from musify.exception import MusifyKeyError
+from musify.exception import MusifyKeyError, MusifyTypeError
 from musify.libraries.local.collection import LocalCollection
 from musify.libraries.local.track import LocalTrack
 from musify.libraries.local.track.field import LocalTrackField
 from musify.libraries.remote.spotify.object import SpotifyTrack
 from tests.libraries.core.collection import MusifyCollectionTester
-from tests.libraries.local.track.utils import random_tracks
+from tests.libraries.local.track.utils import random_track, random_tracks
 from tests.libraries.remote.spotify.api.mock import SpotifyMock
 
 
@@ -74,10 +75,82 @@ class LocalCollectionTester(MusifyCollectionTester, metaclass=ABCMeta):
         assert all(not result.saved for result in results.values())
         assert all(LocalTrackField.TITLE in result.updated for result in results.values())
 
+    async def test_save_tracks_concurrently(self, collection: LocalCollection):
+        self.remove_fake_tracks(collection)
+
+        for track in collection[:-2]:
+            track.title = "brand new title"
+            track.track_number = 22
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = await collection.save_tracks(replace=True, dry_run=True, executor=executor, max_in_flight=2)
+
+        assert len(results) == len(collection[:-2])
+        assert set(results) == set(collection[:-2])
+        assert all(not result.saved for result in results.values())
+        assert all(LocalTrackField.TITLE in result.updated for result in results.values())
+
+        # creates a thread pool when only given the max number of tracks to save concurrently
+        results_pool = await collection.save_tracks(replace=True, dry_run=True, max_in_flight=4)
+        assert results_pool == results
+
+    @staticmethod
+    async def test_save_tracks_with_process_pool_fails(collection: LocalCollection):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            with pytest.raises(MusifyTypeError):
+                await collection.save_tracks(dry_run=True, executor=executor)
+
+    @staticmethod
+    def test_collection_membership_after_values_change(
+            collection: LocalCollection, collection_merge_invalid: Collection[SpotifyTrack]
+    ):
+        remote_track = next(iter(collection_merge_invalid))
+        track = random_track(cls=collection[0].__class__)  # avoid changing tracks shared with other tests
+        collection.items.append(track)
+        assert remote_track not in collection
+        assert not collection.intersection([remote_track])
+        assert collection.outer_difference([remote_track]) == [remote_track]
+
+        # e.g. a URI assigned to the track by a searcher
+        track.uri = remote_track.uri
+        assert remote_track in collection
+        assert collection.intersection([remote_track]) == [track]
+        assert not collection.outer_difference([remote_track])
+
+    @staticmethod
+    def test_collection_getitem_after_values_change(
+            collection: LocalCollection, collection_merge_invalid: Collection[SpotifyTrack]
+    ):
+        remote_track = next(iter(collection_merge_invalid))
+        track = random_track(cls=collection[0].__class__)  # avoid changing tracks shared with other tests
+        collection.items.append(track)
+        with pytest.raises(MusifyKeyError):
+            assert collection[remote_track.uri]
+
+        # e.g. a URI assigned to the track by a searcher
+        track.uri = remote_track.uri
+        assert collection[remote_track.uri] is track
+
     @staticmethod
     def test_merge_tracks(collection: LocalCollection, collection_merge_items: Collection[SpotifyTrack]):
         length = len(collection.items)
         assert all(item not in collection.items for item in collection_merge_items)
 
-        collection.merge_tracks(collection_merge_items)
+        result = collection.merge_tracks(collection_merge_items)
         assert len(collection.items) == length
+        assert result.merged == 0
+        assert result.not_found == len(collection_merge_items)
+
+        # merges tags onto the matching tracks in the collection
+        tracks = random_tracks(2)
+        for track, track_in_collection in zip(tracks, collection.items[:2]):
+            track._path = track_in_collection.path
+            track.title = "merged title"
+            track.genres = ["merged genre"]
+
+        result = collection.merge_tracks([*tracks, *collection_merge_items], tags=LocalTrackField.TITLE)
+        assert result.merged == len(tracks)
+        assert result.not_found == len(collection_merge_items)
+        assert all(track.title == "merged title" for track in collection.items[:2])
+        assert all(track.genres != ["merged genre"] for track in collection.items[:2])
+        assert collection["merged title"] == collection.items[0]
@@ -11,6 +11,7 @@ from musify.base import MusifyItem
 from musify.libraries.core.object import Playlist
 from musify.libraries.remote.core.library import RemoteLibrary
 from musify.libraries.remote.core.object import RemoteTrack
+from musify.libraries.remote.core.types import RemoteObjectType
 from tests.libraries.core.object import LibraryTester
 from tests.libraries.local.track.utils import random_tracks
 from tests.libraries.remote.core.object import RemoteCollectionTester
@@ -121,6 +122,47 @@ class RemoteLibraryTester(RemoteCollectionTester, LibraryTester, metaclass=ABCMe
         assert len(library) == len(library_tracks_start) + len(local_tracks)
         api_mock.assert_called()  # new requests were made
 
+    @staticmethod
+    async def test_collection_membership(library: RemoteLibrary, collection_merge_items: list[RemoteTrack]):
+        # overridden as extend is asynchronous for remote libraries
+        assert all(item in library for item in library.items)
+        assert all(item not in library for item in collection_merge_items)
+
+        length = len(library)
+        items = library.items[:2] + collection_merge_items + collection_merge_items
+        await library.extend(items, allow_duplicates=False)
+        assert len(library) == length + len(collection_merge_items)
+        assert library.items[length:] == collection_merge_items
+        assert all(item in library for item in collection_merge_items)
+
+        library.append(collection_merge_items[0], allow_duplicates=False)
+        library.insert(0, collection_merge_items[0], allow_duplicates=False)
+        assert len(library) == length + len(collection_merge_items)
+
+    @staticmethod
+    async def test_extend_after_tracks_changed(
+            library: RemoteLibrary, collection_merge_items: list[RemoteTrack], api_mock: RemoteMock
+    ):
+        # noinspection PyProtectedMember
+        library._get_uri_map(RemoteObjectType.TRACK)  # map the URIs of the currently loaded tracks
+        length = len(library)
+
+        # remove and append keeping the same length
+        removed = library.tracks.pop(0)
+        library.tracks.append(collection_merge_items[0])
+        await library.extend([removed, collection_merge_items[0]], allow_duplicates=False)
+        assert len(library) == length + 1
+        assert library.tracks[-1] is removed
+
+        # replace a track in-place
+        replaced = library.tracks[0]
+        library.tracks[0] = collection_merge_items[1]
+        await library.extend([replaced, collection_merge_items[1]], allow_duplicates=False)
+        assert len(library) == length + 2
+        assert library.tracks[-1] is replaced
+
+        api_mock.assert_not_called()  # no requests made
+
     @staticmethod
     def test_backup(library: RemoteLibrary):
         expected = {name: [track.uri for track in pl] for name, pl in library.playlists.items()}
@@ -62,7 +62,7 @@ class RemoteItemSearcherTester(PrettyPrinterTester, metaclass=ABCMeta):
 
             item.title = item.artist = item.album = None
             # noinspection PyProtectedMember
-            item._reader.file.info.length = -3000
+            item._file.info.length = -3000
             item.year = 1000
 
         return unmatchable_items
@@ -77,6 +77,23 @@ class TestSpotifyArtist(SpotifyCollectionLoaderTester):
         )
         return artist | {"albums": items_block}
 
+    @staticmethod
+    def test_collection_membership(collection: SpotifyArtist, collection_merge_items: Iterable[SpotifyAlbum]):
+        # single albums with tracks are validated as an iterable of tracks by the artist,
+        # so only test many albums can be added without duplicates
+        merge_items = list(collection_merge_items)
+        assert all(item in collection for item in collection.items)
+        assert all(item not in collection for item in merge_items)
+
+        length = len(collection)
+        collection.extend(collection.items[:2] + merge_items + merge_items, allow_duplicates=False)
+        assert len(collection) == length + len(merge_items)
+        assert collection.items[length:] == merge_items
+        assert all(item in collection for item in merge_items)
+
+        collection.extend(merge_items[:1], allow_duplicates=False)
+        assert len(collection) == length + len(merge_items)
+
     async def test_input_validation(self, response_random: dict[str, Any], api_mock: SpotifyMock):
         with pytest.raises(RemoteObjectTypeError):
             SpotifyArtist(api_mock.generate_track(artists=False, album=False))
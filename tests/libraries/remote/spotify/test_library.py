@@ -61,9 +61,11 @@ class TestSpotifyLibrary(RemoteLibraryTester):
         await library_unloaded.load_tracks()
         assert len(library_unloaded.tracks) == len(api_mock.user_tracks)
 
-        # does not add duplicates to the loaded list
+        # does not add duplicates to the loaded list and updates loaded tracks in-place
+        track = library_unloaded.tracks[0]
         await library_unloaded.load_tracks()
         assert len(library_unloaded.tracks) == len(api_mock.user_tracks)
+        assert library_unloaded.tracks[0] is track
 
     async def test_load_saved_albums(self, library_unloaded: SpotifyLibrary, api_mock: SpotifyMock):
         await library_unloaded.load_saved_albums()
@@ -297,13 +297,12 @@ class TestSpotifyItemSearcher(RemoteItemSearcherTester):
         for remote_track in map(SpotifyTrack, sample(api_mock.tracks, k=limit)):
             local_track = random_track()
             local_track.uri = None
-            local_track._reader.remote_wrangler = wrangler
-            local_track._writer.remote_wrangler = wrangler
+            local_track._reader, local_track._writer = local_track._get_tag_processors(wrangler)
 
             local_track.title = remote_track.title
             local_track.album = remote_track.album
             local_track.artist = remote_track.artist
-            local_track._reader.file.info.length = remote_track.length
+            local_track._file.info.length = remote_track.length
             local_track.year = remote_track.year
 
             items.append(local_track)
@@ -330,15 +329,14 @@ class TestSpotifyItemSearcher(RemoteItemSearcherTester):
             for remote_track in album:
                 local_track = random_track()
                 local_track.uri = None
-                local_track._reader.remote_wrangler = wrangler
-                local_track._writer.remote_wrangler = wrangler
+                local_track._reader, local_track._writer = local_track._get_tag_processors(wrangler)
                 local_track.compilation = False
 
                 local_track.title = remote_track.title
                 local_track.album = album.name
                 local_track.artist = remote_track.artist
                 local_track.year = remote_track.year
-                local_track._reader.file.info.length = remote_track.length
+                local_track._file.info.length = remote_track.length
 
                 tracks.append(local_track)
 
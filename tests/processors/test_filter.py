@@ -56,6 +56,29 @@ class TestFilterDefinedList(FilterTester):
         filter_ = FilterDefinedList(values=values)
         assert filter_(values[:10]) == values[:10]
 
+    def test_filter_ordered_and_transformed(self):
+        values = [random_str(30, 50).lower() for _ in range(20)]
+        values_upper = [value.upper() for value in values]
+        values_shuffled = values_upper.copy()
+        shuffle(values_shuffled)
+
+        # returns matches in the order of the values in the filter
+        filter_ = FilterDefinedList(values=values[:10])
+        filter_.transform = lambda x: x.lower()
+        assert filter_(values_shuffled) == values_upper[:10]
+
+        # looks up the given map of transformed values instead of transforming each value
+        transformed = {value.lower(): value for value in values_shuffled}
+        assert filter_(values_shuffled, transformed=transformed) == values_upper[:10]
+
+        # only returns mapped values which are in the given values
+        assert filter_(values_shuffled[:5], transformed=transformed) == filter_(values_shuffled[:5])
+
+        filter_.values = set(values[:10])
+        assert filter_(values_shuffled) == [value for value in values_shuffled if value in values_upper[:10]]
+        assert filter_(values_shuffled, transformed=transformed) == filter_(values_shuffled)
+        assert filter_(values_shuffled[:5], transformed=transformed) == filter_(values_shuffled[:5])
+
 
 class TestFilterComparers(FilterTester):
 
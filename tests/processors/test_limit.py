@@ -26,7 +26,7 @@ class TestItemLimiter(PrettyPrinterTester):
                 track._path = random_file_path
 
                 track.album = f"album {i}"
-                track._reader.file.info.length = i * 60
+                track._file.info.length = i * 60
                 track.rating = i
 
                 if i != 1 and i != 5:
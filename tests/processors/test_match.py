@@ -1,12 +1,23 @@
+import logging
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 
 from musify.field import TagFields as Tag
 from musify.libraries.local.track import LocalTrack
 from musify.processors.match import ItemMatcher, CleanTagConfig
+from tests.conftest import LogCapturer
 from tests.libraries.local.track.utils import random_track
 from tests.testers import PrettyPrinterTester
 
 
+class ItemMatcherAnyName(ItemMatcher):
+    """An :py:class:`ItemMatcher` which scores all names as an exact match"""
+
+    def match_name(self, source, result) -> float:
+        return 1.0
+
+
 class TestItemMatcher(PrettyPrinterTester):
 
     @pytest.fixture
@@ -55,6 +66,39 @@ class TestItemMatcher(PrettyPrinterTester):
         assert track1.clean_tags[Tag.ARTIST] == "artist 1 artist two"
         assert track1.clean_tags[Tag.ALBUM] == "best"
 
+    def test_clean_tags_pipelines(self, matcher: ItemMatcher, track1: LocalTrack, monkeypatch):
+        pipelines = matcher._get_clean_tags_pipelines()
+        assert matcher._get_clean_tags_pipelines() is pipelines
+        pipeline = next(pipeline for tag, _, pipeline in pipelines if tag == Tag.TITLE)
+
+        track1.title = "The Title of a Song"
+        matcher.clean_tags(track1)
+        matcher.clean_tags(track1)
+        assert track1.clean_tags[Tag.TITLE] == "title of song"
+        assert pipeline.cache_info().hits >= 1
+
+        # pipelines are compiled again when settings are replaced
+        monkeypatch.setattr(ItemMatcher, "clean_tags_remove_all", {"of"})
+        assert matcher._get_clean_tags_pipelines() is not pipelines
+        matcher.clean_tags(track1)
+        assert track1.clean_tags[Tag.TITLE] == "the title a song"
+
+    def test_log_test(
+            self, matcher: ItemMatcher, track1: LocalTrack, track2: LocalTrack, log_capturer: LogCapturer
+    ):
+        track1.clean_tags[Tag.YEAR] = 2020
+        track2.clean_tags[Tag.YEAR] = 2015
+
+        with log_capturer(level=logging.INFO, loggers=matcher.logger):
+            assert matcher.match_year(track1, track2) == 0.5
+        assert not log_capturer.messages
+
+        with log_capturer(level=logging.DEBUG, loggers=matcher.logger):
+            assert matcher.match_year(track1, track2) == 0.5
+        assert len(log_capturer.messages) == 1
+        assert "YEAR      =0.5" in log_capturer.messages[0]
+        assert "2020 -> 2015" in log_capturer.messages[0]
+
     def test_match_not_karaoke(self, matcher: ItemMatcher, track1: LocalTrack):
         track1.title = "title"
         track1.artist = "artist"
@@ -169,8 +213,8 @@ class TestItemMatcher(PrettyPrinterTester):
         track2.artist = "nope"
         track1.album = "album"
         track2.album = "name"
-        track1._reader.file.info.length = 100
-        track2._reader.file.info.length = 10
+        track1._file.info.length = 100
+        track2._file.info.length = 10
         track1.year = 2020
         track2.year = 2010
 
@@ -191,11 +235,16 @@ class TestItemMatcher(PrettyPrinterTester):
         track4.title = "a longer title"
         track4.artist = f"band{sep}a singer{sep}artist"
         track4.album = "album"
-        track4._reader.file.info.length = 100
+        track4._file.info.length = 100
         track4.year = 2015
         assert matcher.match(track1, [track4, track2, track3], min_score=0.2, max_score=0.8) == track4
         assert matcher(track1, [track2, track4, track3], min_score=0.2, max_score=0.8) == track4
 
+        # results after the early stop are never cleaned or scored
+        track5 = random_track()
+        assert matcher.match(track1, [track4, track5], min_score=0.2, max_score=0.8) == track4
+        assert not track5.clean_tags
+
     def test_allows_karaoke(self, matcher: ItemMatcher, track1: LocalTrack, track2: LocalTrack):
         sep = track1.tag_sep
         track3 = random_track()
@@ -212,9 +261,9 @@ class TestItemMatcher(PrettyPrinterTester):
         track2.album = "name"
         track3.album = "valid album"
 
-        track1._reader.file.info.length = 100
-        track2._reader.file.info.length = 10
-        track3._reader.file.info.length = 100
+        track1._file.info.length = 100
+        track2._file.info.length = 10
+        track3._file.info.length = 100
 
         track1.year = 2020
         track2.year = 2010
@@ -229,3 +278,99 @@ class TestItemMatcher(PrettyPrinterTester):
 
         # ...and now karaoke is allowed
         assert matcher(track1, [track2, track3], min_score=0.5, max_score=1, allow_karaoke=True) == track3
+
+    def test_match_bulk(self, matcher: ItemMatcher):
+        sep = random_track().tag_sep
+        sources = [random_track() for _ in range(3)]
+        results = [random_track() for _ in range(3)]
+
+        for i, (source, result) in enumerate(zip(sources, results)):
+            source.title = f"a {i} title"
+            source.artist = f"band {i}{sep}singer"
+            result.title = f"title {i}"
+            result.artist = f"band {i}"
+            source._file.info.length = 100 * (i + 1)
+            result._file.info.length = 100 * (i + 1) + 5
+
+        # shares no words with any result, so is only scored against results with a similar length
+        source = random_track()
+        source.title = None
+        source.artist = None
+        source._file.info.length = results[1].length + 2
+        sources.append(source)
+
+        matches = matcher.match_bulk(sources, results, min_score=0.1, max_score=0.8)
+        assert [item for item, _ in matches] == sources
+        assert [result for _, result in matches] == [*results, results[1]]
+
+        for item, result in matches[:3]:
+            assert matcher.match(item, results, min_score=0.1, max_score=0.8) == result
+
+        # no results share a block with the source
+        source.title = "unique"
+        matcher.clean_tags(source)
+        assert matcher.match_bulk([source], results) == [(source, None)]
+
+    def test_match_bulk_on_unblocked_fields(self, matcher: ItemMatcher):
+        sources = [random_track() for _ in range(3)]
+        results = [random_track() for _ in range(3)]
+
+        for i, (source, result) in enumerate(zip(sources, results)):
+            source.album = f"album {i}"
+            source.year = 2000 + 20 * i
+            result.album = f"album {i}"
+            result.year = 2000 + 20 * i
+
+        # sources with no name, artist, or length cannot be blocked
+        sources[0].title = None
+        sources[0].artist = None
+        sources[0]._file.info.length = None
+
+        for match_on in ({Tag.ALBUM, Tag.YEAR}, {Tag.TITLE, Tag.ALBUM, Tag.YEAR}):
+            if Tag.TITLE in match_on:
+                sources = sources[:1]
+            expected = [matcher.match(source, results, match_on=match_on) for source in sources]
+            assert expected == results[:len(sources)]
+
+            matches = matcher.match_bulk(sources, results, match_on=match_on)
+            assert [result for _, result in matches] == expected
+
+    async def test_match_batch(self, matcher: ItemMatcher):
+        pairs = []
+        for i in range(10):
+            source = random_track()
+            results = [random_track() for _ in range(5)]
+            results[i % 5].title = source.title
+            results[i % 5].artist = source.artist
+            results[i % 5].album = source.album
+            pairs.append((source, results))
+        pairs.append((random_track(), []))
+
+        expected = [matcher.match(source, results, min_score=0.2, max_score=0.8) for source, results in pairs]
+        assert expected[-1] is None
+        assert all(result is not None for result in expected[:-1])
+
+        assert await matcher.match_batch(pairs, min_score=0.2, max_score=0.8) == expected
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            matches = await matcher.match_batch(pairs, min_score=0.2, max_score=0.8, executor=executor, chunk_size=3)
+
+        # matches are the original result objects and not the cleaned copies scored in the executor
+        assert all(match is result for match, result in zip(matches, expected))
+
+    async def test_match_batch_on_subclass(self, matcher: ItemMatcher):
+        pairs = []
+        for i in range(5):
+            source = random_track()
+            results = [random_track() for _ in range(5)]
+            results[i].title = source.title
+            pairs.append((source, results))
+
+        # subclass scores all names the same so the first result is always matched
+        matcher_subclass = ItemMatcherAnyName()
+        expected = [matcher_subclass.match(source, results, match_on=[Tag.TITLE]) for source, results in pairs]
+        assert expected == [results[0] for _, results in pairs]
+        assert expected != [matcher.match(source, results, match_on=[Tag.TITLE]) for source, results in pairs]
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            matches = await matcher_subclass.match_batch(pairs, match_on=[Tag.TITLE], executor=executor, chunk_size=2)
+        assert all(match is result for match, result in zip(matches, expected))
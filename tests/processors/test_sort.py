@@ -77,6 +77,22 @@ class TestItemSorter(PrettyPrinterTester):
         assert sorted(groups) == sorted({track.key for track in tracks})
         assert sum(map(len, groups.values())) == len(tracks)
 
+    def test_group_by_fields(self, tracks: list[LocalTrack]):
+        assert ItemSorter.group_by_fields(tracks) == {}
+        assert ItemSorter.group_by_fields(tracks, None) == {None: {None: tracks}}
+
+        fields = [TrackField.ALBUM, TrackField.KEY, TrackField.GENRES]
+        grouped = ItemSorter.group_by_fields(tracks, fields=fields)
+        assert list(grouped) == fields
+        assert grouped[TrackField.ALBUM] == ItemSorter.group_by_field(tracks, TrackField.ALBUM)
+        assert grouped[TrackField.KEY] == ItemSorter.group_by_field(tracks, TrackField.KEY)
+
+        # items are grouped under each value of multi-valued fields
+        genres = grouped[TrackField.GENRES]
+        assert sorted(genres, key=str) == sorted({genre for track in tracks for genre in track.genres or ()}, key=str)
+        for genre, group in genres.items():
+            assert group == [track for track in tracks if track.genres and genre in track.genres]
+
     def test_shuffle_random(self, tracks: list[LocalTrack]):
 
         tracks_original = tracks.copy()
@@ -185,3 +201,16 @@ class TestItemSorter(PrettyPrinterTester):
         sorter = ItemSorter(fields=fields)
         sorter(tracks)
         assert tracks == tracks_sorted
+
+    def test_multi_sort_groups_on_values(self):
+        tracks = random_tracks(20)
+        for i, track in enumerate(tracks):
+            track.album = "album" if i % 2 else "ALBUM"
+            track.track_number = randrange(1, 50)
+
+        # values with equal sort keys are grouped by value in order of first appearance before sorting on next field
+        tracks_sorted = sorted(tracks[::2], key=lambda t: t.track_number, reverse=True)
+        tracks_sorted += sorted(tracks[1::2], key=lambda t: t.track_number, reverse=True)
+
+        ItemSorter(fields={TrackField.ALBUM: False, TrackField.TRACK: True})(tracks)
+        assert tracks == tracks_sorted
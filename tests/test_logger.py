@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import sys
 from copy import copy, deepcopy
@@ -174,6 +175,27 @@ async def test_tqdm_iterator_asynchronous(logger: MusifyLogger):
     assert sorted(results) == [i for i in range(len(tasks))]
 
 
+async def test_gather_with_progress(logger: MusifyLogger):
+    running = 0
+    max_running = 0
+
+    async def _task(i: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01 * (10 - i))
+        running -= 1
+        return i
+
+    results = await logger.gather_with_progress([_task(i) for i in range(10)], max_in_flight=3, disable=True)
+    assert results == [i for i in range(10)]  # preserves order
+    assert max_running == 3
+
+    results = await logger.gather_with_progress([_task(i) for i in range(10)], disable=True)
+    assert results == [i for i in range(10)]
+    assert max_running == 10
+
+
 def test_copy(logger: MusifyLogger):
     assert id(copy(logger)) == id(logger)
     assert id(deepcopy(logger)) == id(logger)
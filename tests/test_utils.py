@@ -6,6 +6,7 @@ from musify.exception import MusifyTypeError
 from musify.utils import flatten_nested, merge_maps, get_most_common_values, unicode_len
 from musify.utils import limit_value, to_collection
 from musify.utils import strip_ignore_words, safe_format_map, get_max_width, align_string
+from musify.utils import casefold, get_sort_string, get_tag_string_cleaner
 
 
 ###########################################################################
@@ -145,6 +146,41 @@ def test_align_string_unicode_truncate_right():
     assert align_string(value_emoji_2, max_width=13, truncate_left=True) == "...🥾👢🎙️🐧🏗️"
 
 
+###########################################################################
+## String normalisation
+###########################################################################
+def test_casefold():
+    casefold.cache_clear()
+    assert casefold("I Am A STRING") == "i am a string"
+    assert casefold("I Am A STRING") == "i am a string"
+    assert casefold.cache_info().hits == 1
+
+
+def test_get_sort_string():
+    assert get_sort_string(None) == (False, "")
+    assert get_sort_string("") == (False, "")
+
+    assert get_sort_string("The Best String") == (True, "best string")
+    assert get_sort_string("*%I   am very special!", ["am", "i"]) == (False, "am very special!")
+    assert get_sort_string("*%I   am very special!", ("am", "i")) == (False, "am very special!")
+    assert get_sort_string("I am a string", None) == (True, "i am a string")
+
+
+def test_get_tag_string_cleaner():
+    assert get_tag_string_cleaner()("Title (Remastered) [Live]") == "title"
+    assert get_tag_string_cleaner()("Don't-Stop   Me, Now!") == "don't stop me now"
+
+    cleaner = get_tag_string_cleaner(remove=frozenset({"the", "a", "&"}), split=frozenset({"feat.", "/"}))
+    assert get_tag_string_cleaner(remove=frozenset({"the", "a", "&"}), split=frozenset({"feat.", "/"})) is cleaner
+
+    assert cleaner("The Artist & A Band") == "artist band"
+    assert cleaner("a a theme") == "theme"
+    assert cleaner("The") == "the"
+    assert cleaner("Song / Other feat. Singer") == "song"
+    assert cleaner("Song feat. Singer / Other") == "song"
+    assert cleaner("Song (with a.b.) [Live]") == "song"
+
+
 ###########################################################################
 ## Number
 ###########################################################################